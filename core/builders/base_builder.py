@@ -8,6 +8,7 @@ BaseBuilder -- Base builder object to build objects in DCC.
 from kraken.core import logger as pyLogger
 logger = pyLogger.getLogger("pyLogger")
 from kraken.core.configs.base_config import BaseConfig
+from kraken.core.builders.build_profiler import BuildProfiler
 
 from kraken.core.objects.components.base_component import BaseComponent
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
@@ -59,6 +60,21 @@ class BaseBuilder(object):
     def __init__(self, config=None):
         super(BaseBuilder, self).__init__()
         self._buildElements = []
+        self._buildOrder = []
+
+        # Built elements keyed by the id of the kraken item and by the dcc
+        # item so lookups don't scan the whole build. DCC items are keyed by
+        # value as DCCs return a new wrapper each time a node is queried.
+        self._dccSceneItems = {}
+        self._kSceneItems = {}
+
+        # Build names by the id of the kraken object, with the values they
+        # were built from, and the object each build name was given to.
+        self._buildNames = {}
+        self._namedObjects = {}
+
+        # Profiler of the last build, only set when the config enables it.
+        self.profiler = None
 
         if config is None:
             config = BaseConfig()
@@ -87,6 +103,11 @@ class BaseBuilder(object):
 
         self._buildElements.append(pairing)
 
+        # Keep the first pairing like the lookups did when they scanned the
+        # list of built elements.
+        self._dccSceneItems.setdefault(id(kSceneItem), pairing)
+        self._kSceneItems.setdefault(dccSceneItem, pairing)
+
         return True
 
 
@@ -101,11 +122,30 @@ class BaseBuilder(object):
 
         """
 
-        for builtElement in self._buildElements:
-            if builtElement['src'] == kSceneItem:
-                return builtElement['tgt']
+        pairing = self._dccSceneItems.get(id(kSceneItem))
+        if pairing is None:
+            return None
 
-        return None
+        return pairing['tgt']
+
+
+    def _getKrakenSceneItem(self, dccSceneItem):
+        """Given a dcc scene item, returns the kraken scene item it was built from.
+
+        Arguments:
+        dccSceneItem -- Object, dcc scene item to base the search, any object
+                        equal to the registered item is found.
+
+        Return:
+        Object, the Kraken Scene Item that corresponds to the given dcc scene item
+
+        """
+
+        pairing = self._kSceneItems.get(dccSceneItem)
+        if pairing is None:
+            return None
+
+        return pairing['src']
 
 
     # ========================
@@ -468,9 +508,9 @@ class BaseBuilder(object):
 
         """
 
-        for i in xrange(kObject.getNumAttributeGroups()):
-            attributeGroup = kObject.getAttributeGroupByIndex(i)
-
+        # Iterate the groups directly so a default group that was never
+        # created isn't created just to be skipped.
+        for attributeGroup in kObject.attributeGroups:
             attributeCount = attributeGroup.getNumAttributes()
             if attributeCount < 1:
                 continue
@@ -483,6 +523,11 @@ class BaseBuilder(object):
     def getBuildName(self, kObject):
         """Returns the build name for the object.
 
+        Names are cached per object until its name, component, location or
+        the naming template of the config changes. Templates edited in place
+        are picked up at the start of the next build. A warning is logged
+        when two objects of a build get the same name.
+
         Arguments:
         kObject -- Kraken Object, object to get the build name for.
 
@@ -491,49 +536,51 @@ class BaseBuilder(object):
 
         """
 
-        kType = kObject.getKType()
-        nameTemplate = self.config.getNameTemplate()
+        # Containers override getComponent to look up components by name.
+        if isinstance(kObject, BaseComponent):
+            component = kObject
+        else:
+            component = kObject.component
 
-        # Get the token list for this type of object
-        if kType in nameTemplate['formats'].keys():
-            format = nameTemplate['formats'][kType]
+        if component is None:
+            key = (self.config.getNameTemplateRevision(), kObject.getName(), 'EXPLICIT_NAME' in kObject.flags)
         else:
-            format = nameTemplate['formats']['default']
+            key = (self.config.getNameTemplateRevision(), kObject.getName(), 'EXPLICIT_NAME' in kObject.flags,
+                   component.getName(), component.getLocation())
 
-        # Generate a name by concatenating the resolved tokens together.
-        builtName = ""
-        if kObject.testFlag('EXPLICIT_NAME'):
-            builtName = kObject.getName()
+        cached = self._buildNames.get(id(kObject))
+        if cached is not None and cached[0] is kObject and cached[1] == key:
+            builtName = cached[2]
+        else:
+            builtName = self.config.getNameFormatter(kObject.getKType())(kObject)
+            self._buildNames[id(kObject)] = (kObject, key, builtName)
 
-        for token in format:
+        namedObject = self._namedObjects.setdefault(builtName, kObject)
+        if namedObject is not kObject:
+            logger.warning("Build name '" + builtName + "' of " + kObject.getFullName() +
+                           " is already used by " + namedObject.getFullName())
 
-            if token is 'sep':
-                builtName += nameTemplate['separator']
+        return builtName
 
-            elif token is 'location':
-                if isinstance(kObject, BaseComponent):
-                    location = kObject.getLocation()
-                else:
-                    location = kObject.getComponent().getLocation()
 
-                if location not in nameTemplate['locations']:
-                    raise ValueError("Invalid location on: " + kObject.getFullName())
+    def getBuildOrder(self, kSceneItem):
+        """Returns the objects of the hierarchy in the order they are built.
 
-                builtName += location
+        Parents come before their children. The order of the object passed to
+        build() is computed once and shared by all build passes.
 
-            elif token is 'type':
-                builtName += nameTemplate['types'][kType]
+        Arguments:
+        kSceneItem -- Object, top of the hierarchy.
 
-            elif token is 'name':
-                builtName += kObject.getName()
+        Return:
+        List of kraken objects.
 
-            elif token is 'component':
-                builtName += kObject.getComponent().getName()
+        """
 
-            else:
-                raise ValueError("Unresolvabled token '" + token + "' used on: " + kObject.getFullName())
+        if self._buildOrder and self._buildOrder[0] is kSceneItem:
+            return self._buildOrder
 
-        return builtName
+        return list(kSceneItem.walk())
 
 
     def buildHierarchy(self, kObject, component=None):
@@ -541,7 +588,35 @@ class BaseBuilder(object):
 
         Arguments:
         kObject -- Object, kraken object to build.
-        component -- Component, component that this object belongs to.
+        component -- Component, unused, kept for backwards compatibility.
+
+        Return:
+        DCC object that was created for kObject.
+
+        """
+
+        profiler = self.profiler
+
+        dccSceneItem = None
+        for eachObject in self.getBuildOrder(kObject):
+            if profiler is None:
+                builtItem = self._buildHierarchyItem(eachObject)
+            else:
+                start = profiler.getTime()
+                builtItem = self._buildHierarchyItem(eachObject)
+                profiler.recordObject(eachObject, self._getProfiledComponent(eachObject), start)
+
+            if eachObject is kObject:
+                dccSceneItem = builtItem
+
+        return dccSceneItem
+
+
+    def _buildHierarchyItem(self, kObject):
+        """Builds a single object of the hierarchy, without its children.
+
+        Arguments:
+        kObject -- Object, kraken object to build.
 
         Return:
         DCC object that was created.
@@ -562,7 +637,6 @@ class BaseBuilder(object):
 
         elif kType == "Component":
             dccSceneItem = self.buildGroup(kObject, buildName)
-            component = kObject
 
         elif kType == "HierarchyGroup":
             dccSceneItem = self.buildHierarchyGroup(kObject, buildName)
@@ -593,11 +667,6 @@ class BaseBuilder(object):
         self.setVisibility(kObject)
         self.setObjectColor(kObject)
 
-        # Build children
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildHierarchy(child, component)
-
         return dccSceneItem
 
 
@@ -612,32 +681,33 @@ class BaseBuilder(object):
 
         """
 
-        dccSceneItem = None
-        for i in xrange(kObject.getNumConstraints()):
+        profiler = self.profiler
 
-            constraint = kObject.getConstraintByIndex(i)
-            kType = constraint.getKType()
+        for eachObject in self.getBuildOrder(kObject):
+            for constraint in eachObject.constraints:
+                if profiler is not None:
+                    start = profiler.getTime()
 
-            # Build Object
-            if kType == "OrientationConstraint":
-                dccSceneItem = self.buildOrientationConstraint(constraint)
+                kType = constraint.getKType()
 
-            elif kType == "PoseConstraint":
-                dccSceneItem = self.buildPoseConstraint(constraint)
+                # Build Object
+                if kType == "OrientationConstraint":
+                    dccSceneItem = self.buildOrientationConstraint(constraint)
 
-            elif kType == "PositionConstraint":
-                dccSceneItem = self.buildPositionConstraint(constraint)
+                elif kType == "PoseConstraint":
+                    dccSceneItem = self.buildPoseConstraint(constraint)
 
-            elif kType == "ScaleConstraint":
-                dccSceneItem = self.buildScaleConstraint(constraint)
+                elif kType == "PositionConstraint":
+                    dccSceneItem = self.buildPositionConstraint(constraint)
 
-            else:
-                raise NotImplementedError(constraint.getName() + ' has an unsupported type: ' + str(type(constraint)))
+                elif kType == "ScaleConstraint":
+                    dccSceneItem = self.buildScaleConstraint(constraint)
+
+                else:
+                    raise NotImplementedError(constraint.getName() + ' has an unsupported type: ' + str(type(constraint)))
 
-        # Build children
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildConstraints(child)
+                if profiler is not None:
+                    profiler.recordObject(constraint, self._getProfiledComponent(eachObject), start)
 
         return True
 
@@ -654,44 +724,69 @@ class BaseBuilder(object):
 
         """
 
-        if kObject.getKType() == 'Component':
+        for eachObject in self.getBuildOrder(kObject):
+            if eachObject.getKType() == 'Component':
+                self._buildComponentIOConnections(eachObject)
 
-            # Build input connections
-            for i in xrange(kObject.getNumInputs()):
-                componentInput = kObject.getInputByIndex(i)
+        return True
 
-                if componentInput.getDataType() == 'Xfo':
-                    if componentInput.getSource() is None:
-                        continue
 
-                    self.buildXfoConnection(componentInput)
+    def _buildComponentIOConnections(self, kObject):
+        """Builds the input and output connections of a single component.
 
-                elif componentInput.getDataType() == 'Attribute':
-                    if componentInput.getSource() is None:
-                        continue
+        Arguments:
+        kObject -- Component, component to create connections for.
 
-                    self.buildAttributeConnection(componentInput)
+        Return:
+        True if successful.
+
+        """
+
+        profiler = self.profiler
+
+        # Build input connections
+        for i in xrange(kObject.getNumInputs()):
+            componentInput = kObject.getInputByIndex(i)
+
+            if profiler is not None:
+                start = profiler.getTime()
+
+            if componentInput.getDataType() == 'Xfo':
+                if componentInput.getSource() is None:
+                    continue
+
+                self.buildXfoConnection(componentInput)
+
+            elif componentInput.getDataType() == 'Attribute':
+                if componentInput.getSource() is None:
+                    continue
+
+                self.buildAttributeConnection(componentInput)
+
+            if profiler is not None:
+                profiler.recordObject(componentInput, kObject, start)
+
+        # Build output connections
+        for i in xrange(kObject.getNumOutputs()):
+            componentOutput = kObject.getOutputByIndex(i)
 
-            # Build output connections
-            for i in xrange(kObject.getNumOutputs()):
-                componentOutput = kObject.getOutputByIndex(i)
+            if profiler is not None:
+                start = profiler.getTime()
 
-                if componentOutput.getDataType() == 'Xfo':
-                    if componentOutput.getSource() is None:
-                        continue
+            if componentOutput.getDataType() == 'Xfo':
+                if componentOutput.getSource() is None:
+                    continue
 
-                    self.buildXfoConnection(componentOutput)
+                self.buildXfoConnection(componentOutput)
 
-                elif componentOutput.getDataType() == 'Attribute':
-                    if componentOutput.getSource() is None:
-                        continue
+            elif componentOutput.getDataType() == 'Attribute':
+                if componentOutput.getSource() is None:
+                    continue
 
-                    self.buildAttributeConnection(componentOutput)
+                self.buildAttributeConnection(componentOutput)
 
-        # Build connections for children.
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildIOConnections(child)
+            if profiler is not None:
+                profiler.recordObject(componentOutput, kObject, start)
 
         return True
 
@@ -708,18 +803,17 @@ class BaseBuilder(object):
 
         """
 
-        # Build input connections
-        for i in xrange(kObject.getNumAttributeGroups()):
-            attributeGroup = kObject.getAttributeGroupByIndex(i)
-
-            for y in xrange(attributeGroup.getNumAttributes()):
-                attribute = attributeGroup.getAttributeByIndex(y)
-                self.connectAttribute(attribute)
+        profiler = self.profiler
 
-        # Build connections for children.
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildAttrConnections(child)
+        for eachObject in self.getBuildOrder(kObject):
+            for attributeGroup in eachObject.attributeGroups:
+                for attribute in attributeGroup.attributes:
+                    if profiler is None:
+                        self.connectAttribute(attribute)
+                    else:
+                        start = profiler.getTime()
+                        self.connectAttribute(attribute)
+                        profiler.recordObject(attribute, self._getProfiledComponent(eachObject), start)
 
         return True
 
@@ -735,23 +829,27 @@ class BaseBuilder(object):
 
         """
 
-        if kObject.getKType() == 'Component':
+        profiler = self.profiler
+
+        for eachObject in self.getBuildOrder(kObject):
+            if eachObject.getKType() != 'Component':
+                continue
 
-            # Build operators
-            for i in xrange(kObject.getNumOperators()):
-                operator = kObject.getOperatorByIndex(i)
+            for i in xrange(eachObject.getNumOperators()):
+                operator = eachObject.getOperatorByIndex(i)
                 kType = operator.getKType()
 
+                if profiler is not None:
+                    start = profiler.getTime()
+
                 if kType == 'SpliceOperator':
                     self.buildSpliceOperators(operator)
 
                 else:
-                    raise NotImplementedError(operator.getName() + ' has an unsupported type: ' + str(type(kObject)))
+                    raise NotImplementedError(operator.getName() + ' has an unsupported type: ' + str(type(eachObject)))
 
-        # Build connections for children.
-        for i in xrange(kObject.getNumChildren()):
-            child = kObject.getChildByIndex(i)
-            self.buildOperators(child)
+                if profiler is not None:
+                    profiler.recordObject(operator, self._getProfiledComponent(eachObject), start)
 
         return True
 
@@ -847,11 +945,14 @@ class BaseBuilder(object):
 
         """
 
-        self.buildHierarchy(kSceneItem, component=None)
-        self.buildConstraints(kSceneItem)
-        self.buildAttrConnections(kSceneItem)
-        self.buildIOConnections(kSceneItem)
-        self.buildOperators(kSceneItem)
+        self._buildOrder = list(kSceneItem.walk())
+        self._namedObjects = {}
+
+        self._runPhase('buildHierarchy', self.buildHierarchy, kSceneItem, component=None)
+        self._runPhase('buildConstraints', self.buildConstraints, kSceneItem)
+        self._runPhase('buildAttrConnections', self.buildAttrConnections, kSceneItem)
+        self._runPhase('buildIOConnections', self.buildIOConnections, kSceneItem)
+        self._runPhase('buildOperators', self.buildOperators, kSceneItem)
 
         return True
 
@@ -867,16 +968,79 @@ class BaseBuilder(object):
 
         """
 
+        self.config.checkNameTemplate()
+
+        # Pairings only refer to the items of the last build.
+        self._buildElements = []
+        self._dccSceneItems = {}
+        self._kSceneItems = {}
+
+        if self.config.getProfiling() is True:
+            self.profiler = BuildProfiler()
+        else:
+            self.profiler = None
+
         try:
-            self._preBuild(kSceneItem)
-            self._build(kSceneItem)
+            self._runPhase('preBuild', self._preBuild, kSceneItem)
+            self._runPhase('build', self._build, kSceneItem)
 
         finally:
-            self._postBuild()
+            self._buildOrder = []
+            self._runPhase('postBuild', self._postBuild)
 
         return True
 
 
+    def _runPhase(self, name, method, *args, **kwargs):
+        """Runs a build phase, timing it when profiling is enabled.
+
+        Arguments:
+        name -- String, name of the phase.
+        method -- Function, phase to run.
+        args -- Arguments passed to the phase.
+        kwargs -- Keyword arguments passed to the phase.
+
+        Return:
+        Result of the phase.
+
+        """
+
+        if self.profiler is None:
+            return method(*args, **kwargs)
+
+        return self.profiler.runPhase(name, method, *args, **kwargs)
+
+
+    def _getProfiledComponent(self, kObject):
+        """Returns the component an object's build time is attributed to.
+
+        Arguments:
+        kObject -- Object, kraken object that was built.
+
+        Return:
+        Component, component of the object, None if it has none.
+
+        """
+
+        if isinstance(kObject, BaseComponent):
+            return kObject
+
+        return kObject.component
+
+
+    def getProfiler(self):
+        """Returns the profiler of the last build.
+
+        Profiling is enabled with BaseConfig.setProfiling.
+
+        Return:
+        BuildProfiler, None if the last build wasn't profiled.
+
+        """
+
+        return self.profiler
+
+
     def _postBuild(self):
         """Protected Post-Build method.
 
@@ -0,0 +1,207 @@
+"""Kraken - builders.build_profiler module.
+
+Classes:
+BuildProfiler -- Records timings and call counts of a build.
+
+"""
+
+import json
+import timeit
+
+
+class BuildProfiler(object):
+    """Records the wall time and call count of each build phase, and of the
+    objects built in them by kType and by component.
+
+    Objects are recorded by the hierarchy, constraint and operator passes,
+    attributes by the attribute connection pass and component inputs and
+    outputs by the component connection pass.
+
+    The report can be written as JSON or in the Chrome trace event format,
+    which can be opened in chrome://tracing.
+
+    """
+
+    def __init__(self):
+        super(BuildProfiler, self).__init__()
+        self.phases = {}
+        self.kTypes = {}
+        self.components = {}
+        self.events = []
+
+        self._origin = timeit.default_timer()
+        self._phase = None
+
+
+    # ===============
+    # Timing Methods
+    # ===============
+    def getTime(self):
+        """Returns the current time, pass it to the record methods as the start
+        of a timed call.
+
+        Return:
+        Float, time in seconds.
+
+        """
+
+        return timeit.default_timer()
+
+
+    def runPhase(self, name, method, *args, **kwargs):
+        """Runs a build phase and records its timing.
+
+        Arguments:
+        name -- String, name of the phase.
+        method -- Function, phase to run.
+        args -- Arguments passed to the phase.
+        kwargs -- Keyword arguments passed to the phase.
+
+        Return:
+        Result of the phase.
+
+        """
+
+        parentPhase = self._phase
+        self._phase = name
+
+        start = timeit.default_timer()
+        try:
+            return method(*args, **kwargs)
+
+        finally:
+            end = timeit.default_timer()
+            self._phase = parentPhase
+
+            _addTiming(self.phases, name, end - start)
+            self._addEvent(name, 'phase', start, end, None)
+
+
+    def recordObject(self, kObject, component, start):
+        """Records the timing of building a single object in the current phase.
+
+        Arguments:
+        kObject -- Object, kraken object that was built.
+        component -- Component, component the object belongs to, None if it
+                     doesn't belong to one.
+        start -- Float, time returned by getTime before the object was built.
+
+        Return:
+        True if successful.
+
+        """
+
+        end = timeit.default_timer()
+        duration = end - start
+
+        kType = kObject.getKType()
+        _addTiming(self.kTypes, kType, duration)
+
+        if component is None:
+            componentName = None
+        else:
+            componentName = component.getComponentName()
+            _addTiming(self.components, componentName, duration)
+
+        self._addEvent(kObject.getName(), kType, start, end,
+                       {'phase': self._phase, 'component': componentName})
+
+        return True
+
+
+    def _addEvent(self, name, category, start, end, args):
+        """Adds a complete event to the trace.
+
+        Arguments:
+        name -- String, name of the event.
+        category -- String, category of the event.
+        start -- Float, start time in seconds.
+        end -- Float, end time in seconds.
+        args -- Dict, extra values shown with the event, can be None.
+
+        """
+
+        event = {
+                 'name': name,
+                 'cat': category,
+                 'ph': 'X',
+                 'ts': (start - self._origin) * 1e6,
+                 'dur': (end - start) * 1e6,
+                 'pid': 0,
+                 'tid': 0
+                }
+
+        if args is not None:
+            event['args'] = args
+
+        self.events.append(event)
+
+
+    # ===============
+    # Report Methods
+    # ===============
+    def getReport(self):
+        """Returns the timings by phase, kType and component.
+
+        Return:
+        Dict, call count and total time in seconds of each entry.
+
+        """
+
+        return {
+                'phases': self.phases,
+                'kTypes': self.kTypes,
+                'components': self.components
+               }
+
+
+    def writeJSON(self, path):
+        """Writes the report returned by getReport as JSON.
+
+        Arguments:
+        path -- String, path of the file to write.
+
+        Return:
+        True if successful.
+
+        """
+
+        with open(path, 'w') as reportFile:
+            json.dump(self.getReport(), reportFile, indent=2, sort_keys=True)
+
+        return True
+
+
+    def writeChromeTrace(self, path):
+        """Writes the recorded events in the Chrome trace event format.
+
+        Arguments:
+        path -- String, path of the file to write.
+
+        Return:
+        True if successful.
+
+        """
+
+        with open(path, 'w') as traceFile:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, traceFile)
+
+        return True
+
+
+def _addTiming(timings, key, duration):
+    """Adds a call to the timing of an entry.
+
+    Arguments:
+    timings -- Dict, timings by entry.
+    key -- String, entry to add the call to.
+    duration -- Float, duration of the call in seconds.
+
+    """
+
+    timing = timings.get(key)
+    if timing is None:
+        timings[key] = {'calls': 1, 'time': duration}
+    else:
+        timing['calls'] += 1
+        timing['time'] += duration
@@ -0,0 +1,745 @@
+"""Kraken - builders.recording_builder module.
+
+Classes:
+RecordingBuilder -- Builder recording the build as a log of commands.
+RecordPlayer -- Base object applying a recorded log to a DCC.
+
+Functions:
+loadRecords -- Reads a log written by RecordingBuilder.save.
+replayRecords -- Applies a log to a RecordPlayer.
+
+"""
+
+import json
+
+from kraken.core.builders.base_builder import BaseBuilder
+
+
+class RecordingBuilder(BaseBuilder):
+    """Builder that records every DCC command of a build instead of running it.
+
+    Each record is a list of plain values, the command name followed by its
+    arguments. Nodes are referenced by integer ids, in the order they were
+    created. Each build starts a new log, so logs can be saved, compared
+    between builds and replayed in a DCC with a RecordPlayer, without running
+    the rig code again.
+
+    """
+
+    def __init__(self, config=None, logPath=None):
+        super(RecordingBuilder, self).__init__(config=config)
+        self.records = []
+        self.logPath = logPath
+        self._nodeCount = 0
+
+
+    # ===============
+    # Record Methods
+    # ===============
+    def _record(self, *record):
+        """Appends a command to the log.
+
+        Arguments:
+        record -- Command name followed by its arguments.
+
+        Return:
+        True if successful.
+
+        """
+
+        self.records.append(list(record))
+
+        return True
+
+
+    def _createNodeId(self, kObject):
+        """Returns a new node id paired with a kraken object.
+
+        Arguments:
+        kObject -- Object, kraken object the node is built for.
+
+        Return:
+        Integer, id of the node.
+
+        """
+
+        nodeId = self._nodeCount
+        self._nodeCount += 1
+        self._registerSceneItemPair(kObject, nodeId)
+
+        return nodeId
+
+
+    def getRecords(self):
+        """Returns the recorded commands.
+
+        Return:
+        List of records.
+
+        """
+
+        return self.records
+
+
+    def save(self, path):
+        """Writes the recorded commands to a file, one JSON record per line.
+
+        Arguments:
+        path -- String, path of the file to write.
+
+        Return:
+        True if successful.
+
+        """
+
+        with open(path, 'w') as logFile:
+            for record in self.records:
+                logFile.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+        return True
+
+
+    def _buildNode(self, kSceneItem, buildName, nodeType):
+        """Records the creation of a transform node.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem to build.
+        buildName -- String, The name to use on the built object.
+        nodeType -- String, type of node to create.
+
+        Return:
+        Integer, id of the node.
+
+        """
+
+        parentId = self._getDCCSceneItem(kSceneItem.getParent())
+        nodeId = self._createNodeId(kSceneItem)
+        self._record('createNode', nodeId, nodeType, buildName, parentId, kSceneItem.getFullName())
+
+        return nodeId
+
+
+    def _buildCurveNode(self, kSceneItem, buildName, nodeType):
+        """Records the creation of a curve node.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem to build.
+        buildName -- String, The name to use on the built object.
+        nodeType -- String, type of node to create.
+
+        Return:
+        Integer, id of the node.
+
+        """
+
+        parentId = self._getDCCSceneItem(kSceneItem.getParent())
+        nodeId = self._createNodeId(kSceneItem)
+
+        points = [[x.toArray() for x in eachSubCurve] for eachSubCurve in kSceneItem.getControlPoints()]
+        closed = [kSceneItem.getCurveSectionClosed(i) for i in xrange(len(points))]
+
+        self._record('createCurve', nodeId, nodeType, buildName, parentId, kSceneItem.getFullName(), points, closed)
+
+        return nodeId
+
+
+    # ========================
+    # SceneItem Build Methods
+    # ========================
+    def buildContainer(self, kSceneItem, buildName):
+        """Builds a container / namespace object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a container to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildNode(kSceneItem, buildName, 'Container')
+
+
+    def buildLayer(self, kSceneItem, buildName):
+        """Builds a layer object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a layer to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildNode(kSceneItem, buildName, 'Layer')
+
+
+    def buildHierarchyGroup(self, kSceneItem, buildName):
+        """Builds a hierarchy group object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a group to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildNode(kSceneItem, buildName, 'HierarchyGroup')
+
+
+    def buildGroup(self, kSceneItem, buildName):
+        """Builds a group object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a group to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildNode(kSceneItem, buildName, 'Group')
+
+
+    def buildJoint(self, kSceneItem, buildName):
+        """Builds a joint object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a joint to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildNode(kSceneItem, buildName, 'Joint')
+
+
+    def buildLocator(self, kSceneItem, buildName):
+        """Builds a locator / null object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a locator / null to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildNode(kSceneItem, buildName, 'Locator')
+
+
+    def buildCurve(self, kSceneItem, buildName):
+        """Builds a Curve object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a curve to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildCurveNode(kSceneItem, buildName, 'Curve')
+
+
+    def buildControl(self, kSceneItem, buildName):
+        """Builds a Control object.
+
+        Arguments:
+        kSceneItem -- Object, kSceneItem that represents a control to be built.
+        buildName -- String, The name to use on the built object.
+
+        Return:
+        Integer, id of the node that is created.
+
+        """
+
+        return self._buildCurveNode(kSceneItem, buildName, 'Control')
+
+
+    # ========================
+    # Attribute Build Methods
+    # ========================
+    def _buildAttribute(self, kAttribute, attributeType, minValue=None, maxValue=None):
+        """Records the creation of an attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute to build.
+        attributeType -- String, type of the attribute.
+        minValue -- Number, optional, minimum value of the attribute.
+        maxValue -- Number, optional, maximum value of the attribute.
+
+        Return:
+        True if successful.
+
+        """
+
+        groupId = self._getDCCSceneItem(kAttribute.getParent())
+        nodeId = self._createNodeId(kAttribute)
+        self._record('addAttribute', nodeId, attributeType, kAttribute.getName(), groupId,
+                     kAttribute.getValue(), minValue, maxValue)
+
+        return True
+
+
+    def buildBoolAttribute(self, kAttribute):
+        """Builds a Bool attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a boolean attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        return self._buildAttribute(kAttribute, 'Bool')
+
+
+    def buildFloatAttribute(self, kAttribute):
+        """Builds a Float attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a float attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        return self._buildAttribute(kAttribute, 'Float', kAttribute.min, kAttribute.max)
+
+
+    def buildIntegerAttribute(self, kAttribute):
+        """Builds a Integer attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a integer attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        return self._buildAttribute(kAttribute, 'Integer', kAttribute.min, kAttribute.max)
+
+
+    def buildStringAttribute(self, kAttribute):
+        """Builds a String attribute.
+
+        Arguments:
+        kAttribute -- Object, kAttribute that represents a string attribute to be built.
+
+        Return:
+        True if successful.
+
+        """
+
+        return self._buildAttribute(kAttribute, 'String')
+
+
+    def buildAttributeGroup(self, kAttributeGroup):
+        """Builds attribute groups on the DCC object.
+
+        Arguments:
+        kAttributeGroup -- SceneItem, kraken object to build the attribute group on.
+
+        Return:
+        True if successful.
+
+        """
+
+        parentId = self._getDCCSceneItem(kAttributeGroup.getParent())
+        nodeId = self._createNodeId(kAttributeGroup)
+        self._record('addAttributeGroup', nodeId, kAttributeGroup.getName(), parentId)
+
+        # Create Attributes on this Attribute Group
+        for i in xrange(kAttributeGroup.getNumAttributes()):
+            kAttribute = kAttributeGroup.getAttributeByIndex(i)
+            kType = kAttribute.getKType()
+
+            if kType == "BoolAttribute":
+                self.buildBoolAttribute(kAttribute)
+
+            elif kType == "FloatAttribute":
+                self.buildFloatAttribute(kAttribute)
+
+            elif kType == "IntegerAttribute":
+                self.buildIntegerAttribute(kAttribute)
+
+            elif kType == "StringAttribute":
+                self.buildStringAttribute(kAttribute)
+
+            else:
+                raise NotImplementedError(kAttribute.getName() + ' has an unsupported type: ' + str(type(kAttribute)))
+
+        return True
+
+
+    def connectAttribute(self, kAttribute):
+        """Connects the driver attribute to this one.
+
+        Arguments:
+        kAttribute -- Object, attribute to connect.
+
+        Return:
+        True if successful.
+
+        """
+
+        if kAttribute.isConnected() is True:
+            self._record('connectAttribute',
+                         self._getDCCSceneItem(kAttribute.getConnection()),
+                         self._getDCCSceneItem(kAttribute))
+
+        return True
+
+
+    # =========================
+    # Constraint Build Methods
+    # =========================
+    def _buildConstraint(self, kConstraint, constraintType):
+        """Records the creation of a constraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+        constraintType -- String, type of the constraint.
+
+        Return:
+        Integer, id of the constraint node.
+
+        """
+
+        constraineeId = self._getDCCSceneItem(kConstraint.getConstrainee())
+        constrainerIds = [self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()]
+
+        nodeId = self._createNodeId(kConstraint)
+        self._record('createConstraint', nodeId, constraintType, kConstraint.getName(), constraineeId,
+                     constrainerIds, kConstraint.getMaintainOffset())
+
+        return nodeId
+
+
+    def buildOrientationConstraint(self, kConstraint):
+        """Builds an orientation constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        Integer, id of the constraint node.
+
+        """
+
+        return self._buildConstraint(kConstraint, 'Orientation')
+
+
+    def buildPoseConstraint(self, kConstraint):
+        """Builds an pose constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        Integer, id of the constraint node.
+
+        """
+
+        return self._buildConstraint(kConstraint, 'Pose')
+
+
+    def buildPositionConstraint(self, kConstraint):
+        """Builds an position constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        Integer, id of the constraint node.
+
+        """
+
+        return self._buildConstraint(kConstraint, 'Position')
+
+
+    def buildScaleConstraint(self, kConstraint):
+        """Builds an scale constraint represented by the kConstraint.
+
+        Arguments:
+        kConstraint -- Object, kraken constraint object to build.
+
+        Return:
+        Integer, id of the constraint node.
+
+        """
+
+        return self._buildConstraint(kConstraint, 'Scale')
+
+
+    # ========================
+    # Component Build Methods
+    # ========================
+    def buildAttributeConnection(self, kConnection):
+        """Builds the connection between the attribute and the connection.
+
+        Arguments:
+        kConnection -- Object, kraken connection to build.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._record('connectAttribute',
+                     self._getDCCSceneItem(kConnection.getSource()),
+                     self._getDCCSceneItem(kConnection.getTarget()))
+
+        return None
+
+
+    # =========================
+    # Operator Builder Methods
+    # =========================
+    def buildSpliceOperators(self, kOperator):
+        """Builds Splice Operators on the components.
+
+        Arguments:
+        kOperator -- Object, kraken operator that represents a Splice operator.
+
+        Return:
+        True if successful.
+
+        """
+
+        inputs = dict((name, self._getDCCSceneItem(x)) for name, x in kOperator.inputs.iteritems())
+        outputs = dict((name, self._getDCCSceneItem(x)) for name, x in kOperator.outputs.iteritems())
+
+        nodeId = self._createNodeId(kOperator)
+        self._record('createSpliceOperator', nodeId, kOperator.getName(), kOperator.getSolverTypeName(),
+                     kOperator.getExtension(), inputs, outputs)
+
+        return True
+
+
+    # ===================
+    # Visibility Methods
+    # ===================
+    def setVisibility(self, kSceneItem):
+        """Sets the visibility of the object after its been created.
+
+        Arguments:
+        kSceneItem -- Object, kraken object to set the visibility on.
+
+        Return:
+        True if successful.
+
+        """
+
+        if hasattr(kSceneItem, 'getShapeVisibility') is False:
+            return False
+
+        if kSceneItem.getShapeVisibility() is False:
+            self._record('setShapeVisibility', self._getDCCSceneItem(kSceneItem), False)
+
+        return True
+
+
+    # ================
+    # Display Methods
+    # ================
+    def setObjectColor(self, kSceneItem):
+        """Sets the color on the dccSceneItem.
+
+        Arguments:
+        kSceneItem -- Object, kraken object to set the color on.
+
+        Return:
+        True if successful.
+
+        """
+
+        objectColor = kSceneItem.getColor()
+        if objectColor not in self.VALID_COLORS:
+            return False
+
+        self._record('setColor', self._getDCCSceneItem(kSceneItem), objectColor)
+
+        return True
+
+
+    # ==================
+    # Transform Methods
+    # ==================
+    def setTransform(self, kSceneItem):
+        """Records the world transform of the object.
+
+        Arguments:
+        kSceneItem -- Object: object to set the transform on.
+
+        Return:
+        True if successful.
+
+        """
+
+        xfo = kSceneItem.xfo
+        self._record('setTransform', self._getDCCSceneItem(kSceneItem),
+                     xfo.scl.toArray(), [xfo.rot.v.x, xfo.rot.v.y, xfo.rot.v.z, xfo.rot.w], xfo.tr.toArray())
+
+        return True
+
+
+    # ==============
+    # Build Methods
+    # ==============
+    def _preBuild(self, kSceneItem):
+        """Starts a new log, node ids restart at 0.
+
+        Arguments:
+        kSceneItem -- Object, kraken kSceneItem object to build.
+
+        Return:
+        True if successful.
+
+        """
+
+        self.records = []
+        self._nodeCount = 0
+
+        return super(RecordingBuilder, self)._preBuild(kSceneItem)
+
+
+    def _postBuild(self):
+        """Writes the log if the builder was given a path.
+
+        Return:
+        True if successful.
+
+        """
+
+        if self.logPath is not None:
+            self.save(self.logPath)
+
+        return super(RecordingBuilder, self)._postBuild()
+
+
+class RecordPlayer(object):
+    """Base object applying recorded commands to a DCC.
+
+    Sub-class per DCC and implement the command methods, the base methods
+    raise NotImplementedError. Nodes are passed as the ids they were recorded
+    with, map them to DCC objects with nodes.
+
+    """
+
+    def __init__(self):
+        super(RecordPlayer, self).__init__()
+        self.nodes = {}
+
+
+    def createNode(self, nodeId, nodeType, buildName, parentId, fullName):
+        """Creates a transform node."""
+
+        raise NotImplementedError("createNode is not implemented by " + type(self).__name__ + ".")
+
+
+    def createCurve(self, nodeId, nodeType, buildName, parentId, fullName, points, closed):
+        """Creates a curve node, points holds the points of each section."""
+
+        raise NotImplementedError("createCurve is not implemented by " + type(self).__name__ + ".")
+
+
+    def addAttributeGroup(self, nodeId, name, parentId):
+        """Adds an attribute group to a node."""
+
+        raise NotImplementedError("addAttributeGroup is not implemented by " + type(self).__name__ + ".")
+
+
+    def addAttribute(self, nodeId, attributeType, name, groupId, value, minValue, maxValue):
+        """Adds an attribute to an attribute group."""
+
+        raise NotImplementedError("addAttribute is not implemented by " + type(self).__name__ + ".")
+
+
+    def connectAttribute(self, driverId, drivenId):
+        """Connects an attribute to another."""
+
+        raise NotImplementedError("connectAttribute is not implemented by " + type(self).__name__ + ".")
+
+
+    def createConstraint(self, nodeId, constraintType, name, constraineeId, constrainerIds, maintainOffset):
+        """Creates a constraint."""
+
+        raise NotImplementedError("createConstraint is not implemented by " + type(self).__name__ + ".")
+
+
+    def createSpliceOperator(self, nodeId, name, solverTypeName, extension, inputs, outputs):
+        """Creates a Splice operator, inputs and outputs map names to nodes."""
+
+        raise NotImplementedError("createSpliceOperator is not implemented by " + type(self).__name__ + ".")
+
+
+    def setShapeVisibility(self, nodeId, visibility):
+        """Sets the visibility of the shape of a node."""
+
+        raise NotImplementedError("setShapeVisibility is not implemented by " + type(self).__name__ + ".")
+
+
+    def setColor(self, nodeId, color):
+        """Sets the color of a node, color is a key of BaseBuilder.VALID_COLORS."""
+
+        raise NotImplementedError("setColor is not implemented by " + type(self).__name__ + ".")
+
+
+    def setTransform(self, nodeId, scl, rot, tr):
+        """Sets the world transform of a node, rot is a (x, y, z, w) quaternion."""
+
+        raise NotImplementedError("setTransform is not implemented by " + type(self).__name__ + ".")
+
+
+# ===============
+# Replay Methods
+# ===============
+def loadRecords(path):
+    """Reads a log written by RecordingBuilder.save.
+
+    Arguments:
+    path -- String, path of the file to read.
+
+    Return:
+    List of records.
+
+    """
+
+    with open(path, 'r') as logFile:
+        return [json.loads(line) for line in logFile if line.strip()]
+
+
+def replayRecords(records, player):
+    """Applies recorded commands in order.
+
+    Arguments:
+    records -- List, records of a RecordingBuilder or loaded with loadRecords.
+    player -- RecordPlayer, object applying the commands.
+
+    Return:
+    True if successful.
+
+    """
+
+    for record in records:
+        command = getattr(player, record[0], None)
+        if command is None:
+            raise NotImplementedError("Recorded command '" + record[0] + "' is not supported by " + str(type(player)))
+
+        command(*record[1:])
+
+    return True
@@ -5,6 +5,10 @@ BaseConfig -- Base config object used to configure builders.
 
 """
 
+import copy
+
+from kraken.core.objects.components.base_component import BaseComponent
+
 
 class BaseConfig(object):
     """Base Configuration for Kraken builders."""
@@ -38,6 +42,14 @@ class BaseConfig(object):
                                        }
                             }
 
+        # Formatters compiled from the name template, by kType.
+        self._nameFormatters = {}
+        self._compiledNameTemplate = None
+        self._nameTemplateSnapshot = None
+        self._nameTemplateRevision = 0
+
+        self.profiling = False
+
 
     def getNameTemplate(self):
         """Returns the naming template for this configuration.
@@ -47,4 +59,241 @@ class BaseConfig(object):
 
         """
 
-        return self.nameTemplate
\ No newline at end of file
+        return self.nameTemplate
+
+
+    def setNameTemplate(self, nameTemplate):
+        """Sets the naming template for this configuration.
+
+        The formatters compiled from the previous template are discarded.
+
+        Arguments:
+        nameTemplate -- Dict, naming template.
+
+        Return:
+        True if successful.
+
+        """
+
+        self.nameTemplate = nameTemplate
+        self._compiledNameTemplate = None
+
+        return True
+
+
+    def getNameTemplateRevision(self):
+        """Returns a number that changes every time the naming template is
+        replaced, so names built from it can be cached.
+
+        Return:
+        Integer, revision of the naming template.
+
+        """
+
+        self._checkNameTemplate()
+
+        return self._nameTemplateRevision
+
+
+    def getNameFormatter(self, kType):
+        """Returns the function building names of objects of a kType.
+
+        The token list of the kType is compiled once per naming template.
+
+        Arguments:
+        kType -- String, kType of the objects to name.
+
+        Return:
+        Function taking a kraken object and returning its build name.
+
+        """
+
+        self._checkNameTemplate()
+
+        formatter = self._nameFormatters.get(kType)
+        if formatter is None:
+            formatter = self._compileNameFormat(kType)
+            self._nameFormatters[kType] = formatter
+
+        return formatter
+
+
+    def checkNameTemplate(self):
+        """Discards the compiled formatters if the naming template was edited
+        in place since they were compiled.
+
+        Builders call this at the start of each build. Comparing the whole
+        template is too slow to do for every name.
+
+        Return:
+        True if the template changed.
+
+        """
+
+        if self._nameTemplateSnapshot is None or self.nameTemplate != self._nameTemplateSnapshot:
+            self._compiledNameTemplate = None
+            self._checkNameTemplate()
+
+            return True
+
+        return False
+
+
+    def _checkNameTemplate(self):
+        """Discards the compiled formatters if the naming template was replaced.
+
+        Return:
+        True if successful.
+
+        """
+
+        if self._compiledNameTemplate is not self.nameTemplate:
+            self._nameFormatters = {}
+            self._compiledNameTemplate = self.nameTemplate
+            self._nameTemplateSnapshot = copy.deepcopy(self.nameTemplate)
+            self._nameTemplateRevision += 1
+
+        return True
+
+
+    def _compileNameFormat(self, kType):
+        """Compiles the token list used for a kType into a formatter.
+
+        Arguments:
+        kType -- String, kType of the objects to name.
+
+        Return:
+        Function taking a kraken object and returning its build name.
+
+        """
+
+        nameTemplate = self.nameTemplate
+        formats = nameTemplate['formats']
+        if kType in formats:
+            format = formats[kType]
+        else:
+            format = formats['default']
+
+        # Consecutive constant tokens are joined into a single string.
+        parts = []
+        literal = ''
+        for token in format:
+            if token == 'sep':
+                literal += nameTemplate['separator']
+                continue
+
+            elif token == 'type' and kType in nameTemplate['types']:
+                literal += nameTemplate['types'][kType]
+                continue
+
+            if literal:
+                parts.append(_literalToken(literal))
+                literal = ''
+
+            if token == 'location':
+                parts.append(_locationToken(frozenset(nameTemplate['locations'])))
+
+            elif token == 'type':
+                parts.append(_typeToken(nameTemplate['types']))
+
+            elif token == 'name':
+                parts.append(_nameToken)
+
+            elif token == 'component':
+                parts.append(_componentToken)
+
+            else:
+                parts.append(_invalidToken(token))
+
+        if literal:
+            parts.append(_literalToken(literal))
+
+        def formatName(kObject):
+            builtName = ''.join([x(kObject) for x in parts])
+
+            if kObject.testFlag('EXPLICIT_NAME'):
+                builtName = kObject.getName() + builtName
+
+            return builtName
+
+        return formatName
+
+
+    def getProfiling(self):
+        """Returns whether builds record timings with a BuildProfiler.
+
+        Return:
+        Boolean, whether builds are profiled.
+
+        """
+
+        return self.profiling
+
+
+    def setProfiling(self, profiling):
+        """Sets whether builds record timings with a BuildProfiler.
+
+        Arguments:
+        profiling -- Boolean, whether builds are profiled.
+
+        Return:
+        True if successful.
+
+        """
+
+        self.profiling = profiling
+
+        return True
+
+
+# ==============
+# Token Methods
+# ==============
+def _literalToken(literal):
+    """Returns a token resolving to a constant string."""
+
+    return lambda kObject: literal
+
+
+def _locationToken(locations):
+    """Returns a token resolving to the location of the object's component."""
+
+    def resolveLocation(kObject):
+        if isinstance(kObject, BaseComponent):
+            location = kObject.getLocation()
+        else:
+            location = kObject.getComponent().getLocation()
+
+        if location not in locations:
+            raise ValueError("Invalid location on: " + kObject.getFullName())
+
+        return location
+
+    return resolveLocation
+
+
+def _typeToken(types):
+    """Returns a token resolving to the type name of the object."""
+
+    return lambda kObject: types[kObject.getKType()]
+
+
+def _nameToken(kObject):
+    """Resolves to the name of the object."""
+
+    return kObject.getName()
+
+
+def _componentToken(kObject):
+    """Resolves to the name of the object's component."""
+
+    return kObject.getComponent().getName()
+
+
+def _invalidToken(token):
+    """Returns a token raising an error for a token that isn't supported."""
+
+    def resolveInvalid(kObject):
+        raise ValueError("Unresolvabled token '" + token + "' used on: " + kObject.getFullName())
+
+    return resolveInvalid
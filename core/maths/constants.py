@@ -0,0 +1,91 @@
+"""Kraken - maths.constants module.
+
+Shared, immutable math constants and interning of repeated values.
+
+Constants:
+ZERO_VEC3 -- Vec3(0, 0, 0).
+ONE_VEC3 -- Vec3(1, 1, 1).
+X_AXIS -- Unit X axis.
+Y_AXIS -- Unit Y axis.
+Z_AXIS -- Unit Z axis.
+IDENTITY_QUAT -- Identity rotation.
+IDENTITY_XFO -- Identity transform.
+
+Functions:
+internValue -- Returns the shared frozen instance of a math value.
+internPoints -- Returns the shared tuple of frozen points of a point list.
+"""
+
+from vec import Vec3, FrozenVec3
+from rotation import Quat, FrozenQuat
+from xfo import Xfo, FrozenXfo, IDENTITY_XFO
+
+
+ZERO_VEC3 = FrozenVec3(0.0, 0.0, 0.0)
+ONE_VEC3 = FrozenVec3(1.0, 1.0, 1.0)
+X_AXIS = FrozenVec3(1.0, 0.0, 0.0)
+Y_AXIS = FrozenVec3(0.0, 1.0, 0.0)
+Z_AXIS = FrozenVec3(0.0, 0.0, 1.0)
+IDENTITY_QUAT = FrozenQuat()
+
+_internCache = {}
+
+
+def internValue(value):
+    """Returns the shared frozen instance equal to the input value.
+
+    Mutable values are frozen first, so the result is safe to share between
+    objects. Callers that need to modify the value should clone() it.
+
+    Arguments:
+    value -- Vec3 / Quat / Xfo, value to intern.
+
+    Return:
+    FrozenVec3 / FrozenQuat / FrozenXfo, shared instance.
+
+    """
+
+    if isinstance(value, Vec3):
+        if not isinstance(value, FrozenVec3):
+            value = FrozenVec3(value.x, value.y, value.z)
+
+    elif isinstance(value, Quat):
+        if not isinstance(value, FrozenQuat):
+            value = FrozenQuat(internValue(value.v), value.w)
+
+    elif isinstance(value, Xfo):
+        if not isinstance(value, FrozenXfo):
+            value = FrozenXfo(scl=internValue(value.scl),
+                              rot=internValue(value.rot),
+                              tr=internValue(value.tr),
+                              ro=value.ro)
+
+    else:
+        raise TypeError("internValue: Invalid type for 'value' argument. Must be a Vec3, Quat or Xfo.")
+
+    return _internCache.setdefault(value, value)
+
+
+def internPoints(points):
+    """Returns the shared tuple of frozen points equal to the input points.
+
+    Used for control shapes so every control of the same shape references one
+    set of point objects instead of allocating its own.
+
+    Arguments:
+    points -- List, Vec3 point positions.
+
+    Return:
+    Tuple of FrozenVec3 points.
+
+    """
+
+    points = tuple(internValue(x) for x in points)
+
+    return _internCache.setdefault(points, points)
+
+
+for _constant in (ZERO_VEC3, ONE_VEC3, X_AXIS, Y_AXIS, Z_AXIS, IDENTITY_QUAT, IDENTITY_XFO):
+    internValue(_constant)
+
+del _constant
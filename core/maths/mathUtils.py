@@ -3,7 +3,9 @@
 Utility functions for math operations.
 """
 
+import hashlib
 import math
+import struct
 
 
 def checkDivisor(value):
@@ -29,4 +31,28 @@ def radToDeg(value):
 def degToRad(value):
     """Convert value to radians."""
 
-    return value * (math.pi / 180.0)
\ No newline at end of file
+    return value * (math.pi / 180.0)
+
+
+def quantizedHash(values, precision=10e-6):
+    """Hashes float values after snapping them to a grid of the given precision.
+
+    Values closer than the precision usually hash the same, which makes the
+    result usable as a cache key for transforms and shapes. The digest matches
+    the one computed for the same values by the array classes.
+
+    Arguments:
+    values -- List, float values to hash.
+    precision -- Float, size of the quantization step.
+
+    Return:
+    String, hex digest of the quantized values.
+
+    """
+
+    if checkDivisor(precision):
+        raise ValueError("quantizedHash: 'precision' must not be zero.")
+
+    quantized = [int(math.floor(x / precision + 0.5)) for x in values]
+
+    return hashlib.sha1(struct.pack('<' + str(len(quantized)) + 'q', *quantized)).hexdigest()
@@ -6,7 +6,15 @@ MathObject -- A base class for all math types.
 
 
 class MathObject(object):
-    """MathObject object. A base class for all math types"""
+    """MathObject object. A base class for all math types
+
+    Subclasses declare their persistent attributes in __fields__ and use it as
+    their __slots__ so instances carry no per-instance __dict__.
+
+    """
+
+    __fields__ = ()
+    __slots__ = ()
 
     def jsonEncode(self):
         """Encodes object to JSON.
@@ -19,16 +27,16 @@ class MathObject(object):
                 "__class__":self.__class__.__name__,
             }
 
-        attrs = {}
-        for eachItem in self.__dict__.items():
-            if isinstance(eachItem[1], MathObject):
-                attrs[eachItem[0]] = eachItem[1].jsonEncode()
+        for eachField in self.__fields__:
+            value = getattr(self, eachField)
+            if isinstance(value, MathObject):
+                d[eachField] = value.jsonEncode()
             else:
-                attrs[eachItem[0]] = eachItem[1]
+                d[eachField] = value
 
-        d.update(attrs)
         return d
 
+
     def jsonDecode(self, jsonData, loader):
         """Encodes object to JSON.
 
@@ -40,9 +48,12 @@ class MathObject(object):
         if jsonData["__class__"] != self.__class__.__name__:
             raise Exception("Error in jsonDecode. Json data specifies a different class:" + jsonData["__class__"] + "!==" + self.__class__.__name__)
 
-        for key, value in jsonData.iteritems():
-            if key == '__class__': continue
-            if type(value) is dict: 
+        for key in self.__fields__:
+            if key not in jsonData:
+                continue
+
+            value = jsonData[key]
+            if type(value) is dict:
                 setattr(self, key, loader.decodeValue(value))
             else:
                 setattr(self, key, value)
@@ -7,10 +7,14 @@ Matrix44 -- Matrix 4 transform object.
 
 from math_object import MathObject
 from vec import Vec3, Vec4
+import mathUtils
 
 class Matrix33(MathObject):
     """3x3 Matrix object."""
 
+    __fields__ = ('row0', 'row1', 'row2', 'components')
+    __slots__ = __fields__
+
     def __init__(self, row0=None, row1=None, row2=None):
         """Initialize and set values in the 3x3 matrix."""
 
@@ -251,13 +255,30 @@ class Matrix33(MathObject):
 
         """
 
-        inverse = Matrix33()
         det = self.determinant()
 
-        if det < 0:
-            raise ValueError("Matrix33 inverse: determinant is less than zero.")
+        if mathUtils.checkDivisor(det):
+            raise ValueError("Matrix33 inverse: matrix is singular.")
+
+        invDet = 1.0 / det
+
+        r0 = self.row0
+        r1 = self.row1
+        r2 = self.row2
+
+        # The columns of the inverse are the cross products of the rows.
+        inverse = Matrix33()
+        inverse.setFromArray([(r1.y * r2.z - r1.z * r2.y) * invDet,
+                              (r2.y * r0.z - r2.z * r0.y) * invDet,
+                              (r0.y * r1.z - r0.z * r1.y) * invDet,
+                              (r1.z * r2.x - r1.x * r2.z) * invDet,
+                              (r2.z * r0.x - r2.x * r0.z) * invDet,
+                              (r0.z * r1.x - r0.x * r1.z) * invDet,
+                              (r1.x * r2.y - r1.y * r2.x) * invDet,
+                              (r2.x * r0.y - r2.y * r0.x) * invDet,
+                              (r0.x * r1.y - r0.y * r1.x) * invDet])
 
-        return inverse.divideByScalar(det)
+        return inverse
 
 
     def transpose(self):
@@ -299,6 +320,9 @@ class Matrix33(MathObject):
 class Matrix44(MathObject):
     """4x4 Matrix object."""
 
+    __fields__ = ('row0', 'row1', 'row2', 'row3', 'components')
+    __slots__ = __fields__
+
     def __init__(self, row0=None, row1=None, row2=None, row3=None):
         """Initialize and set values in the 4x4 matrix."""
 
@@ -552,16 +576,16 @@ class Matrix44(MathObject):
 
         a0 = self.row0.x * self.row1.y - self.row0.y * self.row1.x
         a1 = self.row0.x * self.row1.z - self.row0.z * self.row1.x
-        a2 = self.row0.x * self.row1.t - self.row0.t * self.row1.x
+        a2 = self.row0.x * self.row1.w - self.row0.w * self.row1.x
         a3 = self.row0.y * self.row1.z - self.row0.z * self.row1.y
-        a4 = self.row0.y * self.row1.t - self.row0.t * self.row1.y
-        a5 = self.row0.z * self.row1.t - self.row0.t * self.row1.z
+        a4 = self.row0.y * self.row1.w - self.row0.w * self.row1.y
+        a5 = self.row0.z * self.row1.w - self.row0.w * self.row1.z
         b0 = self.row2.x * self.row3.y - self.row2.y * self.row3.x
         b1 = self.row2.x * self.row3.z - self.row2.z * self.row3.x
-        b2 = self.row2.x * self.row3.t - self.row2.t * self.row3.x
+        b2 = self.row2.x * self.row3.w - self.row2.w * self.row3.x
         b3 = self.row2.y * self.row3.z - self.row2.z * self.row3.y
-        b4 = self.row2.y * self.row3.t - self.row2.t * self.row3.y
-        b5 = self.row2.z * self.row3.t - self.row2.t * self.row3.z
+        b4 = self.row2.y * self.row3.w - self.row2.w * self.row3.y
+        b5 = self.row2.z * self.row3.w - self.row2.w * self.row3.z
 
         det = a0 * b5 - a1 * b4 + a2 * b3 + a3 * b2 - a4 * b1 + a5 * b0
 
@@ -576,13 +600,127 @@ class Matrix44(MathObject):
 
         """
 
+        m00, m01, m02, m03 = self.row0.x, self.row0.y, self.row0.z, self.row0.w
+        m10, m11, m12, m13 = self.row1.x, self.row1.y, self.row1.z, self.row1.w
+        m20, m21, m22, m23 = self.row2.x, self.row2.y, self.row2.z, self.row2.w
+        m30, m31, m32, m33 = self.row3.x, self.row3.y, self.row3.z, self.row3.w
+
+        a0 = m00 * m11 - m01 * m10
+        a1 = m00 * m12 - m02 * m10
+        a2 = m00 * m13 - m03 * m10
+        a3 = m01 * m12 - m02 * m11
+        a4 = m01 * m13 - m03 * m11
+        a5 = m02 * m13 - m03 * m12
+        b0 = m20 * m31 - m21 * m30
+        b1 = m20 * m32 - m22 * m30
+        b2 = m20 * m33 - m23 * m30
+        b3 = m21 * m32 - m22 * m31
+        b4 = m21 * m33 - m23 * m31
+        b5 = m22 * m33 - m23 * m32
+
+        det = a0 * b5 - a1 * b4 + a2 * b3 + a3 * b2 - a4 * b1 + a5 * b0
+
+        if mathUtils.checkDivisor(det):
+            raise ValueError("Matrix44 inverse: matrix is singular.")
+
+        invDet = 1.0 / det
+
         inverse = Matrix44()
-        det = self.determinant()
+        inverse.setFromArray([(m11 * b5 - m12 * b4 + m13 * b3) * invDet,
+                              (-m01 * b5 + m02 * b4 - m03 * b3) * invDet,
+                              (m31 * a5 - m32 * a4 + m33 * a3) * invDet,
+                              (-m21 * a5 + m22 * a4 - m23 * a3) * invDet,
+                              (-m10 * b5 + m12 * b2 - m13 * b1) * invDet,
+                              (m00 * b5 - m02 * b2 + m03 * b1) * invDet,
+                              (-m30 * a5 + m32 * a2 - m33 * a1) * invDet,
+                              (m20 * a5 - m22 * a2 + m23 * a1) * invDet,
+                              (m10 * b4 - m11 * b2 + m13 * b0) * invDet,
+                              (-m00 * b4 + m01 * b2 - m03 * b0) * invDet,
+                              (m30 * a4 - m31 * a2 + m33 * a0) * invDet,
+                              (-m20 * a4 + m21 * a2 - m23 * a0) * invDet,
+                              (-m10 * b3 + m11 * b1 - m12 * b0) * invDet,
+                              (m00 * b3 - m01 * b1 + m02 * b0) * invDet,
+                              (-m30 * a3 + m31 * a1 - m32 * a0) * invDet,
+                              (m20 * a3 - m21 * a1 + m22 * a0) * invDet])
+
+        return inverse
+
+
+    def hasShear(self, precision=10e-6):
+        """Checks if the upper 3x3 part of this matrix contains shear.
+
+        Arguments:
+        precision -- Float, tolerance on the cosine between the axes.
+
+        Return:
+        True if the axes are not orthogonal to each other.
+
+        """
+
+        xAxis = Vec3(self.row0.x, self.row0.y, self.row0.z)
+        yAxis = Vec3(self.row1.x, self.row1.y, self.row1.z)
+        zAxis = Vec3(self.row2.x, self.row2.y, self.row2.z)
+
+        xLength = xAxis.length()
+        yLength = yAxis.length()
+        zLength = zAxis.length()
+
+        if mathUtils.checkDivisor(xLength * yLength * zLength):
+            raise ValueError("Matrix44 hasShear: matrix contains a zero length axis.")
+
+        return abs(xAxis.dotProduct(yAxis)) / (xLength * yLength) > precision or \
+               abs(xAxis.dotProduct(zAxis)) / (xLength * zLength) > precision or \
+               abs(yAxis.dotProduct(zAxis)) / (yLength * zLength) > precision
+
+
+    def decompose(self, allowShear=False, precision=10e-6):
+        """Decomposes this matrix into scale, rotation and translation.
+
+        Rows 0-2 are expected to hold the scaled axes and row 3 the
+        translation. A negative determinant is returned as a negative x scale.
+
+        Arguments:
+        allowShear -- Boolean, discard shear instead of raising an error. The
+                      rotation is then orthonormalized from the x and y axes.
+        precision -- Float, tolerance used for the shear and projection checks.
+
+        Return:
+        Tuple of (scale Vec3, rotation Matrix33, translation Vec3). The rotation
+        rows are the unit axes.
+
+        """
+
+        if abs(self.row0.w) > precision or abs(self.row1.w) > precision or \
+           abs(self.row2.w) > precision or abs(self.row3.w - 1.0) > precision:
+            raise ValueError("Matrix44 decompose: matrix contains a projection.")
+
+        if not allowShear and self.hasShear(precision):
+            raise ValueError("Matrix44 decompose: matrix contains shear.")
+
+        xAxis = Vec3(self.row0.x, self.row0.y, self.row0.z)
+        yAxis = Vec3(self.row1.x, self.row1.y, self.row1.z)
+        zAxis = Vec3(self.row2.x, self.row2.y, self.row2.z)
+
+        scale = Vec3(xAxis.length(), yAxis.length(), zAxis.length())
+
+        if mathUtils.checkDivisor(scale.x * scale.y * scale.z):
+            raise ValueError("Matrix44 decompose: matrix contains a zero length axis.")
+
+        if xAxis.dotProduct(yAxis.cross(zAxis)) < 0.0:
+            scale.x = -scale.x
+
+        xAxis = xAxis.divideByScalar(scale.x)
+        yAxis = yAxis.divideByScalar(scale.y)
+
+        if allowShear:
+            yAxis = yAxis.subtract(xAxis.multiplyByScalar(xAxis.dotProduct(yAxis))).unit()
+            zAxis = xAxis.cross(yAxis)
+        else:
+            zAxis = zAxis.divideByScalar(scale.z)
 
-        if det < 0:
-            raise ValueError("Matrix44 inverse: determinant is less than zero.")
+        translation = Vec3(self.row3.x, self.row3.y, self.row3.z)
 
-        return inverse.divideByScalar(det)
+        return scale, Matrix33(xAxis, yAxis, zAxis), translation
 
 
     def transpose(self):
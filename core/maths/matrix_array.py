@@ -0,0 +1,284 @@
+"""Kraken - maths.matrix_array module.
+
+Classes:
+Matrix44Array -- Contiguous array of 4x4 matrices.
+"""
+
+import numpy as np
+
+from matrix import Matrix44
+from xfo_array import XfoArray
+
+
+class Matrix44Array(object):
+    """Array of 4x4 matrices stored in one flat Nx16 float64 array.
+
+    Each row holds the 16 components in the order returned by
+    Matrix44.toArray, so the array can be handed to a DCC or file in one go.
+
+    """
+
+    def __init__(self, count=0):
+        """Initializes the array with count identity matrices."""
+
+        super(Matrix44Array, self).__init__()
+
+        if not isinstance(count, (int, long)) or count < 0:
+            raise TypeError("Matrix44Array: Invalid type for 'count' argument. Must be a positive int.")
+
+        self.values = np.zeros((count, 16), dtype=np.float64)
+        self.values[:, 0::5] = 1.0
+
+
+    def __str__(self):
+        """String representation of the Matrix44Array."""
+
+        return "Matrix44Array(count=" + str(len(self)) + ")"
+
+
+    def __len__(self):
+        """Returns the number of matrices in the array."""
+
+        return self.values.shape[0]
+
+
+    def getMatrices(self):
+        """Returns an Nx4x4 view of the matrix values.
+
+        Return:
+        Nx4x4 array sharing memory with this array.
+
+        """
+
+        return self.values.reshape(-1, 4, 4)
+
+
+    # ======================
+    # Construction Methods
+    # ======================
+    @classmethod
+    def fromArray(cls, values):
+        """Creates a Matrix44Array from an Nx16 or Nx4x4 array.
+
+        Arguments:
+        values -- Array, matrix values.
+
+        Return:
+        New Matrix44Array.
+
+        """
+
+        result = cls()
+        result.values = np.array(values, dtype=np.float64).reshape(-1, 16)
+
+        return result
+
+
+    @classmethod
+    def fromMatrices(cls, matrices):
+        """Creates a Matrix44Array from a list of Matrix44 objects.
+
+        Arguments:
+        matrices -- List, Matrix44 objects to copy values from.
+
+        Return:
+        New Matrix44Array.
+
+        """
+
+        result = cls(len(matrices))
+        for i, matrix in enumerate(matrices):
+            result.setMatrix(i, matrix)
+
+        return result
+
+
+    @classmethod
+    def fromXfoArray(cls, xfoArray):
+        """Creates a Matrix44Array from the transforms of an XfoArray.
+
+        Arguments:
+        xfoArray -- XfoArray, transforms to convert.
+
+        Return:
+        New Matrix44Array.
+
+        """
+
+        if not isinstance(xfoArray, XfoArray):
+            raise TypeError("Matrix44Array: Invalid type for 'xfoArray' argument. Must be a XfoArray.")
+
+        return cls.fromArray(xfoArray.toMatrix44Array())
+
+
+    def toMatrices(self):
+        """Returns a list of new Matrix44 objects with the values of this array.
+
+        Return:
+        List of Matrix44 objects.
+
+        """
+
+        matrices = []
+        for values in self.values.tolist():
+            matrix = Matrix44()
+            matrix.setFromArray(values)
+            matrices.append(matrix)
+
+        return matrices
+
+
+    def toXfoArray(self):
+        """Decomposes the matrices into an XfoArray.
+
+        Return:
+        New XfoArray.
+
+        """
+
+        xfoArray = XfoArray(len(self))
+        xfoArray.setFromMatrix44Array(self.values)
+
+        return xfoArray
+
+
+    def clone(self):
+        """Clone the Matrix44Array into a new Matrix44Array.
+
+        Return:
+        New Matrix44Array with the same values as this Matrix44Array.
+
+        """
+
+        return Matrix44Array.fromArray(self.values)
+
+
+    # ================
+    # Element Methods
+    # ================
+    def getMatrix(self, index):
+        """Returns a new Matrix44 with the values at the given index.
+
+        Arguments:
+        index -- Integer, index of the matrix.
+
+        Return:
+        New Matrix44.
+
+        """
+
+        matrix = Matrix44()
+        matrix.setFromArray(self.values[index].tolist())
+
+        return matrix
+
+
+    def setMatrix(self, index, matrix):
+        """Copies the values of a Matrix44 into the given index.
+
+        Arguments:
+        index -- Integer, index of the matrix.
+        matrix -- Matrix44, matrix to copy the values from.
+
+        Return:
+        True if successful.
+
+        """
+
+        if not isinstance(matrix, Matrix44):
+            raise TypeError("Matrix44Array: Invalid type for 'matrix' argument. Must be a Matrix44.")
+
+        self.values[index] = matrix.toArray()
+
+        return True
+
+
+    # ==============
+    # Math Methods
+    # ==============
+    def multiply(self, other):
+        """Multiplies each matrix in this array with the input matrix or matrices.
+
+        Matches Matrix44.multiply, row i of the result is this[i] * other[i]. A
+        single Matrix44 is broadcast against every matrix.
+
+        Arguments:
+        other -- Matrix44Array / Matrix44, right hand term of the multiplication.
+
+        Return:
+        New Matrix44Array.
+
+        """
+
+        if isinstance(other, Matrix44Array):
+            if len(other) != len(self):
+                raise ValueError("Matrix44Array: arrays must have the same length.")
+
+            otherMatrices = other.getMatrices()
+
+        elif isinstance(other, Matrix44):
+            otherMatrices = np.array(other.toArray(), dtype=np.float64).reshape(4, 4)
+
+        else:
+            raise TypeError("Matrix44Array: Invalid type for 'other' argument. Must be a Matrix44Array or Matrix44.")
+
+        return Matrix44Array.fromArray(np.matmul(self.getMatrices(), otherMatrices))
+
+
+    def determinant(self):
+        """Calculates the determinants of the matrices.
+
+        Return:
+        Array of N determinants.
+
+        """
+
+        return np.linalg.det(self.getMatrices())
+
+
+    def inverse(self):
+        """Inverts each matrix in this array.
+
+        Return:
+        New Matrix44Array with the inverted matrices.
+
+        """
+
+        if np.any(self.determinant() == 0.0):
+            raise ValueError("Matrix44Array: inverse: array contains a singular matrix!")
+
+        return Matrix44Array.fromArray(np.linalg.inv(self.getMatrices()))
+
+
+    def transpose(self):
+        """Flips each matrix diagonally.
+
+        Return:
+        New Matrix44Array with the transposed matrices.
+
+        """
+
+        return Matrix44Array.fromArray(np.transpose(self.getMatrices(), (0, 2, 1)))
+
+
+    def hasShear(self, precision=10e-6):
+        """Checks which matrices contain shear in their upper 3x3 part.
+
+        Arguments:
+        precision -- Float, tolerance on the cosine between the axes.
+
+        Return:
+        Boolean array of N values, True where the axes are not orthogonal.
+
+        """
+
+        axes = self.getMatrices()[:, 0:3, 0:3]
+        lengths = np.sqrt(np.einsum('nij,nij->ni', axes, axes))
+
+        if np.any(lengths == 0.0):
+            raise ValueError("Matrix44Array: hasShear: array contains a zero length axis!")
+
+        units = axes / lengths[:, :, np.newaxis]
+        cosines = np.abs(np.einsum('nij,nkj->nik', units, units))
+
+        return np.any(cosines[:, [0, 0, 1], [1, 2, 2]] > precision, axis=-1)
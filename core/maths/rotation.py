@@ -3,12 +3,13 @@
 Classes:
 Euler -- Euler rotation.
 Quat -- Quaternion rotation.
+FrozenQuat -- Immutable, hashable quaternion rotation.
 """
 
 import math
 from math_object import MathObject
 
-from vec import Vec3
+from vec import Vec3, FrozenVec3
 from matrix import Matrix33
 import mathUtils
 
@@ -16,6 +17,9 @@ import mathUtils
 class Euler(MathObject):
     """Euler rotation object."""
 
+    __fields__ = ('x', 'y', 'z', 'ro')
+    __slots__ = __fields__
+
     roMap = {
                 0:"xyz",
                 1:"xzy",
@@ -25,6 +29,17 @@ class Euler(MathObject):
                 5:"zyx",
             }
 
+    # Axis indices of each rotation order. An order 'abc' is the quaternion
+    # product qa * qb * qc, as built by Quat.setFromEuler.
+    roAxes = {
+                0:(0, 1, 2),
+                1:(0, 2, 1),
+                2:(1, 0, 2),
+                3:(1, 2, 0),
+                4:(2, 0, 1),
+                5:(2, 1, 0),
+            }
+
     def __init__(self, x=None, y=None, z=None, ro=None):
         """Initialize values for x,y,z, and rotation order values."""
 
@@ -38,6 +53,24 @@ class Euler(MathObject):
         self.set(mathUtils.degToRad(x), mathUtils.degToRad(y), mathUtils.degToRad(z), ro)
 
 
+    @classmethod
+    def _fromTrusted(cls, x, y, z, ro):
+        """Creates a Euler from angles in radians without validating them.
+
+        Internal fast path for maths code. The regular constructor takes
+        degrees.
+
+        """
+
+        euler = cls.__new__(cls)
+        euler.x = x
+        euler.y = y
+        euler.z = z
+        euler.ro = ro
+
+        return euler
+
+
     def __str__(self):
         """String representation of Euler object."""
 
@@ -120,18 +153,20 @@ class Euler(MathObject):
                             Vec3(-sz, cz, 0.0),
                             Vec3(0.0, 0.0, 1.0))
 
+        # The rows are the rotated axes, so the first axis of the order is
+        # applied last, matching Quat.setFromEuler.
         if self.ro == 0:
-            return rx.multiply(ry.multiply(rz))
+            return rz.multiply(ry.multiply(rx))
         elif self.ro == 1:
-            return rx.multiply(rz.multiply(ry))
+            return ry.multiply(rz.multiply(rx))
         elif self.ro == 2:
-            return ry.multiply(rx.multiply(rz))
+            return rz.multiply(rx.multiply(ry))
         elif self.ro == 3:
-            return ry.multiply(rz.multiply(rx))
+            return rx.multiply(rz.multiply(ry))
         elif self.ro == 4:
-            return rz.multiply(rx.multiply(ry))
+            return ry.multiply(rx.multiply(rz))
         elif self.ro == 5:
-            return rz.multiply(ry.multiply(rx))
+            return rx.multiply(ry.multiply(rz))
         else:
             raise ValueError("Euler: 'ro' attribute value is not within 0-5.")
 
@@ -144,7 +179,7 @@ class Euler(MathObject):
 
         """
 
-        return Euler(x=self.x, y=self.y, z=self.z, ro=self.ro)
+        return Euler._fromTrusted(self.x, self.y, self.z, self.ro)
 
 
     def equal(self, other):
@@ -185,6 +220,9 @@ class Euler(MathObject):
 class Quat(MathObject):
     """Quaternion Rotation object."""
 
+    __fields__ = ('v', 'w')
+    __slots__ = __fields__
+
     def __init__(self, v=None, w=None):
         super(Quat, self).__init__()
 
@@ -194,12 +232,28 @@ class Quat(MathObject):
         if w is not None and not isinstance(w, (int, float)):
             raise TypeError("Quat: Invalid type for 'w' argument. Must be a int or float.")
 
-        self.v = Vec3()
+        self.v = Vec3._fromTrusted(0.0, 0.0, 0.0)
         self.w = 1.0
 
         self.set(v,w)
 
 
+    @classmethod
+    def _fromTrusted(cls, v, w):
+        """Creates a Quat without validating or copying the arguments.
+
+        Internal fast path for maths code. The Quat takes ownership of v, so it
+        must be a Vec3 that is not referenced anywhere else.
+
+        """
+
+        quat = cls.__new__(cls)
+        quat.v = v
+        quat.w = w
+
+        return quat
+
+
     def __str__(self):
         """Return string version of the Quat object."""
 
@@ -209,15 +263,16 @@ class Quat(MathObject):
     def set(self, v=None, w=None):
         """Sets the quaternion values."""
 
-        if v is None:
-            v = Vec3()
-
         if w is None:
             w = 1.0
         elif type(w) is int:
             w = float(w)
 
-        self.v.set(v.x, v.y, v.z)
+        if v is None:
+            self.v.set(0.0, 0.0, 0.0)
+        else:
+            self.v.set(v.x, v.y, v.z)
+
         self.w = w
 
 
@@ -471,93 +526,109 @@ class Quat(MathObject):
 
 
     def toEuler(self, rotationOrder):
-        """Get a Euler from this quaternion."""
+        """Get a Euler from this quaternion.
 
+        Where the middle axis of the rotation order is at +/-90 degrees the
+        first and last axes are aligned (gimbal lock). The last angle is then
+        set to zero and the first one carries the whole rotation around the
+        shared axis.
 
-        # Kraken Euler rotation order
-        # 0:"xyz",
-        # 1:"xzy",
-        # 2:"yxz",
-        # 3:"yzx",
-        # 4:"zxy",
-        # 5:"zyx",
+        Arguments:
+        rotationOrder -- Integer, Kraken rotation order 0-5.
 
-        self.setUnit()
+        Return:
+        New Euler with the angles in radians.
 
-        ordered = Vec3()
-        if rotationOrder is 5:
-            ordered.set(self.v.x, -self.v.z, self.v.y)
-        elif rotationOrder is 1:
-            ordered.set(self.v.y, -self.v.x, self.v.z)
-        elif rotationOrder is 2:
-            ordered.set(self.v.z, -self.v.y, self.v.x)
-        elif rotationOrder is 3:
-            ordered.set(self.v.x, self.v.y, self.v.z)
-        elif rotationOrder is 0:
-            ordered.set(self.v.z, self.v.x, self.v.y)
-        elif rotationOrder is 4:
-            ordered.set(self.v.y, self.v.z, self.v.x)
-
-        euler = Vec3()
-        test = ordered.x*ordered.y + ordered.z*self.w
-        if test > 0.49999: # singularity at north pole
-            euler.y = 2.0 * math.atan2(ordered.x, self.w)
-            euler.z = Math.PI/2.0
-            euler.x = 0.0
-        elif test < -0.49999: # singularity at south pole
-            euler.y = -2.0 * math.atan2(ordered.x, self.w)
-            euler.z = - Math.PI/2.0
-            euler.x = 0.0
+        """
+
+        if rotationOrder not in Euler.roAxes:
+            raise ValueError("Quat: Invalid 'rotationOrder' argument. Must be within 0-5.")
+
+        a, b, c = Euler.roAxes[rotationOrder]
+        if (b - a) % 3 == 1:
+            sign = 1.0
+        else:
+            sign = -1.0
+
+        # toMatrix33 rows are the rotated axes, r(i, j) reads the transposed
+        # column vector matrix Ra * Rb * Rc.
+        m = self.unit().toMatrix33().toArray()
+        r = lambda i, j: m[j * 3 + i]
+
+        cosMiddle = math.hypot(r(a, a), r(a, b))
+
+        angles = [0.0, 0.0, 0.0]
+        angles[b] = math.atan2(sign * r(a, c), cosMiddle)
+
+        if cosMiddle < 10e-12:
+            angles[a] = math.atan2(sign * r(c, b), r(b, b))
         else:
-            sqx = ordered.x*ordered.x
-            sqy = ordered.y*ordered.y
-            sqz = ordered.z*ordered.z
-            euler.y = math.atan2(2*ordered.y*self.w-2.0*ordered.x*ordered.z, 1.0 - 2.0*sqy - 2.0*sqz)
-            euler.z = math.asin(2*test)
-            euler.x = math.atan2(2*ordered.x*self.w-2.0*ordered.y*ordered.z, 1.0 - 2.0*sqx - 2.0*sqz)
-
-        if rotationOrder is 5:
-            return Euler(euler.x, euler.z, -euler.y, rotationOrder)
-        elif rotationOrder is 1:
-            return Euler(-euler.y, euler.x, euler.z, rotationOrder)
-        elif rotationOrder is 2:
-            return Euler(euler.z, -euler.y, euler.x, rotationOrder)
-        elif rotationOrder is 3:
-            return Euler(euler.x, euler.y, euler.z, rotationOrder)
-        elif rotationOrder is 0:
-            return Euler(euler.y, euler.z, euler.x, rotationOrder)
-        elif rotationOrder is 4:
-            return Euler(euler.z, euler.x, euler.y, rotationOrder)
+            angles[a] = math.atan2(-sign * r(b, c), r(c, c))
+            angles[c] = math.atan2(-sign * r(a, b), r(a, a))
+
+        return Euler._fromTrusted(angles[0], angles[1], angles[2], rotationOrder)
 
 
     def add(self, q):
         """Sum of this quaternion and another quaternion."""
 
-        return Quat(self.v.add(q.v), self.w + q.w)
+        return Quat._fromTrusted(self.v.add(q.v), self.w + q.w)
 
 
     def subtract(self, q):
         """returns the subtraction of this quaternion and another quaternion."""
 
-        return Quat(self.v.subtract(q.v), self.w - q.w)
+        return Quat._fromTrusted(self.v.subtract(q.v), self.w - q.w)
 
 
     def multiply(self, q):
         """returns the product of this quaternion and another quaternion."""
 
-        return Quat(q.v.multiplyByScalar(self.w).add(self.v.multiplyByScalar(q.w)).add(self.v.cross(q.v)), self.w * q.w - self.v.dotProduct(q.v))
+        return self.multiplyInto(q, Quat._fromTrusted(Vec3._fromTrusted(0.0, 0.0, 0.0), 1.0))
+
+
+    def multiplyInto(self, q, out):
+        """Stores the product of this quaternion and another quaternion into out.
+
+        No temporary objects are created and out may be this quaternion or q.
+
+        Arguments:
+        q -- Quat, right hand term of the multiplication.
+        out -- Quat, quaternion that receives the result.
+
+        Return:
+        The out quaternion.
+
+        """
+
+        ax = self.v.x
+        ay = self.v.y
+        az = self.v.z
+        aw = self.w
+        bx = q.v.x
+        by = q.v.y
+        bz = q.v.z
+        bw = q.w
+
+        outV = out.v
+        outV.x = bx * aw + ax * bw + ay * bz - az * by
+        outV.y = by * aw + ay * bw + az * bx - ax * bz
+        outV.z = bz * aw + az * bw + ax * by - ay * bx
+        out.w = aw * bw - (ax * bx + ay * by + az * bz)
+
+        return out
 
 
     def multiplyByScalar(self, s):
         """returns the product of this quaternion and a scalar."""
 
-        return Quat(self.v.multiplyByScalar(s), self.w * s)
+        return Quat._fromTrusted(self.v.multiplyByScalar(s), self.w * s)
 
 
     def divide(self, q):
         """returns the quotient of this quaternion and a quaternion divident"""
 
-        return Quat(self.v.multiplyByScalar(q.w).subtract(q.v.multiplyByScalar(self.w)).subtract(self.v.cross(q.v)), self.w * q.w + self.v.dotProduct(q.v))
+        return Quat._fromTrusted(self.v.multiplyByScalar(q.w).subtract(q.v.multiplyByScalar(self.w)).subtract(self.v.cross(q.v)), self.w * q.w + self.v.dotProduct(q.v))
 
 
     def divideByScalar(self, s):
@@ -572,7 +643,41 @@ class Quat(MathObject):
     def rotateVector(self, v):
         """Rotate Vec3 rotated by this quaternion."""
 
-        return self.multiply(Quat(v, 0.0)).multiply(self.conjugate()).v
+        return self.rotateVectorInto(v, Vec3._fromTrusted(0.0, 0.0, 0.0))
+
+
+    def rotateVectorInto(self, v, out):
+        """Rotates a Vec3 by this quaternion and stores the result into out.
+
+        Evaluates q * v * q.conjugate() in closed form without creating any
+        temporary objects. out may be the input vector.
+
+        Arguments:
+        v -- Vec3, vector to rotate.
+        out -- Vec3, vector that receives the result.
+
+        Return:
+        The out vector.
+
+        """
+
+        qx = self.v.x
+        qy = self.v.y
+        qz = self.v.z
+        qw = self.w
+        vx = v.x
+        vy = v.y
+        vz = v.z
+
+        a = qw * qw - (qx * qx + qy * qy + qz * qz)
+        b = 2.0 * (qx * vx + qy * vy + qz * vz)
+        c = 2.0 * qw
+
+        out.x = a * vx + b * qx + c * (qy * vz - qz * vy)
+        out.y = a * vy + b * qy + c * (qz * vx - qx * vz)
+        out.z = a * vz + b * qz + c * (qx * vy - qy * vx)
+
+        return out
 
 
     def dotProduct(self, q):
@@ -584,7 +689,7 @@ class Quat(MathObject):
     def conjugate(self):
         """returns the conjugate of this quat"""
 
-        return Quat(self.v.negate(), self.w)
+        return Quat._fromTrusted(self.v.negate(), self.w)
 
 
     def inverse(self):
@@ -616,10 +721,87 @@ class Quat(MathObject):
         return self.divideByScalar(length)
 
 
+    def nlerp(self, q, t):
+        """Normalized linear interpolation between this quaternion and q.
+
+        Takes the shortest path. Cheaper than slerp but the angular speed is
+        not constant.
+
+        Arguments:
+        q -- Quat, quaternion to interpolate to.
+        t -- Float, blend value, 0.0 returns this quaternion and 1.0 returns q.
+
+        Return:
+        New unit quaternion.
+
+        """
+
+        if not isinstance(q, Quat):
+            raise TypeError("Quat: Invalid type for 'q' argument. Must be a Quat.")
+
+        if self.dotProduct(q) < 0.0:
+            t2 = -t
+        else:
+            t2 = t
+
+        t1 = 1.0 - t
+        result = Quat._fromTrusted(Vec3._fromTrusted(self.v.x * t1 + q.v.x * t2,
+                                                     self.v.y * t1 + q.v.y * t2,
+                                                     self.v.z * t1 + q.v.z * t2),
+                                   self.w * t1 + q.w * t2)
+        result.setUnit()
+
+        return result
+
+
+    def slerp(self, q, t, shortestPath=True):
+        """Spherical linear interpolation between this quaternion and q.
+
+        Arguments:
+        q -- Quat, quaternion to interpolate to.
+        t -- Float, blend value, 0.0 returns this quaternion and 1.0 returns q.
+        shortestPath -- Boolean, negate q when it lies in the other hemisphere.
+
+        Return:
+        New quaternion.
+
+        """
+
+        if not isinstance(q, Quat):
+            raise TypeError("Quat: Invalid type for 'q' argument. Must be a Quat.")
+
+        cosAngle = self.dotProduct(q)
+        if shortestPath and cosAngle < 0.0:
+            cosAngle = -cosAngle
+            sign = -1.0
+        else:
+            sign = 1.0
+
+        # Fall back to a linear blend when the quaternions are nearly equal.
+        if cosAngle > 0.9995:
+            t1 = 1.0 - t
+            t2 = t * sign
+        else:
+            angle = math.acos(cosAngle)
+            invSinAngle = 1.0 / math.sin(angle)
+            t1 = math.sin((1.0 - t) * angle) * invSinAngle
+            t2 = math.sin(t * angle) * invSinAngle * sign
+
+        result = Quat._fromTrusted(Vec3._fromTrusted(self.v.x * t1 + q.v.x * t2,
+                                                     self.v.y * t1 + q.v.y * t2,
+                                                     self.v.z * t1 + q.v.z * t2),
+                                   self.w * t1 + q.w * t2)
+
+        if cosAngle > 0.9995:
+            result.setUnit()
+
+        return result
+
+
     def clone(self):
         """Creates a copy of this quaternion."""
 
-        return Quat(self.v.clone(), self.w)
+        return Quat._fromTrusted(self.v.clone(), self.w)
 
 
     def equal(self, other):
@@ -647,3 +829,220 @@ class Quat(MathObject):
         return self.v.almostEqual(other.v, precision) and \
                abs(self.w - other.w) < precision
 
+
+class FrozenQuat(Quat):
+    """Immutable, hashable Quaternion Rotation object used for shared constants.
+
+    Methods that return a new quaternion, including clone(), return a regular
+    mutable Quat. Methods that modify the quaternion raise an AttributeError.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, v=None, w=None):
+        if v is not None and not isinstance(v, Vec3):
+            raise TypeError("FrozenQuat: Invalid type for 'v' argument. Must be a Vec3.")
+
+        if w is not None and not isinstance(w, (int, float)):
+            raise TypeError("FrozenQuat: Invalid type for 'w' argument. Must be a int or float.")
+
+        if v is None:
+            v = FrozenVec3(0.0, 0.0, 0.0)
+        elif not isinstance(v, FrozenVec3):
+            v = FrozenVec3(v.x, v.y, v.z)
+
+        if w is None:
+            w = 1.0
+
+        object.__setattr__(self, 'v', v)
+        object.__setattr__(self, 'w', float(w))
+
+
+    def __str__(self):
+        """Return string version of the FrozenQuat object."""
+
+        return "FrozenQuat(" + str(self.v) + "," + str(self.w) + ")"
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenQuat: object is immutable, use clone() to get a Quat.")
+
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenQuat: object is immutable, use clone() to get a Quat.")
+
+
+    def __hash__(self):
+        return hash((self.v, self.w))
+
+
+    def __eq__(self, other):
+        return isinstance(other, FrozenQuat) and self.v == other.v and self.w == other.w
+
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+    def __reduce__(self):
+        return (FrozenQuat, (self.v, self.w))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def jsonEncode(self):
+        """Encodes object to JSON as a regular Quat.
+
+        Return:
+        JSON string.
+
+        """
+
+        return self.clone().jsonEncode()
+
+
+# ===============
+# Helper Methods
+# ===============
+def _quatLog(q):
+    """Returns the vector part of the logarithm of a unit quaternion as a Vec3."""
+
+    length = math.sqrt(q.v.x * q.v.x + q.v.y * q.v.y + q.v.z * q.v.z)
+    if length < 10e-12:
+        return Vec3._fromTrusted(0.0, 0.0, 0.0)
+
+    scale = math.atan2(length, q.w) / length
+
+    return Vec3._fromTrusted(q.v.x * scale, q.v.y * scale, q.v.z * scale)
+
+
+def _quatExp(v):
+    """Returns the unit quaternion exponential of a Vec3 vector part."""
+
+    angle = math.sqrt(v.x * v.x + v.y * v.y + v.z * v.z)
+    if angle < 10e-12:
+        return Quat._fromTrusted(Vec3._fromTrusted(v.x, v.y, v.z), 1.0)
+
+    scale = math.sin(angle) / angle
+
+    return Quat._fromTrusted(Vec3._fromTrusted(v.x * scale, v.y * scale, v.z * scale), math.cos(angle))
+
+
+def _alignQuat(q, reference):
+    """Returns q, or its negation if it lies in the other hemisphere to reference."""
+
+    if q.dotProduct(reference) < 0.0:
+        return q.multiplyByScalar(-1.0)
+
+    return q
+
+
+def squadControlPoint(prevQuat, quat, nextQuat):
+    """Computes the inner control point used by squad at quat.
+
+    Arguments:
+    prevQuat -- Quat, previous key in the sequence.
+    quat -- Quat, key to compute the control point for.
+    nextQuat -- Quat, next key in the sequence.
+
+    Return:
+    New Quat control point.
+
+    """
+
+    invQuat = quat.inverse()
+    logPrev = _quatLog(invQuat.multiply(_alignQuat(prevQuat, quat)))
+    logNext = _quatLog(invQuat.multiply(_alignQuat(nextQuat, quat)))
+
+    return quat.multiply(_quatExp(logPrev.add(logNext).multiplyByScalar(-0.25)))
+
+
+def squad(quat1, quat2, control1, control2, t):
+    """Spherical quadrangle interpolation between quat1 and quat2.
+
+    Gives a C1 continuous curve through a sequence of keys when control1 and
+    control2 are computed with squadControlPoint from the neighbouring keys.
+
+    Arguments:
+    quat1 -- Quat, key to interpolate from.
+    quat2 -- Quat, key to interpolate to.
+    control1 -- Quat, control point of quat1.
+    control2 -- Quat, control point of quat2.
+    t -- Float, blend value between 0.0 and 1.0.
+
+    Return:
+    New Quat.
+
+    """
+
+    keys = quat1.slerp(quat2, t)
+    controls = control1.slerp(control2, t, shortestPath=False)
+
+    return keys.slerp(controls, 2.0 * t * (1.0 - t), shortestPath=False)
+
+
+def averageQuats(quats, weights=None):
+    """Computes the weighted average rotation of a list of quaternions.
+
+    Returns the eigenvector with the largest eigenvalue of sum(w * q * q^T)
+    (Markley et al.), which does not depend on the sign of each quaternion.
+    The matrix is repeatedly squared until it converges to the projection
+    onto that eigenvector.
+
+    Arguments:
+    quats -- List, Quat objects to average.
+    weights -- List, Float weight per quaternion. Defaults to equal weights.
+
+    Return:
+    New unit Quat.
+
+    """
+
+    if len(quats) == 0:
+        raise ValueError("averageQuats: 'quats' argument is empty.")
+
+    if weights is None:
+        weights = [1.0] * len(quats)
+    elif len(weights) != len(quats):
+        raise ValueError("averageQuats: 'weights' and 'quats' must have the same length.")
+
+    components = [(q.v.x, q.v.y, q.v.z, q.w) for q in quats]
+
+    matrix = [[0.0] * 4 for i in xrange(4)]
+    for q, weight in zip(components, weights):
+        for i in xrange(4):
+            for j in xrange(4):
+                matrix[i][j] += weight * q[i] * q[j]
+
+    for iteration in xrange(64):
+        squared = [[sum(matrix[i][k] * matrix[k][j] for k in xrange(4)) for j in xrange(4)] for i in xrange(4)]
+
+        norm = max(abs(x) for row in squared for x in row)
+        if norm < 10e-24:
+            raise ValueError("averageQuats: weights cancel each other out.")
+
+        squared = [[x / norm for x in row] for row in squared]
+        converged = max(abs(a - b) for rowA, rowB in zip(squared, matrix) for a, b in zip(rowA, rowB)) < 10e-15
+        matrix = squared
+
+        if converged:
+            break
+
+    # Every column of the converged matrix is a multiple of the eigenvector.
+    column = max(xrange(4), key=lambda j: matrix[j][j])
+    result = [matrix[i][column] for i in xrange(4)]
+    length = math.sqrt(sum(x * x for x in result))
+
+    reference = components[0]
+    if sum(a * b for a, b in zip(result, reference)) < 0.0:
+        length = -length
+
+    return Quat._fromTrusted(Vec3._fromTrusted(result[0] / length, result[1] / length, result[2] / length),
+                             result[3] / length)
@@ -0,0 +1,575 @@
+"""Kraken - maths.rotation_array module.
+
+Vectorized rotation helpers operating on NumPy arrays. Quaternions are stored
+as Nx4 float64 arrays laid out as (x, y, z, w) to match Quat(v, w).
+
+Functions:
+quatArrayMultiply -- Multiply two arrays of quaternions.
+quatArrayConjugate -- Conjugate an array of quaternions.
+quatArrayInverse -- Invert an array of quaternions.
+quatArrayCanonicalize -- Pick one sign for quaternions representing the same rotation.
+quatArrayRotateVectors -- Rotate an array of vectors by an array of quaternions.
+quatArrayToMatrix33Array -- Convert quaternions to 3x3 rotation matrices.
+matrix33ArrayToQuatArray -- Convert 3x3 rotation matrices to quaternions.
+eulerArrayToQuatArray -- Convert euler angles to quaternions.
+eulerArrayToMatrix33Array -- Convert euler angles to 3x3 rotation matrices.
+quatArrayToEulerArray -- Convert quaternions to euler angles.
+matrix33ArrayToEulerArray -- Convert 3x3 rotation matrices to euler angles.
+quatArrayNlerp -- Normalized linear interpolation of quaternion pairs.
+quatArraySlerp -- Spherical linear interpolation of quaternion pairs.
+quatArraySquadControlPoints -- Squad control points for quaternion keys.
+quatArraySquad -- Spherical quadrangle interpolation of quaternion pairs.
+quatArrayWeightedAverage -- Weighted average of sets of quaternions.
+"""
+
+import numpy as np
+
+from rotation import Euler
+
+
+def quatArrayMultiply(a, b):
+    """Multiplies two arrays of quaternions, matching Quat.multiply.
+
+    Arguments:
+    a -- Array, Nx4 (or 4) quaternions used as the left hand term.
+    b -- Array, Nx4 (or 4) quaternions used as the right hand term.
+
+    Return:
+    Nx4 array of the products.
+
+    """
+
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+
+    av = a[..., 0:3]
+    aw = a[..., 3:4]
+    bv = b[..., 0:3]
+    bw = b[..., 3:4]
+
+    result = np.empty(np.broadcast(a, b).shape, dtype=np.float64)
+    result[..., 0:3] = bv * aw + av * bw + np.cross(av, bv)
+    result[..., 3] = (aw * bw)[..., 0] - np.einsum('...i,...i->...', av, bv)
+
+    return result
+
+
+def quatArrayConjugate(q):
+    """Returns the conjugates of an array of quaternions.
+
+    Arguments:
+    q -- Array, Nx4 quaternions.
+
+    Return:
+    Nx4 array of conjugated quaternions.
+
+    """
+
+    result = np.array(q, dtype=np.float64)
+    result[..., 0:3] *= -1.0
+
+    return result
+
+
+def quatArrayInverse(q):
+    """Returns the inverses of an array of quaternions, matching Quat.inverse.
+
+    Arguments:
+    q -- Array, Nx4 quaternions.
+
+    Return:
+    Nx4 array of inverted quaternions.
+
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+    lengths = np.sqrt(np.einsum('...i,...i->...', q, q))
+
+    if np.any(lengths == 0.0):
+        raise ValueError("quatArrayInverse: Invalid divisor!")
+
+    return quatArrayConjugate(q / lengths[..., np.newaxis])
+
+
+def quatArrayCanonicalize(q):
+    """Flips quaternions so that q and -q end up with the same values.
+
+    The sign is chosen so the first non zero component, in w, x, y, z order,
+    is positive.
+
+    Arguments:
+    q -- Array, Nx4 quaternions.
+
+    Return:
+    Nx4 array of quaternions with canonical signs.
+
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+
+    signs = np.zeros(q.shape[:-1], dtype=np.float64)
+    for axis in (3, 0, 1, 2):
+        signs = np.where(signs == 0.0, np.sign(q[..., axis]), signs)
+
+    signs[signs == 0.0] = 1.0
+
+    return q * signs[..., np.newaxis]
+
+
+def quatArrayRotateVectors(q, v):
+    """Rotates an array of vectors by an array of quaternions.
+
+    Evaluates q * v * q.conjugate() in closed form, matching Quat.rotateVector.
+
+    Arguments:
+    q -- Array, Nx4 (or 4) quaternions.
+    v -- Array, Nx3 (or 3) vectors.
+
+    Return:
+    Nx3 array of rotated vectors.
+
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+
+    u = q[..., 0:3]
+    w = q[..., 3:4]
+
+    uDotV = np.einsum('...i,...i->...', u, v)[..., np.newaxis]
+    uDotU = np.einsum('...i,...i->...', u, u)[..., np.newaxis]
+
+    return (w * w - uDotU) * v + 2.0 * uDotV * u + 2.0 * w * np.cross(u, v)
+
+
+def quatArrayToMatrix33Array(q):
+    """Converts an array of quaternions to rotation matrices.
+
+    The matrices follow the same layout as Quat.toMatrix33, where each row is
+    the rotated axis.
+
+    Arguments:
+    q -- Array, Nx4 quaternions.
+
+    Return:
+    Nx3x3 array of rotation matrices.
+
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+
+    x = q[..., 0]
+    y = q[..., 1]
+    z = q[..., 2]
+    w = q[..., 3]
+
+    xx = x * x
+    xy = x * y
+    xz = x * z
+    xw = x * w
+    yy = y * y
+    yz = y * z
+    yw = y * w
+    zz = z * z
+    zw = z * w
+
+    result = np.empty(q.shape[:-1] + (3, 3), dtype=np.float64)
+    result[..., 0, 0] = 1.0 - 2.0 * (yy + zz)
+    result[..., 0, 1] = 2.0 * (xy + zw)
+    result[..., 0, 2] = 2.0 * (xz - yw)
+
+    result[..., 1, 0] = 2.0 * (xy - zw)
+    result[..., 1, 1] = 1.0 - 2.0 * (xx + zz)
+    result[..., 1, 2] = 2.0 * (yz + xw)
+
+    result[..., 2, 0] = 2.0 * (xz + yw)
+    result[..., 2, 1] = 2.0 * (yz - xw)
+    result[..., 2, 2] = 1.0 - 2.0 * (xx + yy)
+
+    return result
+
+
+def matrix33ArrayToQuatArray(m):
+    """Converts an array of rotation matrices to quaternions.
+
+    The matrices are expected in the Quat.toMatrix33 layout, where each row is
+    the rotated axis, so this is the inverse of quatArrayToMatrix33Array.
+
+    Arguments:
+    m -- Array, Nx3x3 orthonormal rotation matrices.
+
+    Return:
+    Nx4 array of unit quaternions.
+
+    """
+
+    m = np.asarray(m, dtype=np.float64)
+
+    # Transpose into the column layout used by the standard extraction.
+    r00 = m[..., 0, 0]
+    r11 = m[..., 1, 1]
+    r22 = m[..., 2, 2]
+    r01 = m[..., 1, 0]
+    r10 = m[..., 0, 1]
+    r02 = m[..., 2, 0]
+    r20 = m[..., 0, 2]
+    r12 = m[..., 2, 1]
+    r21 = m[..., 1, 2]
+
+    trace = r00 + r11 + r22
+
+    # Candidate magnitudes for each branch, pick the largest for stability.
+    candidates = np.stack([trace, r00, r11, r22], axis=-1)
+    branch = np.argmax(candidates, axis=-1)
+
+    result = np.empty(m.shape[:-2] + (4,), dtype=np.float64)
+
+    sel = branch == 0
+    if np.any(sel):
+        s = 2.0 * np.sqrt(np.maximum(trace[sel] + 1.0, 0.0))
+        result[sel, 3] = 0.25 * s
+        result[sel, 0] = (r21[sel] - r12[sel]) / s
+        result[sel, 1] = (r02[sel] - r20[sel]) / s
+        result[sel, 2] = (r10[sel] - r01[sel]) / s
+
+    sel = branch == 1
+    if np.any(sel):
+        s = 2.0 * np.sqrt(np.maximum(1.0 + r00[sel] - r11[sel] - r22[sel], 0.0))
+        result[sel, 3] = (r21[sel] - r12[sel]) / s
+        result[sel, 0] = 0.25 * s
+        result[sel, 1] = (r01[sel] + r10[sel]) / s
+        result[sel, 2] = (r02[sel] + r20[sel]) / s
+
+    sel = branch == 2
+    if np.any(sel):
+        s = 2.0 * np.sqrt(np.maximum(1.0 + r11[sel] - r00[sel] - r22[sel], 0.0))
+        result[sel, 3] = (r02[sel] - r20[sel]) / s
+        result[sel, 0] = (r01[sel] + r10[sel]) / s
+        result[sel, 1] = 0.25 * s
+        result[sel, 2] = (r12[sel] + r21[sel]) / s
+
+    sel = branch == 3
+    if np.any(sel):
+        s = 2.0 * np.sqrt(np.maximum(1.0 + r22[sel] - r00[sel] - r11[sel], 0.0))
+        result[sel, 3] = (r10[sel] - r01[sel]) / s
+        result[sel, 0] = (r02[sel] + r20[sel]) / s
+        result[sel, 1] = (r12[sel] + r21[sel]) / s
+        result[sel, 2] = 0.25 * s
+
+    lengths = np.sqrt(np.einsum('...i,...i->...', result, result))
+
+    return result / lengths[..., np.newaxis]
+
+
+# =========================
+# Euler Conversion Methods
+# =========================
+def _getRotationOrderAxes(rotationOrder):
+    """Returns the axis indices of a rotation order, validating it."""
+
+    if rotationOrder not in Euler.roAxes:
+        raise ValueError("Invalid 'rotationOrder' argument. Must be within 0-5.")
+
+    return Euler.roAxes[rotationOrder]
+
+
+def eulerArrayToQuatArray(angles, rotationOrder):
+    """Converts an array of euler angles to quaternions, matching Quat.setFromEuler.
+
+    Arguments:
+    angles -- Array, Nx3 (x, y, z) angles in radians.
+    rotationOrder -- Integer, Kraken rotation order 0-5.
+
+    Return:
+    Nx4 array of unit quaternions.
+
+    """
+
+    axes = _getRotationOrderAxes(rotationOrder)
+    angles = np.asarray(angles, dtype=np.float64)
+
+    halfAngles = angles * 0.5
+    sines = np.sin(halfAngles)
+    cosines = np.cos(halfAngles)
+
+    result = None
+    for axis in axes:
+        axisQuats = np.zeros(angles.shape[:-1] + (4,), dtype=np.float64)
+        axisQuats[..., axis] = sines[..., axis]
+        axisQuats[..., 3] = cosines[..., axis]
+
+        if result is None:
+            result = axisQuats
+        else:
+            result = quatArrayMultiply(result, axisQuats)
+
+    return result
+
+
+def eulerArrayToMatrix33Array(angles, rotationOrder):
+    """Converts an array of euler angles to rotation matrices.
+
+    The matrices follow the Quat.toMatrix33 layout, where each row is the
+    rotated axis.
+
+    Arguments:
+    angles -- Array, Nx3 (x, y, z) angles in radians.
+    rotationOrder -- Integer, Kraken rotation order 0-5.
+
+    Return:
+    Nx3x3 array of rotation matrices.
+
+    """
+
+    return quatArrayToMatrix33Array(eulerArrayToQuatArray(angles, rotationOrder))
+
+
+def matrix33ArrayToEulerArray(m, rotationOrder, precision=10e-12):
+    """Converts an array of rotation matrices to euler angles.
+
+    The matrices are expected in the Quat.toMatrix33 layout. Where the middle
+    axis is at +/-90 degrees the first and last axes are aligned (gimbal
+    lock); the last angle is then set to zero and the first one carries the
+    whole rotation around the shared axis.
+
+    Arguments:
+    m -- Array, Nx3x3 rotation matrices.
+    rotationOrder -- Integer, Kraken rotation order 0-5.
+    precision -- Float, threshold on the cosine of the middle angle below which
+                 a matrix is treated as gimbal locked.
+
+    Return:
+    Nx3 array of (x, y, z) angles in radians.
+
+    """
+
+    a, b, c = _getRotationOrderAxes(rotationOrder)
+    if (b - a) % 3 == 1:
+        sign = 1.0
+    else:
+        sign = -1.0
+
+    # Transpose to the column vector matrix R = Ra * Rb * Rc.
+    r = np.swapaxes(np.asarray(m, dtype=np.float64), -1, -2)
+
+    cosMiddle = np.hypot(r[..., a, a], r[..., a, b])
+
+    first = np.arctan2(-sign * r[..., b, c], r[..., c, c])
+    middle = np.arctan2(sign * r[..., a, c], cosMiddle)
+    last = np.arctan2(-sign * r[..., a, b], r[..., a, a])
+
+    locked = cosMiddle < precision
+    if np.any(locked):
+        first[locked] = np.arctan2(sign * r[..., c, b][locked], r[..., b, b][locked])
+        last[locked] = 0.0
+
+    result = np.empty(r.shape[:-2] + (3,), dtype=np.float64)
+    result[..., a] = first
+    result[..., b] = middle
+    result[..., c] = last
+
+    return result
+
+
+def quatArrayToEulerArray(q, rotationOrder, precision=10e-12):
+    """Converts an array of quaternions to euler angles, matching Quat.toEuler.
+
+    Arguments:
+    q -- Array, Nx4 quaternions.
+    rotationOrder -- Integer, Kraken rotation order 0-5.
+    precision -- Float, gimbal lock threshold, see matrix33ArrayToEulerArray.
+
+    Return:
+    Nx3 array of (x, y, z) angles in radians.
+
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+    lengths = np.sqrt(np.einsum('...i,...i->...', q, q))
+
+    if np.any(lengths == 0.0):
+        raise ValueError("quatArrayToEulerArray: Invalid divisor!")
+
+    return matrix33ArrayToEulerArray(quatArrayToMatrix33Array(q / lengths[..., np.newaxis]),
+                                     rotationOrder, precision)
+
+
+# ======================
+# Interpolation Methods
+# ======================
+def _dot(a, b):
+    """Returns the row-wise dot products of two arrays, keeping the last axis."""
+
+    return np.einsum('...i,...i->...', a, b)[..., np.newaxis]
+
+
+def _normalize(q):
+    """Returns the quaternions scaled to unit length."""
+
+    return q / np.sqrt(_dot(q, q))
+
+
+def quatArrayNlerp(a, b, t):
+    """Normalized linear interpolation of quaternion pairs, matching Quat.nlerp.
+
+    Arguments:
+    a -- Array, Nx4 (or 4) quaternions to interpolate from.
+    b -- Array, Nx4 (or 4) quaternions to interpolate to.
+    t -- Float / Array, blend value or N blend values.
+
+    Return:
+    Nx4 array of unit quaternions.
+
+    """
+
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+
+    b = np.where(_dot(a, b) < 0.0, -b, b)
+
+    return _normalize(a * (1.0 - t) + b * t)
+
+
+def quatArraySlerp(a, b, t, shortestPath=True):
+    """Spherical linear interpolation of quaternion pairs, matching Quat.slerp.
+
+    Arguments:
+    a -- Array, Nx4 (or 4) quaternions to interpolate from.
+    b -- Array, Nx4 (or 4) quaternions to interpolate to.
+    t -- Float / Array, blend value or N blend values.
+    shortestPath -- Boolean, negate b where it lies in the other hemisphere.
+
+    Return:
+    Nx4 array of quaternions.
+
+    """
+
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+
+    cosAngle = _dot(a, b)
+    if shortestPath:
+        b = np.where(cosAngle < 0.0, -b, b)
+        cosAngle = np.abs(cosAngle)
+
+    # Fall back to a linear blend where the quaternions are nearly equal.
+    linear = cosAngle > 0.9995
+    angle = np.arccos(np.clip(cosAngle, -1.0, 1.0))
+    sinAngle = np.where(linear, 1.0, np.sin(angle))
+
+    t1 = np.where(linear, 1.0 - t, np.sin((1.0 - t) * angle) / sinAngle)
+    t2 = np.where(linear, t, np.sin(t * angle) / sinAngle)
+
+    result = a * t1 + b * t2
+
+    return np.where(linear, _normalize(result), result)
+
+
+def _quatArrayLog(q):
+    """Returns the vector parts of the logarithms of unit quaternions."""
+
+    v = q[..., 0:3]
+    lengths = np.sqrt(_dot(v, v))
+    scale = np.where(lengths < 10e-12, 1.0,
+                     np.arctan2(lengths, q[..., 3:4]) / np.maximum(lengths, 10e-12))
+
+    return v * scale
+
+
+def _quatArrayExp(v):
+    """Returns the unit quaternion exponentials of vector parts."""
+
+    angles = np.sqrt(_dot(v, v))
+    scale = np.where(angles < 10e-12, 1.0, np.sin(angles) / np.maximum(angles, 10e-12))
+
+    result = np.empty(v.shape[:-1] + (4,), dtype=np.float64)
+    result[..., 0:3] = v * scale
+    result[..., 3] = np.cos(angles)[..., 0]
+
+    return result
+
+
+def quatArraySquadControlPoints(prevQuats, quats, nextQuats):
+    """Computes squad control points, matching squadControlPoint.
+
+    Arguments:
+    prevQuats -- Array, Nx4 previous keys.
+    quats -- Array, Nx4 keys to compute the control points for.
+    nextQuats -- Array, Nx4 next keys.
+
+    Return:
+    Nx4 array of control points.
+
+    """
+
+    prevQuats = np.asarray(prevQuats, dtype=np.float64)
+    quats = np.asarray(quats, dtype=np.float64)
+    nextQuats = np.asarray(nextQuats, dtype=np.float64)
+
+    prevQuats = np.where(_dot(prevQuats, quats) < 0.0, -prevQuats, prevQuats)
+    nextQuats = np.where(_dot(nextQuats, quats) < 0.0, -nextQuats, nextQuats)
+
+    inverse = quatArrayInverse(quats)
+    logPrev = _quatArrayLog(quatArrayMultiply(inverse, prevQuats))
+    logNext = _quatArrayLog(quatArrayMultiply(inverse, nextQuats))
+
+    return quatArrayMultiply(quats, _quatArrayExp((logPrev + logNext) * -0.25))
+
+
+def quatArraySquad(q1, q2, s1, s2, t):
+    """Spherical quadrangle interpolation of quaternion pairs, matching squad.
+
+    Arguments:
+    q1 -- Array, Nx4 keys to interpolate from.
+    q2 -- Array, Nx4 keys to interpolate to.
+    s1 -- Array, Nx4 control points of q1.
+    s2 -- Array, Nx4 control points of q2.
+    t -- Float / Array, blend value or N blend values.
+
+    Return:
+    Nx4 array of quaternions.
+
+    """
+
+    t = np.asarray(t, dtype=np.float64)
+
+    keys = quatArraySlerp(q1, q2, t)
+    controls = quatArraySlerp(s1, s2, t, shortestPath=False)
+
+    return quatArraySlerp(keys, controls, 2.0 * t * (1.0 - t), shortestPath=False)
+
+
+def quatArrayWeightedAverage(quats, weights=None):
+    """Computes weighted average rotations, matching averageQuats.
+
+    Each average is the eigenvector with the largest eigenvalue of
+    sum(w * q * q^T), solved for all sets at once with a stacked eigh.
+
+    Arguments:
+    quats -- Array, NxKx4 sets of K quaternions (or Kx4 for a single set).
+    weights -- Array, NxK (or K) weights. Defaults to equal weights.
+
+    Return:
+    Nx4 (or 4) array of unit quaternions.
+
+    """
+
+    quats = np.asarray(quats, dtype=np.float64)
+
+    if weights is None:
+        weights = np.ones(quats.shape[:-1], dtype=np.float64)
+    else:
+        weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), quats.shape[:-1])
+
+    matrices = np.einsum('...k,...ki,...kj->...ij', weights, quats, quats)
+    eigenValues, eigenVectors = np.linalg.eigh(matrices)
+
+    # eigh sorts the eigenvalues in ascending order.
+    result = eigenVectors[..., :, 3]
+
+    # Keep the sign of the first quaternion of each set.
+    result = np.where(_dot(result, quats[..., 0, :]) < 0.0, -result, result)
+
+    return result
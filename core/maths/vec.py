@@ -3,6 +3,7 @@
 Classes:
 Vec2 -- Vector 2 object.
 Vec3 -- Vector 3 object.
+FrozenVec3 -- Immutable, hashable Vector 3 object.
 Vec4 -- Vector 4 object.
 """
 
@@ -13,6 +14,9 @@ from math_object import MathObject
 class Vec2(MathObject):
     """Vector 2 object."""
 
+    __fields__ = ('x', 'y')
+    __slots__ = __fields__
+
     def __init__(self, x=0.0, y=0.0):
         """Initializes x, y values for Vec2 object."""
 
@@ -22,6 +26,22 @@ class Vec2(MathObject):
         self.set(x=x, y=y)
 
 
+    @classmethod
+    def _fromTrusted(cls, x, y):
+        """Creates a Vec2 without validating the arguments.
+
+        Internal fast path for maths code whose values are already known to be
+        numbers. User code should go through the regular constructor.
+
+        """
+
+        vec = cls.__new__(cls)
+        vec.x = x
+        vec.y = y
+
+        return vec
+
+
     def __str__(self):
         """String representation of the Vec2 object."""
 
@@ -113,7 +133,7 @@ class Vec2(MathObject):
         if not isinstance(vec, Vec2):
             raise TypeError("Vec2: input vec is not of Vec2 type!")
 
-        return Vec2(x=self.x + vec.x, y=self.y + vec.y)
+        return Vec2._fromTrusted(self.x + vec.x, self.y + vec.y)
 
 
     def subtract(self, vec):
@@ -130,7 +150,7 @@ class Vec2(MathObject):
         if not isinstance(vec, Vec2):
             raise TypeError("Vec2: input vec is not of Vec2 type!")
 
-        return Vec2(x=self.x - vec.x, y=self.y - vec.y)
+        return Vec2._fromTrusted(self.x - vec.x, self.y - vec.y)
 
 
     def multiply(self, multiplier):
@@ -147,7 +167,7 @@ class Vec2(MathObject):
         if not isinstance(multiplier, Vec2):
             raise TypeError("Vec2: multiplier is not of Vec2 type!")
 
-        return Vec2(x=self.x * multiplier.x, y=self.y * multiplier.y)
+        return Vec2._fromTrusted(self.x * multiplier.x, self.y * multiplier.y)
 
 
     def multiplyByScalar(self, multiplier):
@@ -164,7 +184,7 @@ class Vec2(MathObject):
         if not isinstance(multiplier, float) and not isinstance(multiplier, int):
             raise TypeError("Vec2: multiplier is not of float / int type!")
 
-        return Vec2(x=self.x * multiplier, y=self.y * multiplier)
+        return Vec2._fromTrusted(self.x * multiplier, self.y * multiplier)
 
 
     def divide(self, divisor):
@@ -181,7 +201,7 @@ class Vec2(MathObject):
         if not isinstance(divisor, Vec2):
             raise TypeError("Vec2: divisor is not of Vec2 type!")
 
-        return Vec2(x=self.x / divisor.x, y=self.y / divisor.y)
+        return Vec2._fromTrusted(self.x / divisor.x, self.y / divisor.y)
 
 
     def divideByScalar(self, divisor):
@@ -198,7 +218,7 @@ class Vec2(MathObject):
         if not isinstance(divisor, float) and not isinstance(divisor, int):
             raise TypeError("Vec2: divisor is not of float / int type!")
 
-        return Vec2(x=self.x / divisor, y=self.y / divisor)
+        return Vec2._fromTrusted(self.x / divisor, self.y / divisor)
 
 
     def negate(self):
@@ -209,7 +229,7 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(x=-self.x, y=-self.y)
+        return Vec2._fromTrusted(-self.x, -self.y)
 
 
     def inverse(self):
@@ -220,7 +240,7 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(x=1.0 / self.x, y=1.0 / self.y)
+        return Vec2._fromTrusted(1.0 / self.x, 1.0 / self.y)
 
 
     def dotProduct(self, vec):
@@ -356,7 +376,7 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self.x, self.y)
+        return Vec2._fromTrusted(self.x, self.y)
 
 
     def equal(self, other):
@@ -385,6 +405,9 @@ class Vec2(MathObject):
 class Vec3(MathObject):
     """Vector 3 object."""
 
+    __fields__ = ('x', 'y', 'z')
+    __slots__ = __fields__
+
     def __init__(self, x=0.0, y=0.0, z=0.0):
         """Initializes x, y, z values for Vec3 object."""
 
@@ -395,6 +418,23 @@ class Vec3(MathObject):
         self.set(x=x, y=y, z=z)
 
 
+    @classmethod
+    def _fromTrusted(cls, x, y, z):
+        """Creates a Vec3 without validating the arguments.
+
+        Internal fast path for maths code whose values are already known to be
+        numbers. User code should go through the regular constructor.
+
+        """
+
+        vec = cls.__new__(cls)
+        vec.x = x
+        vec.y = y
+        vec.z = z
+
+        return vec
+
+
     def __str__(self):
         """String representation of the Vec3 object."""
 
@@ -491,7 +531,7 @@ class Vec3(MathObject):
         if not isinstance(vec, Vec3):
             raise TypeError("Vec3: input vec is not of Vec3 type!")
 
-        return Vec3(x=self.x + vec.x, y=self.y + vec.y, z=self.z + vec.z)
+        return Vec3._fromTrusted(self.x + vec.x, self.y + vec.y, self.z + vec.z)
 
 
     def subtract(self, vec):
@@ -508,7 +548,7 @@ class Vec3(MathObject):
         if not isinstance(vec, Vec3):
             raise TypeError("Vec3: input vec is not of Vec3 type!")
 
-        return Vec3(x=self.x - vec.x, y=self.y - vec.y, z=self.z - vec.z)
+        return Vec3._fromTrusted(self.x - vec.x, self.y - vec.y, self.z - vec.z)
 
 
     def multiply(self, multiplier):
@@ -525,7 +565,7 @@ class Vec3(MathObject):
         if not isinstance(multiplier, Vec3):
             raise TypeError("Vec3: multiplier is not of Vec3 type!")
 
-        return Vec3(x=self.x * multiplier.x, y=self.y * multiplier.y, z=self.z * multiplier.z)
+        return Vec3._fromTrusted(self.x * multiplier.x, self.y * multiplier.y, self.z * multiplier.z)
 
 
     def multiplyByScalar(self, multiplier):
@@ -542,7 +582,7 @@ class Vec3(MathObject):
         if not isinstance(multiplier, float) and not isinstance(multiplier, int):
             raise TypeError("Vec3: multiplier is not of float / int type!")
 
-        return Vec3(x=self.x * multiplier, y=self.y * multiplier, z=self.z * multiplier)
+        return Vec3._fromTrusted(self.x * multiplier, self.y * multiplier, self.z * multiplier)
 
 
     def divide(self, divisor):
@@ -559,7 +599,7 @@ class Vec3(MathObject):
         if not isinstance(divisor, Vec3):
             raise TypeError("Vec3: divisor is not of Vec3 type!")
 
-        return Vec3(x=self.x / divisor.x, y=self.y / divisor.y, z=self.z / divisor.z)
+        return Vec3._fromTrusted(self.x / divisor.x, self.y / divisor.y, self.z / divisor.z)
 
 
     def divideByScalar(self, divisor):
@@ -576,7 +616,7 @@ class Vec3(MathObject):
         if not isinstance(divisor, float) and not isinstance(divisor, int):
             raise TypeError("Vec3: divisor is not of float / int type!")
 
-        return Vec3(x=self.x / divisor, y=self.y / divisor, z=self.z / divisor)
+        return Vec3._fromTrusted(self.x / divisor, self.y / divisor, self.z / divisor)
 
 
     def negate(self):
@@ -587,7 +627,7 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(x=-self.x, y=-self.y, z=-self.z)
+        return Vec3._fromTrusted(-self.x, -self.y, -self.z)
 
 
     def inverse(self):
@@ -598,7 +638,122 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(x=1.0 / self.x, y=1.0 / self.y, z=1.0 / self.z)
+        return Vec3._fromTrusted(1.0 / self.x, 1.0 / self.y, 1.0 / self.z)
+
+
+    # =================
+    # In-Place Methods
+    # =================
+    def addInPlace(self, vec):
+        """Adds input vector to this vector without allocating a new vector.
+
+        Arguments:
+        vec -- Vec3, second term to use in summation operation.
+
+        Return:
+        This vector.
+
+        """
+
+        self.x += vec.x
+        self.y += vec.y
+        self.z += vec.z
+
+        return self
+
+
+    def subtractInPlace(self, vec):
+        """Subtracts input vector from this vector without allocating a new vector.
+
+        Arguments:
+        vec -- Vec3, second term to use in subtraction operation.
+
+        Return:
+        This vector.
+
+        """
+
+        self.x -= vec.x
+        self.y -= vec.y
+        self.z -= vec.z
+
+        return self
+
+
+    def multiplyInPlace(self, multiplier):
+        """Multiplies this vector component-wise by input vector in place.
+
+        Arguments:
+        multiplier -- Vec3, second term to use in multiplication operation.
+
+        Return:
+        This vector.
+
+        """
+
+        self.x *= multiplier.x
+        self.y *= multiplier.y
+        self.z *= multiplier.z
+
+        return self
+
+
+    def multiplyByScalarInPlace(self, multiplier):
+        """Multiplies this vector by multiplier in place.
+
+        Arguments:
+        multiplier -- Float, number to multiply this vector by.
+
+        Return:
+        This vector.
+
+        """
+
+        self.x *= multiplier
+        self.y *= multiplier
+        self.z *= multiplier
+
+        return self
+
+
+    def negateInPlace(self):
+        """Negates this vector in place.
+
+        Return:
+        This vector.
+
+        """
+
+        self.x = -self.x
+        self.y = -self.y
+        self.z = -self.z
+
+        return self
+
+
+    def crossInto(self, vec, out):
+        """Cross product of this vector and input vector stored into out.
+
+        out may be this vector or the input vector.
+
+        Arguments:
+        vec -- Vec3, second term to use in cross product operation.
+        out -- Vec3, vector that receives the result.
+
+        Return:
+        The out vector.
+
+        """
+
+        x = self.y * vec.z - self.z * vec.y
+        y = self.z * vec.x - self.x * vec.z
+        z = self.x * vec.y - self.y * vec.x
+
+        out.x = x
+        out.y = y
+        out.z = z
+
+        return out
 
 
     def dotProduct(self, vec):
@@ -632,7 +787,7 @@ class Vec3(MathObject):
         if not isinstance(vec, Vec3):
             raise TypeError("Vec3: input vec is not of Vec3 type!")
 
-        return Vec3(self.y * vec.z - self.z * vec.y, self.z * vec.x - self.x * vec.z, self.x * vec.y - self.y * vec.x)
+        return Vec3._fromTrusted(self.y * vec.z - self.z * vec.y, self.z * vec.x - self.x * vec.z, self.x * vec.y - self.y * vec.x)
 
 
     def length(self):
@@ -741,7 +896,7 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self.x, self.y, self.z)
+        return Vec3._fromTrusted(self.x, self.y, self.z)
 
 
     def equal(self, other):
@@ -768,9 +923,84 @@ class Vec3(MathObject):
 
 
 
+class FrozenVec3(Vec3):
+    """Immutable, hashable Vector 3 object used for shared constants.
+
+    Methods that return a new vector, including clone(), return a regular
+    mutable Vec3. Methods that modify the vector raise an AttributeError.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        """Initializes x, y, z values for FrozenVec3 object."""
+
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)) or \
+           not isinstance(z, (int, float)):
+            raise TypeError("FrozenVec3 arguments are not of float / int type!")
+
+        object.__setattr__(self, 'x', x)
+        object.__setattr__(self, 'y', y)
+        object.__setattr__(self, 'z', z)
+
+
+    def __str__(self):
+        """String representation of the FrozenVec3 object."""
+
+        return "FrozenVec3(" + str(self.x) + "," + str(self.y) + "," + str(self.z) + ")"
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenVec3: object is immutable, use clone() to get a Vec3.")
+
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenVec3: object is immutable, use clone() to get a Vec3.")
+
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+
+    def __eq__(self, other):
+        return isinstance(other, FrozenVec3) and \
+               self.x == other.x and self.y == other.y and self.z == other.z
+
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+    def __reduce__(self):
+        return (FrozenVec3, (self.x, self.y, self.z))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def jsonEncode(self):
+        """Encodes object to JSON as a regular Vec3.
+
+        Return:
+        JSON string.
+
+        """
+
+        return self.clone().jsonEncode()
+
+
 class Vec4(MathObject):
     """Vector 4 object."""
 
+    __fields__ = ('x', 'y', 'z', 'w')
+    __slots__ = __fields__
+
     def __init__(self, x=0.0, y=0.0, z=0.0, w=0.0):
         """Initializes x, y, z values for Vec4 object."""
 
@@ -782,6 +1012,24 @@ class Vec4(MathObject):
         self.set(x=x, y=y, z=z, w=w)
 
 
+    @classmethod
+    def _fromTrusted(cls, x, y, z, w):
+        """Creates a Vec4 without validating the arguments.
+
+        Internal fast path for maths code whose values are already known to be
+        numbers. User code should go through the regular constructor.
+
+        """
+
+        vec = cls.__new__(cls)
+        vec.x = x
+        vec.y = y
+        vec.z = z
+        vec.w = w
+
+        return vec
+
+
     def __str__(self):
         """String representation of the Vec4 object."""
 
@@ -883,7 +1131,7 @@ class Vec4(MathObject):
         if not isinstance(vec, Vec4):
             raise TypeError("Vec4: input vec is not of Vec4 type!")
 
-        return Vec4(x=self.x + vec.x, y=self.y + vec.y, z=self.z + vec.z, w=self.w + vec.w)
+        return Vec4._fromTrusted(self.x + vec.x, self.y + vec.y, self.z + vec.z, self.w + vec.w)
 
 
     def subtract(self, vec):
@@ -900,7 +1148,7 @@ class Vec4(MathObject):
         if not isinstance(vec, Vec4):
             raise TypeError("Vec4: input vec is not of Vec4 type!")
 
-        return Vec4(x=self.x - vec.x, y=self.y - vec.y, z=self.z - vec.z, w=self.w - vec.w)
+        return Vec4._fromTrusted(self.x - vec.x, self.y - vec.y, self.z - vec.z, self.w - vec.w)
 
 
     def multiply(self, multiplier):
@@ -917,7 +1165,7 @@ class Vec4(MathObject):
         if not isinstance(multiplier, Vec4):
             raise TypeError("Vec4: multiplier is not of Vec4 type!")
 
-        return Vec4(x=self.x * multiplier.x, y=self.y * multiplier.y, z=self.z * multiplier.z, w=self.w * multiplier.w)
+        return Vec4._fromTrusted(self.x * multiplier.x, self.y * multiplier.y, self.z * multiplier.z, self.w * multiplier.w)
 
 
     def multiplyByScalar(self, multiplier):
@@ -934,7 +1182,7 @@ class Vec4(MathObject):
         if not isinstance(multiplier, float) and not isinstance(multiplier, int):
             raise TypeError("Vec4: multiplier is not of float / int type!")
 
-        return Vec4(x=self.x * multiplier, y=self.y * multiplier, z=self.z * multiplier, w=self.w * multiplier)
+        return Vec4._fromTrusted(self.x * multiplier, self.y * multiplier, self.z * multiplier, self.w * multiplier)
 
 
     def divide(self, divisor):
@@ -951,7 +1199,7 @@ class Vec4(MathObject):
         if not isinstance(divisor, Vec4):
             raise TypeError("Vec4: divisor is not of Vec4 type!")
 
-        return Vec4(x=self.x / divisor.x, y=self.y / divisor.y, z=self.z / divisor.z, w=self.w / divisor.w)
+        return Vec4._fromTrusted(self.x / divisor.x, self.y / divisor.y, self.z / divisor.z, self.w / divisor.w)
 
 
     def divideByScalar(self, divisor):
@@ -968,7 +1216,7 @@ class Vec4(MathObject):
         if not isinstance(divisor, float) and not isinstance(divisor, int):
             raise TypeError("Vec4: divisor is not of float / int type!")
 
-        return Vec4(x=self.x / divisor, y=self.y / divisor, z=self.z / divisor, w=self.w / divisor)
+        return Vec4._fromTrusted(self.x / divisor, self.y / divisor, self.z / divisor, self.w / divisor)
 
 
     def negate(self):
@@ -979,7 +1227,7 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(x=-self.x, y=-self.y, z=-self.z, w=-self.w)
+        return Vec4._fromTrusted(-self.x, -self.y, -self.z, -self.w)
 
 
     def inverse(self):
@@ -990,7 +1238,7 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(x=1.0 / self.x, y=1.0 / self.y, z=1.0 / self.z, w=1.0 / self.w)
+        return Vec4._fromTrusted(1.0 / self.x, 1.0 / self.y, 1.0 / self.z, 1.0 / self.w)
 
 
     def dotProduct(self, vec):
@@ -1111,7 +1359,7 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self.x, self.y, self.z, self.w)
+        return Vec4._fromTrusted(self.x, self.y, self.z, self.w)
 
 
     def equal(self, other):
@@ -2,27 +2,54 @@
 
 Classes:
 Xfo -- Transform.
+FrozenXfo -- Immutable, hashable transform.
+
+Functions:
+xfoFromDirAndUpV -- Creates a transform aiming from a base to a target.
+mirrorXfo -- Mirrors a transform across an axis plane.
 """
 
 from math_object import MathObject
-from vec import Vec3
-from rotation import Quat
+from vec import Vec3, FrozenVec3
+from rotation import Quat, FrozenQuat
 from matrix import Matrix33, Matrix44
+import mathUtils
 
 
 class Xfo(MathObject):
     """Transform object."""
 
+    __fields__ = ('scl', 'rot', 'tr', 'ro')
+    __slots__ = __fields__
+
     def __init__(self, scl=None, rot=None, tr=None, ro=0):
         super(Xfo, self).__init__()
-        self.scl = Vec3(1,1,1)
-        self.rot = Quat()
-        self.tr = Vec3()
+        self.scl = Vec3._fromTrusted(1, 1, 1)
+        self.rot = Quat._fromTrusted(Vec3._fromTrusted(0.0, 0.0, 0.0), 1.0)
+        self.tr = Vec3._fromTrusted(0.0, 0.0, 0.0)
         self.ro = 0
 
         self.set(scl=scl, rot=rot, tr=tr, ro=ro)
 
 
+    @classmethod
+    def _fromTrusted(cls, scl, rot, tr, ro=0):
+        """Creates a Xfo without validating or copying the arguments.
+
+        Internal fast path for maths code. The Xfo takes ownership of scl, rot
+        and tr, so they must not be referenced anywhere else.
+
+        """
+
+        xfo = cls.__new__(cls)
+        xfo.scl = scl
+        xfo.rot = rot
+        xfo.tr = tr
+        xfo.ro = ro
+
+        return xfo
+
+
     def __str__(self):
         """String representation of Transform."""
 
@@ -66,17 +93,20 @@ class Xfo(MathObject):
             raise TypeError("Xfo: Invalid type for 'tr' argument. Must be a Vec3.")
 
         if scl is None:
-            scl = Vec3(1,1,1)
+            self.scl.set(1, 1, 1)
+        else:
+            self.scl.set(scl.x, scl.y, scl.z)
 
         if rot is None:
-            rot = Quat()
+            self.rot.set()
+        else:
+            self.rot.set(rot.v, rot.w)
 
         if tr is None:
-            tr = Vec3()
+            self.tr.set(0.0, 0.0, 0.0)
+        else:
+            self.tr.set(tr.x, tr.y, tr.z)
 
-        self.scl.set(scl.x, scl.y, scl.z)
-        self.rot.set(rot.v, rot.w)
-        self.tr.set(tr.x, tr.y, tr.z)
         self.ro = ro
 
         return self
@@ -101,38 +131,50 @@ class Xfo(MathObject):
         return True
 
 
-    def setFromMatrix44(self, mat44):
+    def setFromMatrix44(self, mat44, allowShear=False):
         """Set Xfo values from a Matrix44 object.
 
+        Rows 0-2 of the matrix hold the scaled axes and row 3 the translation.
+
         Arguments:
         mat44 -- Matrix44 object.
+        allowShear -- Boolean, discard shear instead of raising a ValueError.
 
         Return:
-        True if successful.
+        self
 
         """
 
         if not isinstance(mat44, Matrix44):
             raise TypeError("Xfo: setFromMatrix44: Invalid type for 'mat44' argument. Must be a Matrix44.")
 
-        mat44Array = mat44.toArray()
+        scl, rotation, tr = mat44.decompose(allowShear=allowShear)
 
-        mat33 = Matrix33()
-        mat33.setFromArray([mat44Array[0],mat44Array[1],mat44Array[2],
-                             mat44Array[4],mat44Array[5],mat44Array[6],
-                             mat44Array[8],mat44Array[9],mat44Array[10]])
+        self.scl.copy(scl)
+        self.rot.setFromMatrix33(rotation.transpose())
+        self.tr.copy(tr)
 
-        self.setFromMatrix33(mat33)
+        return self
 
-        self.tr.x = mat44Array[12]
-        self.tr.y = mat44Array[13]
-        self.tr.z = mat44Array[14]
 
-        self.scl.x = Vec3(mat44Array[0],mat44Array[1],mat44Array[2]).length()
-        self.scl.y = Vec3(mat44Array[4],mat44Array[5],mat44Array[6]).length()
-        self.scl.z = Vec3(mat44Array[8],mat44Array[9],mat44Array[10]).length()
+    def toMatrix44(self):
+        """Converts this Xfo to a Matrix44.
 
-        return self
+        Return:
+        New Matrix44 with the scaled axes in rows 0-2 and the translation in
+        row 3.
+
+        """
+
+        rotation = self.rot.toMatrix33()
+
+        mat44 = Matrix44()
+        mat44.setFromArray([rotation.row0.x * self.scl.x, rotation.row0.y * self.scl.x, rotation.row0.z * self.scl.x, 0.0,
+                            rotation.row1.x * self.scl.y, rotation.row1.y * self.scl.y, rotation.row1.z * self.scl.y, 0.0,
+                            rotation.row2.x * self.scl.z, rotation.row2.y * self.scl.z, rotation.row2.z * self.scl.z, 0.0,
+                            self.tr.x, self.tr.y, self.tr.z, 1.0])
+
+        return mat44
 
 
     def setFromVectors(self, inVec1, inVec2, inVec3, translation):
@@ -164,7 +206,7 @@ class Xfo(MathObject):
 
         """
 
-        self.set(Vec3(), Vec3(), Vec3())
+        self.set()
 
         return self
 
@@ -172,18 +214,119 @@ class Xfo(MathObject):
     def multiply(self, xfo):
         """Multiply this transform with input transform.
 
+        The input transform is treated as a child expressed in the space of
+        this transform, so parent.multiply(local) returns the world transform.
+
+        Arguments:
+        xfo -- Xfo, right hand term of the multiplication.
+
         Return:
         New transform.
 
         """
 
-        resultXfo = Xfo()
+        return self.multiplyInto(xfo, Xfo._fromTrusted(Vec3._fromTrusted(1.0, 1.0, 1.0),
+                                                      Quat._fromTrusted(Vec3._fromTrusted(0.0, 0.0, 0.0), 1.0),
+                                                      Vec3._fromTrusted(0.0, 0.0, 0.0)))
+
+
+    def multiplyInto(self, xfo, out):
+        """Multiply this transform with input transform and store it into out.
+
+        Arguments:
+        xfo -- Xfo, right hand term of the multiplication.
+        out -- Xfo, transform that receives the result. May be this Xfo or the
+               input transform.
+
+        Return:
+        The out transform.
+
+        """
+
+        trX = self.tr.x
+        trY = self.tr.y
+        trZ = self.tr.z
+
+        out.tr.x = self.scl.x * xfo.tr.x
+        out.tr.y = self.scl.y * xfo.tr.y
+        out.tr.z = self.scl.z * xfo.tr.z
+        self.rot.rotateVectorInto(out.tr, out.tr)
+        out.tr.x += trX
+        out.tr.y += trY
+        out.tr.z += trZ
+
+        self.rot.multiplyInto(xfo.rot, out.rot)
+
+        out.scl.x = self.scl.x * xfo.scl.x
+        out.scl.y = self.scl.y * xfo.scl.y
+        out.scl.z = self.scl.z * xfo.scl.z
 
-        resultXfo.scl = self.scl.multiply(xfo.scl)
-        resultXfo.rot = self.rot.multiply(xfo.rot)
-        resultXfo.tr = self.tr.add(xfo.tr)
+        return out
 
-        return resultXfo
+
+    def inverse(self):
+        """Inverts this transform.
+
+        As with any scale, rotation, translation transform, the result is only
+        exact for uniform scale.
+
+        Return:
+        New transform that is the inverse of this one.
+
+        """
+
+        if mathUtils.checkDivisor(self.scl.x) or mathUtils.checkDivisor(self.scl.y) or \
+           mathUtils.checkDivisor(self.scl.z):
+            raise ValueError("Xfo: inverse: scale contains zero values!")
+
+        scl = Vec3._fromTrusted(1.0 / self.scl.x, 1.0 / self.scl.y, 1.0 / self.scl.z)
+        rot = self.rot.inverse()
+        tr = rot.rotateVectorInto(self.tr, Vec3._fromTrusted(0.0, 0.0, 0.0))
+        tr.x *= -scl.x
+        tr.y *= -scl.y
+        tr.z *= -scl.z
+
+        return Xfo._fromTrusted(scl, rot, tr, self.ro)
+
+
+    def localTo(self, parent):
+        """Expresses this world transform relative to a parent world transform.
+
+        Arguments:
+        parent -- Xfo, world transform of the parent.
+
+        Return:
+        New transform, the local transform under parent.
+
+        """
+
+        if not isinstance(parent, Xfo):
+            raise TypeError("Xfo: Invalid type for 'parent' argument. Must be a Xfo.")
+
+        local = parent.inverse().multiply(self)
+        local.ro = self.ro
+
+        return local
+
+
+    def worldTo(self, parent):
+        """Returns the world transform of this local transform under a parent.
+
+        Arguments:
+        parent -- Xfo, world transform of the parent.
+
+        Return:
+        New transform, the world transform.
+
+        """
+
+        if not isinstance(parent, Xfo):
+            raise TypeError("Xfo: Invalid type for 'parent' argument. Must be a Xfo.")
+
+        world = parent.multiply(self)
+        world.ro = self.ro
+
+        return world
 
 
     def transformVector(self, v):
@@ -197,7 +340,38 @@ class Xfo(MathObject):
 
         """
 
-        return self.rot.rotateVector(v.multiply(self.scl)).add(self.tr)
+        return self.transformVectorInto(v, Vec3._fromTrusted(0.0, 0.0, 0.0))
+
+
+    def transformVectorInto(self, v, out):
+        """Transforms a vector by this xfo and stores the result into out.
+
+        Arguments:
+        v -- Vec3, vector to transform.
+        out -- Vec3, vector that receives the result. May be the input vector.
+
+        Return:
+        The out vector.
+
+        """
+
+        out.x = v.x * self.scl.x
+        out.y = v.y * self.scl.y
+        out.z = v.z * self.scl.z
+        self.rot.rotateVectorInto(out, out)
+
+        return out.addInPlace(self.tr)
+
+
+    def clone(self):
+        """Clone the Xfo into a new Xfo.
+
+        Return:
+        New Xfo with the same values as this Xfo.
+
+        """
+
+        return Xfo._fromTrusted(self.scl.clone(), self.rot.clone(), self.tr.clone(), self.ro)
 
 
     def isIdentity(self):
@@ -208,7 +382,7 @@ class Xfo(MathObject):
 
         """
 
-        return self.isEqual(Xfo())
+        return self.isEqual(IDENTITY_XFO)
 
 
     def isEqual(self, other):
@@ -227,6 +401,126 @@ class Xfo(MathObject):
                self.tr.equal(other.tr)
 
 
+    def quantizedHash(self, precision=10e-6):
+        """Hashes the transform values snapped to the given precision.
+
+        The rotation sign is made canonical first, so q and -q hash the same.
+        The digest matches XfoArray.quantizedHash for a single transform.
+
+        Arguments:
+        precision -- Float, size of the quantization step.
+
+        Return:
+        String, hex digest of the quantized transform.
+
+        """
+
+        rot = [self.rot.v.x, self.rot.v.y, self.rot.v.z, self.rot.w]
+        for value in (rot[3], rot[0], rot[1], rot[2]):
+            if value != 0.0:
+                if value < 0.0:
+                    rot = [-x for x in rot]
+
+                break
+
+        return mathUtils.quantizedHash([self.scl.x, self.scl.y, self.scl.z] + rot +
+                                       [self.tr.x, self.tr.y, self.tr.z], precision)
+
+
+class FrozenXfo(Xfo):
+    """Immutable, hashable Transform object used for shared constants.
+
+    Methods that return a new transform, including clone(), return a regular
+    mutable Xfo. Methods that modify the transform raise an AttributeError.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, scl=None, rot=None, tr=None, ro=0):
+        if scl is not None and not isinstance(scl, Vec3):
+            raise TypeError("FrozenXfo: Invalid type for 'scl' argument. Must be a Vec3.")
+
+        if rot is not None and not isinstance(rot, Quat):
+            raise TypeError("FrozenXfo: Invalid type for 'rot' argument. Must be a Quat.")
+
+        if tr is not None and not isinstance(tr, Vec3):
+            raise TypeError("FrozenXfo: Invalid type for 'tr' argument. Must be a Vec3.")
+
+        if scl is None:
+            scl = FrozenVec3(1, 1, 1)
+        elif not isinstance(scl, FrozenVec3):
+            scl = FrozenVec3(scl.x, scl.y, scl.z)
+
+        if rot is None:
+            rot = FrozenQuat()
+        elif not isinstance(rot, FrozenQuat):
+            rot = FrozenQuat(rot.v, rot.w)
+
+        if tr is None:
+            tr = FrozenVec3(0.0, 0.0, 0.0)
+        elif not isinstance(tr, FrozenVec3):
+            tr = FrozenVec3(tr.x, tr.y, tr.z)
+
+        object.__setattr__(self, 'scl', scl)
+        object.__setattr__(self, 'rot', rot)
+        object.__setattr__(self, 'tr', tr)
+        object.__setattr__(self, 'ro', ro)
+
+
+    def __str__(self):
+        """Return string version of the FrozenXfo object."""
+
+        return "FrozenXfo(" + str(self.scl) + "," + str(self.rot) + "," + str(self.tr) + ")"
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenXfo: object is immutable, use clone() to get a Xfo.")
+
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenXfo: object is immutable, use clone() to get a Xfo.")
+
+
+    def __hash__(self):
+        return hash((self.scl, self.rot, self.tr, self.ro))
+
+
+    def __eq__(self, other):
+        return isinstance(other, FrozenXfo) and self.scl == other.scl and \
+            self.rot == other.rot and self.tr == other.tr and self.ro == other.ro
+
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+    def __reduce__(self):
+        return (FrozenXfo, (self.scl, self.rot, self.tr, self.ro))
+
+
+    def __copy__(self):
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def jsonEncode(self):
+        """Encodes object to JSON as a regular Xfo.
+
+        Return:
+        JSON string.
+
+        """
+
+        return self.clone().jsonEncode()
+
+
+IDENTITY_XFO = FrozenXfo()
+
+
 # ===============
 # Helper Methods
 # ===============
@@ -252,3 +546,37 @@ def xfoFromDirAndUpV(base, target, upV):
 
     return outXfo
 
+
+
+def mirrorXfo(xfo, axis='X'):
+    """Mirrors a transform across the plane perpendicular to an axis.
+
+    The position is reflected and the rotation is reflected into a proper
+    rotation, so a component built on one side can be moved to the other.
+
+    Arguments:
+    xfo -- Xfo, transform to mirror.
+    axis -- String, axis perpendicular to the mirror plane: 'X', 'Y' or 'Z'.
+
+    Return:
+    Xfo, mirrored transform.
+
+    """
+
+    if axis not in ('X', 'Y', 'Z'):
+        raise ValueError("mirrorXfo: Invalid value for 'axis' argument. Must be 'X', 'Y' or 'Z'.")
+
+    index = 'XYZ'.index(axis)
+
+    tr = [xfo.tr.x, xfo.tr.y, xfo.tr.z]
+    tr[index] = -tr[index]
+
+    # Reflecting R as M * R * M negates the quaternion axis components that
+    # lie in the mirror plane.
+    v = [-xfo.rot.v.x, -xfo.rot.v.y, -xfo.rot.v.z]
+    v[index] = -v[index]
+
+    return Xfo._fromTrusted(Vec3._fromTrusted(xfo.scl.x, xfo.scl.y, xfo.scl.z),
+                            Quat._fromTrusted(Vec3._fromTrusted(*v), xfo.rot.w),
+                            Vec3._fromTrusted(*tr),
+                            xfo.ro)
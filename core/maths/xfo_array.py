@@ -0,0 +1,494 @@
+"""Kraken - maths.xfo_array module.
+
+Classes:
+XfoArray -- Contiguous array of transforms.
+"""
+
+import hashlib
+
+import numpy as np
+
+from vec import Vec3
+from rotation import Quat
+from xfo import Xfo
+from rotation_array import quatArrayMultiply
+from rotation_array import quatArrayInverse
+from rotation_array import quatArrayCanonicalize
+from rotation_array import quatArrayRotateVectors
+from rotation_array import quatArrayToMatrix33Array
+from rotation_array import matrix33ArrayToQuatArray
+
+
+class XfoArray(object):
+    """Array of transforms stored as contiguous float64 arrays.
+
+    Scale is stored as an Nx3 array, rotation as an Nx4 array laid out as
+    (x, y, z, w) and translation as an Nx3 array.
+
+    """
+
+    def __init__(self, count=0):
+        """Initializes the array with count identity transforms."""
+
+        super(XfoArray, self).__init__()
+
+        if not isinstance(count, (int, long)) or count < 0:
+            raise TypeError("XfoArray: Invalid type for 'count' argument. Must be a positive int.")
+
+        self.scl = np.ones((count, 3), dtype=np.float64)
+        self.rot = np.zeros((count, 4), dtype=np.float64)
+        self.rot[:, 3] = 1.0
+        self.tr = np.zeros((count, 3), dtype=np.float64)
+
+
+    def __str__(self):
+        """String representation of the XfoArray."""
+
+        return "XfoArray(count=" + str(len(self)) + ")"
+
+
+    def __len__(self):
+        """Returns the number of transforms in the array."""
+
+        return self.tr.shape[0]
+
+
+    def __getitem__(self, index):
+        """Returns an Xfo view of the transform at the given index."""
+
+        return self.getXfo(index)
+
+
+    # ======================
+    # Construction Methods
+    # ======================
+    @classmethod
+    def fromArrays(cls, scl, rot, tr):
+        """Creates an XfoArray from existing scale, rotation and translation arrays.
+
+        Arguments:
+        scl -- Array, Nx3 scale values.
+        rot -- Array, Nx4 quaternion values as (x, y, z, w).
+        tr -- Array, Nx3 translation values.
+
+        Return:
+        New XfoArray.
+
+        """
+
+        scl = np.array(scl, dtype=np.float64).reshape(-1, 3)
+        rot = np.array(rot, dtype=np.float64).reshape(-1, 4)
+        tr = np.array(tr, dtype=np.float64).reshape(-1, 3)
+
+        if not (scl.shape[0] == rot.shape[0] == tr.shape[0]):
+            raise ValueError("XfoArray: 'scl', 'rot' and 'tr' arrays must have the same length.")
+
+        result = cls()
+        result.scl = scl
+        result.rot = rot
+        result.tr = tr
+
+        return result
+
+
+    @classmethod
+    def fromXfos(cls, xfos):
+        """Creates an XfoArray from a list of Xfo objects.
+
+        Arguments:
+        xfos -- List, Xfo objects to copy values from.
+
+        Return:
+        New XfoArray.
+
+        """
+
+        result = cls(len(xfos))
+        for i, xfo in enumerate(xfos):
+            result.setXfo(i, xfo)
+
+        return result
+
+
+    def toXfos(self):
+        """Returns a list of new Xfo objects with the values of this array.
+
+        Return:
+        List of Xfo objects.
+
+        """
+
+        xfos = []
+        for scl, rot, tr in zip(self.scl.tolist(), self.rot.tolist(), self.tr.tolist()):
+            xfos.append(Xfo(scl=Vec3(scl[0], scl[1], scl[2]),
+                            rot=Quat(Vec3(rot[0], rot[1], rot[2]), rot[3]),
+                            tr=Vec3(tr[0], tr[1], tr[2])))
+
+        return xfos
+
+
+    def clone(self):
+        """Clone the XfoArray into a new XfoArray.
+
+        Return:
+        New XfoArray with the same values as this XfoArray.
+
+        """
+
+        return XfoArray.fromArrays(self.scl, self.rot, self.tr)
+
+
+    # ================
+    # Element Methods
+    # ================
+    def getXfo(self, index):
+        """Returns an Xfo that is a view into the given row of this array.
+
+        Modifying the returned Xfo, or any of its scl, rot and tr members, writes
+        the values straight back into this array.
+
+        Arguments:
+        index -- Integer, index of the transform.
+
+        Return:
+        Xfo view of the transform.
+
+        """
+
+        if index < -len(self) or index >= len(self):
+            raise IndexError("XfoArray: '" + str(index) + "' is out of range.")
+
+        return _XfoView(self, index % len(self))
+
+
+    def setXfo(self, index, xfo):
+        """Copies the values of an Xfo into the given row of this array.
+
+        Arguments:
+        index -- Integer, index of the transform.
+        xfo -- Xfo, transform to copy the values from.
+
+        Return:
+        True if successful.
+
+        """
+
+        if not isinstance(xfo, Xfo):
+            raise TypeError("XfoArray: Invalid type for 'xfo' argument. Must be a Xfo.")
+
+        self.scl[index] = (xfo.scl.x, xfo.scl.y, xfo.scl.z)
+        self.rot[index] = (xfo.rot.v.x, xfo.rot.v.y, xfo.rot.v.z, xfo.rot.w)
+        self.tr[index] = (xfo.tr.x, xfo.tr.y, xfo.tr.z)
+
+        return True
+
+
+    # ==============
+    # Math Methods
+    # ==============
+    def _getTerms(self, other):
+        """Returns the scl, rot and tr arrays of an XfoArray or Xfo for broadcasting."""
+
+        if isinstance(other, XfoArray):
+            if len(other) != len(self):
+                raise ValueError("XfoArray: arrays must have the same length.")
+
+            return other.scl, other.rot, other.tr
+
+        elif isinstance(other, Xfo):
+            return (np.array([other.scl.x, other.scl.y, other.scl.z]),
+                    np.array([other.rot.v.x, other.rot.v.y, other.rot.v.z, other.rot.w]),
+                    np.array([other.tr.x, other.tr.y, other.tr.z]))
+
+        raise TypeError("XfoArray: Invalid type for 'other' argument. Must be a XfoArray or Xfo.")
+
+
+    def multiply(self, other):
+        """Multiplies each transform in this array with the input transform(s).
+
+        The result of row i is this[i] * other[i], composed so that the other
+        transform is expressed in the space of this one. A single Xfo is
+        broadcast against every row.
+
+        Arguments:
+        other -- XfoArray / Xfo, right hand term of the multiplication.
+
+        Return:
+        New XfoArray.
+
+        """
+
+        otherScl, otherRot, otherTr = self._getTerms(other)
+
+        result = XfoArray()
+        result.tr = self.tr + quatArrayRotateVectors(self.rot, self.scl * otherTr)
+        result.rot = quatArrayMultiply(self.rot, np.broadcast_to(otherRot, self.rot.shape))
+        result.scl = self.scl * otherScl
+
+        return result
+
+
+    def inverse(self):
+        """Inverts each transform in this array.
+
+        Return:
+        New XfoArray with the inverted transforms.
+
+        """
+
+        if np.any(self.scl == 0.0):
+            raise ValueError("XfoArray: inverse: scale contains zero values!")
+
+        result = XfoArray()
+        result.scl = 1.0 / self.scl
+        result.rot = quatArrayInverse(self.rot)
+        result.tr = quatArrayRotateVectors(result.rot, -self.tr) * result.scl
+
+        return result
+
+
+    def transformVectors(self, vectors):
+        """Transforms vectors by the transforms in this array.
+
+        Arguments:
+        vectors -- Array, Nx3 vectors transformed by the matching row, or a
+                   single 3 element vector transformed by every row.
+
+        Return:
+        Nx3 array of transformed vectors.
+
+        """
+
+        vectors = np.asarray(vectors, dtype=np.float64)
+
+        return quatArrayRotateVectors(self.rot, vectors * self.scl) + self.tr
+
+
+    # ===================
+    # Comparison Methods
+    # ===================
+    def diff(self, other, precision=10e-6):
+        """Finds the transforms that differ from the input transform(s).
+
+        Components are compared with an absolute tolerance. Rotations q and -q
+        are considered equal. A single Xfo is compared against every row.
+
+        Arguments:
+        other -- XfoArray / Xfo, transform(s) to compare with.
+        precision -- Float, tolerance on each component.
+
+        Return:
+        Array of the indices of the transforms that differ.
+
+        """
+
+        otherScl, otherRot, otherTr = self._getTerms(other)
+
+        rotDiff = np.minimum(np.abs(self.rot - otherRot).max(axis=-1),
+                             np.abs(self.rot + otherRot).max(axis=-1))
+
+        different = (np.abs(self.scl - otherScl).max(axis=-1) > precision) | \
+                    (rotDiff > precision) | \
+                    (np.abs(self.tr - otherTr).max(axis=-1) > precision)
+
+        return np.flatnonzero(different)
+
+
+    def allClose(self, other, precision=10e-6):
+        """Checks if all transforms are almost equal to the input transform(s).
+
+        Arguments:
+        other -- XfoArray / Xfo, transform(s) to compare with.
+        precision -- Float, tolerance on each component.
+
+        Return:
+        True if no transform differs by more than the precision.
+
+        """
+
+        return len(self.diff(other, precision=precision)) == 0
+
+
+    def quantizedHash(self, precision=10e-6):
+        """Hashes all transform values snapped to the given precision.
+
+        The rotation signs are made canonical first, so q and -q hash the same.
+        Arrays holding the same transforms within the precision hash the same,
+        except for values sitting right on a quantization step.
+
+        Arguments:
+        precision -- Float, size of the quantization step.
+
+        Return:
+        String, hex digest of the quantized transforms, equal to
+        Xfo.quantizedHash for a single transform.
+
+        """
+
+        if precision == 0.0:
+            raise ValueError("XfoArray: quantizedHash: 'precision' must not be zero.")
+
+        values = np.hstack([self.scl, quatArrayCanonicalize(self.rot), self.tr])
+        quantized = np.floor(values / precision + 0.5).astype('<i8')
+
+        return hashlib.sha1(quantized.tobytes()).hexdigest()
+
+
+    # ===================
+    # Conversion Methods
+    # ===================
+    def toMatrix44Array(self):
+        """Converts the transforms to 4x4 matrices.
+
+        The matrices follow the Matrix44 row layout used by Xfo.setFromMatrix44,
+        where rows 0-2 hold the scaled axes and row 3 holds the translation.
+
+        Return:
+        Nx4x4 array of matrices.
+
+        """
+
+        result = np.zeros((len(self), 4, 4), dtype=np.float64)
+        result[:, 0:3, 0:3] = quatArrayToMatrix33Array(self.rot) * self.scl[:, :, np.newaxis]
+        result[:, 3, 0:3] = self.tr
+        result[:, 3, 3] = 1.0
+
+        return result
+
+
+    def setFromMatrix44Array(self, matrices):
+        """Sets the transforms from an array of 4x4 matrices.
+
+        Arguments:
+        matrices -- Array, Nx4x4 matrices (or Nx16 flat matrices) in the
+                    layout returned by toMatrix44Array.
+
+        Return:
+        True if successful.
+
+        """
+
+        matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+
+        axes = matrices[:, 0:3, 0:3]
+        scl = np.sqrt(np.einsum('nij,nij->ni', axes, axes))
+
+        if np.any(scl == 0.0):
+            raise ValueError("XfoArray: setFromMatrix44Array: matrix contains a zero length axis!")
+
+        # Flip the x axis on mirrored matrices to keep a proper rotation.
+        negative = np.linalg.det(axes) < 0.0
+        scl[negative, 0] *= -1.0
+
+        rot = matrix33ArrayToQuatArray(axes / scl[:, :, np.newaxis])
+        tr = matrices[:, 3, 0:3]
+
+        # Write into the existing storage when possible so views stay valid.
+        if len(self) == matrices.shape[0]:
+            self.scl[:] = scl
+            self.rot[:] = rot
+            self.tr[:] = tr
+        else:
+            self.scl = scl
+            self.rot = rot
+            self.tr = np.array(tr)
+
+        return True
+
+
+# ====================
+# Element View Classes
+# ====================
+class _Vec3View(Vec3):
+    """Vec3 whose components live in a row of a NumPy array."""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+
+    def _getX(self):
+        return float(self._data[0])
+
+    def _setX(self, value):
+        self._data[0] = value
+
+    def _getY(self):
+        return float(self._data[1])
+
+    def _setY(self, value):
+        self._data[1] = value
+
+    def _getZ(self):
+        return float(self._data[2])
+
+    def _setZ(self, value):
+        self._data[2] = value
+
+    x = property(_getX, _setX)
+    y = property(_getY, _setY)
+    z = property(_getZ, _setZ)
+
+
+class _QuatView(Quat):
+    """Quat whose components live in a row of a NumPy array."""
+
+    __slots__ = ('_data', '_v')
+
+    def __init__(self, data):
+        self._data = data
+        self._v = _Vec3View(data[0:3])
+
+
+    def _getV(self):
+        return self._v
+
+    def _setV(self, value):
+        self._v.set(value.x, value.y, value.z)
+
+    def _getW(self):
+        return float(self._data[3])
+
+    def _setW(self, value):
+        self._data[3] = value
+
+    v = property(_getV, _setV)
+    w = property(_getW, _setW)
+
+
+class _XfoView(Xfo):
+    """Xfo whose scl, rot and tr live in a row of an XfoArray."""
+
+    __slots__ = ('_array', '_index', '_scl', '_rot', '_tr')
+
+    def __init__(self, array, index):
+        self._array = array
+        self._index = index
+        self._scl = _Vec3View(array.scl[index])
+        self._rot = _QuatView(array.rot[index])
+        self._tr = _Vec3View(array.tr[index])
+        self.ro = 0
+
+
+    def _getScl(self):
+        return self._scl
+
+    def _setScl(self, value):
+        self._scl.set(value.x, value.y, value.z)
+
+    def _getRot(self):
+        return self._rot
+
+    def _setRot(self, value):
+        self._rot.set(value.v, value.w)
+
+    def _getTr(self):
+        return self._tr
+
+    def _setTr(self, value):
+        self._tr.set(value.x, value.y, value.z)
+
+    scl = property(_getScl, _setScl)
+    rot = property(_getRot, _setRot)
+    tr = property(_getTr, _setTr)
@@ -5,6 +5,9 @@ AttributeGroup - Attribute Group.
 
 """
 
+import copy
+
+
 class AttributeGroup(object):
     """Attribute Group that attributes belong to."""
 
@@ -13,6 +16,7 @@ class AttributeGroup(object):
     def __init__(self, name, parent=None):
         super(AttributeGroup, self).__init__()
         self.name = name
+        self._fullName = None
         self.attributes = []
         self.parent = parent
 
@@ -32,6 +36,10 @@ class AttributeGroup(object):
         """
 
         self.name = name
+        self._resetNames()
+
+        if self.parent is not None:
+            self.parent.attributeGroups.rename(self)
 
         return True
 
@@ -50,15 +58,36 @@ class AttributeGroup(object):
     def getFullName(self):
         """Returns the full hierarchical path to this object.
 
+        The result is cached until this object or one of its parents is renamed
+        or reparented.
+
         Return:
         String, full name of the object.
 
         """
 
-        if self.parent is not None:
-            return self.parent.getFullName() + '.' + self.getName()
+        if self._fullName is None:
+            if self.parent is not None:
+                self._fullName = self.parent.getFullName() + '.' + self.getName()
+            else:
+                self._fullName = self.getName()
+
+        return self._fullName
+
 
-        return self.getName()
+    def _resetNames(self):
+        """Clears the cached full name of this group and its attributes.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._fullName = None
+        for attribute in self.attributes:
+            attribute._resetNames()
+
+        return True
 
 
     # ===============
@@ -76,6 +105,7 @@ class AttributeGroup(object):
         """
 
         self.parent = parent
+        self._resetNames()
 
         return True
 
@@ -237,6 +267,32 @@ class AttributeGroup(object):
         return None
 
 
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap):
+        """Returns a copy of this group and its attributes that isn't parented.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original, the copies are added.
+
+        Return:
+        AttributeGroup, copy of this group.
+
+        """
+
+        clone = copy.copy(self)
+        clone.parent = None
+        clone.attributes = []
+        for attribute in self.attributes:
+            clone.addAttribute(attribute._cloneItem(cloneMap))
+
+        clone._resetNames()
+        cloneMap[id(self)] = clone
+
+        return clone
+
+
     # ====================
     # Persistence Methods
     # ====================
@@ -277,6 +333,7 @@ class AttributeGroup(object):
         """
 
         self.parent =  loader.getParentItem()
+        self._resetNames()
 
         for attr in jsonData['attributes']:
             self.addAttribute(loader.construct(attr))
@@ -5,6 +5,11 @@ BaseAttribute - Base Attribute.
 
 """
 
+import copy
+
+from kraken.core.objects.change_tracker import markChanged
+
+
 class BaseAttribute(object):
     """Base Attribute object."""
 
@@ -13,6 +18,7 @@ class BaseAttribute(object):
     def __init__(self, name, value):
         super(BaseAttribute, self).__init__()
         self.name = name
+        self._fullName = None
         self.value = value
         self.parent = None
         self.connection = None
@@ -33,6 +39,7 @@ class BaseAttribute(object):
         """
 
         self.name = name
+        self._resetNames()
 
         return True
 
@@ -51,15 +58,34 @@ class BaseAttribute(object):
     def getFullName(self):
         """Returns the full hierarchical path to this object.
 
+        The result is cached until this object or one of its parents is renamed
+        or reparented.
+
         Return:
         String, full name of the object.
 
         """
 
-        if self.parent is not None:
-            return self.parent.getFullName() + '.' + self.getName()
+        if self._fullName is None:
+            if self.parent is not None:
+                self._fullName = self.parent.getFullName() + '.' + self.getName()
+            else:
+                self._fullName = self.getName()
+
+        return self._fullName
+
+
+    def _resetNames(self):
+        """Clears the cached full name of this attribute.
+
+        Return:
+        True if successful.
+
+        """
 
-        return self.getName()
+        self._fullName = None
+
+        return True
 
 
     # ==============
@@ -88,6 +114,7 @@ class BaseAttribute(object):
         """
 
         self.value = value
+        markChanged(self, 'value')
 
         return True
 
@@ -118,6 +145,7 @@ class BaseAttribute(object):
         """
 
         self.parent = parent
+        self._resetNames()
 
         return True
 
@@ -161,6 +189,7 @@ class BaseAttribute(object):
         """
 
         self.connection = attribute
+        markChanged(self, 'connection')
 
         return True
 
@@ -174,6 +203,7 @@ class BaseAttribute(object):
         """
 
         self.connection = None
+        markChanged(self, 'connection')
 
         return True
 
@@ -192,6 +222,45 @@ class BaseAttribute(object):
         return self.__kType__
 
 
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap):
+        """Returns a copy of this attribute that isn't parented.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original, the copy is added.
+
+        Return:
+        Attribute, copy of this attribute.
+
+        """
+
+        clone = copy.copy(self)
+        clone.parent = None
+        clone._resetNames()
+        cloneMap[id(self)] = clone
+
+        return clone
+
+
+    def _remapReferences(self, cloneMap):
+        """Connects this copy to the copy of its driver if it was copied too.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        True if successful.
+
+        """
+
+        if self.connection is not None:
+            self.connection = cloneMap.get(id(self.connection), self.connection)
+
+        return True
+
+
     # ====================
     # Persistence Methods
     # ====================
@@ -234,5 +303,6 @@ class BaseAttribute(object):
         self.name =  jsonData['name']
         self.value =  loader.decodeValue(jsonData['value'])
         self.parent =  loader.getParentItem()
+        self._resetNames()
 
         return True
@@ -0,0 +1,224 @@
+"""Kraken - objects.change_tracker module.
+
+Classes:
+ChangeTracker - Records which properties of which objects changed.
+
+Functions:
+getChangeTracker -- Returns the change tracker shared by all objects.
+markChanged -- Records a change on the shared change tracker.
+
+"""
+
+import collections
+import weakref
+
+
+class ChangeTracker(object):
+    """Records which properties of which objects changed at which revision.
+
+    Every recorded change increments the revision. Objects are referenced
+    weakly, so tracking doesn't keep deleted objects alive. Only the latest
+    change of each property of an object is kept.
+
+    Tracking is disabled by default so building rigs doesn't pay for it,
+    incremental builders enable it with setEnabled before editing a rig.
+
+    """
+
+    def __init__(self):
+        super(ChangeTracker, self).__init__()
+        self.revision = 0
+        self.enabled = False
+
+        # Ordered by revision, keyed by (object id, property name).
+        self._changes = collections.OrderedDict()
+        self._objects = {}
+
+
+    # =================
+    # Revision Methods
+    # =================
+    def getRevision(self, root=None):
+        """Returns the current revision.
+
+        Transforms are often edited in place, so they are compared with the
+        values seen last time when a root is given. Pass the same root to
+        getChangesSince later.
+
+        Arguments:
+        root -- SceneItem, optional, hierarchy whose transforms are checked.
+
+        Return:
+        Integer, current revision.
+
+        """
+
+        if root is not None:
+            self.checkXfos(root)
+
+        return self.revision
+
+
+    def setEnabled(self, enabled):
+        """Sets whether changes are recorded.
+
+        Disabling tracking discards the recorded changes.
+
+        Arguments:
+        enabled -- Boolean, whether changes are recorded.
+
+        Return:
+        True if successful.
+
+        """
+
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+
+        return True
+
+
+    # ===============
+    # Change Methods
+    # ===============
+    def markChanged(self, obj, propertyName):
+        """Records a change of a property of an object.
+
+        Arguments:
+        obj -- Object, changed object.
+        propertyName -- String, name of the changed property.
+
+        Return:
+        Integer, revision of the change.
+
+        """
+
+        if not self.enabled:
+            return self.revision
+
+        self.revision += 1
+
+        objId = id(obj)
+        entry = self._objects.get(objId)
+        if entry is None:
+            entry = (weakref.ref(obj, lambda ref, objId=objId: self._forget(objId)), set())
+            self._objects[objId] = entry
+
+        key = (objId, propertyName)
+        if key in self._changes:
+            del self._changes[key]
+
+        self._changes[key] = (self.revision, entry[0])
+        entry[1].add(propertyName)
+
+        return self.revision
+
+
+    def checkXfos(self, root):
+        """Records the transforms of a hierarchy that changed since they were
+        last checked.
+
+        Arguments:
+        root -- SceneItem, top of the hierarchy to check.
+
+        Return:
+        True if successful.
+
+        """
+
+        for item in root.walk():
+            item._checkXfoChanged()
+
+        return True
+
+
+    def getChangesSince(self, revision, root=None):
+        """Returns the objects that changed after a revision.
+
+        Arguments:
+        revision -- Integer, revision returned by getRevision.
+        root -- SceneItem, optional, hierarchy whose transforms are checked
+                first.
+
+        Return:
+        Dict, sets of changed property names by object.
+
+        """
+
+        if root is not None:
+            self.checkXfos(root)
+
+        changes = {}
+        for key in reversed(self._changes):
+            changeRevision, ref = self._changes[key]
+            if changeRevision <= revision:
+                break
+
+            obj = ref()
+            if obj is not None:
+                changes.setdefault(obj, set()).add(key[1])
+
+        return changes
+
+
+    def clear(self):
+        """Discards all recorded changes, the revision keeps counting.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._changes.clear()
+        self._objects.clear()
+
+        return True
+
+
+    def _forget(self, objId):
+        """Discards the changes of an object that was deleted.
+
+        Arguments:
+        objId -- Integer, id the object had.
+
+        """
+
+        entry = self._objects.pop(objId, None)
+        if entry is None:
+            return
+
+        for propertyName in entry[1]:
+            self._changes.pop((objId, propertyName), None)
+
+
+_changeTracker = ChangeTracker()
+
+
+def getChangeTracker():
+    """Returns the change tracker shared by all objects.
+
+    Return:
+    ChangeTracker, shared change tracker.
+
+    """
+
+    return _changeTracker
+
+
+def markChanged(obj, propertyName):
+    """Records a change of a property of an object on the shared change tracker.
+
+    Arguments:
+    obj -- Object, changed object.
+    propertyName -- String, name of the changed property.
+
+    Return:
+    Integer, revision of the change.
+
+    """
+
+    if not _changeTracker.enabled:
+        return _changeTracker.revision
+
+    return _changeTracker.markChanged(obj, propertyName)
@@ -0,0 +1,901 @@
+"""Kraken - objects.compact_scene_graph module.
+
+Classes:
+CompactSceneGraph - Array backed storage of a hierarchy of transforms.
+CompactItem - Handle to an item of a CompactSceneGraph.
+WorldXfoView - World transform of a CompactItem that writes back edits.
+
+"""
+
+import numpy as np
+
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import XfoArray
+from kraken.core.maths.xfo_array import _Vec3View, _QuatView, _XfoView
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.hierarchy_group import HierarchyGroup
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.srtBuffer import SrtBuffer
+
+
+# Classes created for each kType when converting back to SceneItems.
+_itemClasses = {
+    'Container': Container,
+    'Layer': Layer,
+    'HierarchyGroup': HierarchyGroup,
+    'Locator': Locator,
+    'Joint': Joint,
+    'SrtBuffer': SrtBuffer
+}
+
+
+class CompactSceneGraph(object):
+    """Hierarchy of named transforms stored in flat arrays.
+
+    Each item is a row holding the index of its parent, a kType code, a name
+    id into a string table and its local transform in an XfoArray. Parents
+    always come before their children, so -1 marks a root. Pipelines that
+    generate hundreds of thousands of items can store them here without a
+    SceneItem per item and convert the parts they build with toSceneItems.
+
+    """
+
+    def __init__(self):
+        super(CompactSceneGraph, self).__init__()
+        self._count = 0
+        self._parents = np.empty(0, dtype=np.int32)
+        self._kTypes = np.empty(0, dtype=np.int16)
+        self._names = np.empty(0, dtype=np.int32)
+        self._localXfos = XfoArray()
+
+        self._strings = []
+        self._stringIds = {}
+        self._kTypeNames = []
+        self._kTypeIds = {}
+
+        # Children of each item, built when first needed.
+        self._childOrder = None
+        self._childOffsets = None
+
+
+    def __len__(self):
+        return self._count
+
+
+    # ================
+    # Storage Methods
+    # ================
+    def _reserve(self, count):
+        """Grows the arrays to hold at least the specified number of items.
+
+        Arguments:
+        count -- Integer, number of items to hold.
+
+        """
+
+        capacity = self._parents.shape[0]
+        if count <= capacity:
+            return
+
+        capacity = max(count, capacity * 2, 16)
+        extra = capacity - self._parents.shape[0]
+
+        self._parents = np.concatenate((self._parents, np.empty(extra, dtype=np.int32)))
+        self._kTypes = np.concatenate((self._kTypes, np.empty(extra, dtype=np.int16)))
+        self._names = np.concatenate((self._names, np.empty(extra, dtype=np.int32)))
+
+        identities = XfoArray(extra)
+        self._localXfos = XfoArray.fromArrays(np.concatenate((self._localXfos.scl, identities.scl)),
+                                              np.concatenate((self._localXfos.rot, identities.rot)),
+                                              np.concatenate((self._localXfos.tr, identities.tr)))
+
+
+    def _getStringId(self, string):
+        """Returns the id of a name in the string table, adding it if needed.
+
+        Arguments:
+        string -- String, name to look up.
+
+        Return:
+        Integer, id of the name.
+
+        """
+
+        stringId = self._stringIds.get(string)
+        if stringId is None:
+            stringId = len(self._strings)
+            self._strings.append(string)
+            self._stringIds[string] = stringId
+
+        return stringId
+
+
+    def _getKTypeId(self, kType):
+        """Returns the code of a kType, adding it if needed.
+
+        Arguments:
+        kType -- String, kType to look up.
+
+        Return:
+        Integer, code of the kType.
+
+        """
+
+        kTypeId = self._kTypeIds.get(kType)
+        if kTypeId is None:
+            kTypeId = len(self._kTypeNames)
+            self._kTypeNames.append(kType)
+            self._kTypeIds[kType] = kTypeId
+
+        return kTypeId
+
+
+    def _checkIndex(self, index):
+        """Checks the supplied index is valid.
+
+        Arguments:
+        index -- Integer, item index to check.
+
+        """
+
+        if index < 0 or index >= self._count:
+            raise IndexError("'" + str(index) + "' is out of the range of the items of the CompactSceneGraph.")
+
+        return True
+
+
+    # ============
+    # Add Methods
+    # ============
+    def addItem(self, name, kType='Locator', parent=-1, localXfo=None):
+        """Adds an item to the graph.
+
+        Arguments:
+        name -- String, name of the item.
+        kType -- String, kType of the item.
+        parent -- Integer, index of the parent item, -1 for a root.
+        localXfo -- Xfo, optional, transform relative to the parent.
+
+        Return:
+        Integer, index of the new item.
+
+        """
+
+        if parent != -1:
+            self._checkIndex(parent)
+
+        index = self._count
+        self._reserve(index + 1)
+
+        self._parents[index] = parent
+        self._kTypes[index] = self._getKTypeId(kType)
+        self._names[index] = self._getStringId(name)
+        if localXfo is not None:
+            self._localXfos.setXfo(index, localXfo)
+
+        self._count += 1
+        self._childOrder = None
+
+        return index
+
+
+    def addItems(self, names, kType='Locator', parents=None, localXfos=None):
+        """Adds many items of the same kType to the graph at once.
+
+        Arguments:
+        names -- List, names of the items.
+        kType -- String, kType of the items.
+        parents -- Array, optional, parent index of each item, -1 for roots.
+                   Parents have to be added before their children.
+        localXfos -- XfoArray, optional, transforms relative to the parents.
+
+        Return:
+        Array, indices of the new items.
+
+        """
+
+        count = len(names)
+        start = self._count
+
+        if parents is None:
+            parents = np.full(count, -1, dtype=np.int32)
+        else:
+            parents = np.asarray(parents, dtype=np.int32)
+            if parents.shape != (count,):
+                raise ValueError("CompactSceneGraph: 'parents' must have one index per name.")
+
+            if np.any(parents >= start + np.arange(count)) or np.any(parents < -1):
+                raise ValueError("CompactSceneGraph: parents have to be added before their children.")
+
+        if localXfos is not None and len(localXfos) != count:
+            raise ValueError("CompactSceneGraph: 'localXfos' must have one transform per name.")
+
+        self._reserve(start + count)
+
+        end = start + count
+        self._parents[start:end] = parents
+        self._kTypes[start:end] = self._getKTypeId(kType)
+        self._names[start:end] = [self._getStringId(x) for x in names]
+        if localXfos is not None:
+            self._localXfos.scl[start:end] = localXfos.scl
+            self._localXfos.rot[start:end] = localXfos.rot
+            self._localXfos.tr[start:end] = localXfos.tr
+
+        self._count = end
+        self._childOrder = None
+
+        return np.arange(start, end)
+
+
+    # ================
+    # Query Methods
+    # ================
+    def getName(self, index):
+        """Returns the name of an item.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        String, name of the item.
+
+        """
+
+        self._checkIndex(index)
+
+        return self._strings[self._names[index]]
+
+
+    def setName(self, index, name):
+        """Sets the name of an item.
+
+        Arguments:
+        index -- Integer, index of the item.
+        name -- String, new name of the item.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._checkIndex(index)
+        self._names[index] = self._getStringId(name)
+
+        return True
+
+
+    def getKType(self, index):
+        """Returns the kType of an item.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        String, kType of the item.
+
+        """
+
+        self._checkIndex(index)
+
+        return self._kTypeNames[self._kTypes[index]]
+
+
+    def getParentIndex(self, index):
+        """Returns the index of the parent of an item.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        Integer, index of the parent, -1 for a root.
+
+        """
+
+        self._checkIndex(index)
+
+        return int(self._parents[index])
+
+
+    def getChildIndices(self, index):
+        """Returns the indices of the children of an item in the order they
+        were added.
+
+        Arguments:
+        index -- Integer, index of the item, -1 for the roots.
+
+        Return:
+        Array, indices of the children.
+
+        """
+
+        if index != -1:
+            self._checkIndex(index)
+
+        if self._childOrder is None:
+            parents = self._parents[:self._count]
+            self._childOrder = np.argsort(parents, kind='mergesort')
+            self._childOffsets = np.searchsorted(parents[self._childOrder], np.arange(-1, self._count + 1))
+
+        return self._childOrder[self._childOffsets[index + 1]:self._childOffsets[index + 2]]
+
+
+    def getFullName(self, index):
+        """Returns the full hierarchical path of an item.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        String, full name of the item.
+
+        """
+
+        self._checkIndex(index)
+
+        names = []
+        while index != -1:
+            names.append(self._strings[self._names[index]])
+            index = self._parents[index]
+
+        return '.'.join(reversed(names))
+
+
+    def getIndexByPath(self, path):
+        """Returns the index of the item with the specified full name.
+
+        Arguments:
+        path -- String, full name of the item.
+
+        Return:
+        Integer, index of the item, -1 if not found.
+
+        """
+
+        index = -1
+        for name in path.split('.'):
+            nameId = self._stringIds.get(name)
+            if nameId is None:
+                return -1
+
+            children = self.getChildIndices(index)
+            matches = children[self._names[children] == nameId]
+            if len(matches) == 0:
+                return -1
+
+            index = int(matches[0])
+
+        return index
+
+
+    def getDepths(self):
+        """Returns the depth of each item, 0 for roots.
+
+        Return:
+        Array, depth of each item.
+
+        """
+
+        parents = self._parents[:self._count]
+        depths = np.zeros(self._count, dtype=np.int32)
+        hasParent = parents != -1
+
+        # Each pass resolves one more level of the hierarchy.
+        while True:
+            newDepths = np.where(hasParent, depths[parents] + 1, 0)
+            if np.array_equal(newDepths, depths):
+                return depths
+
+            depths = newDepths
+
+
+    # ====================
+    # Transform Methods
+    # ====================
+    def getLocalXfos(self):
+        """Returns the local transforms of all items.
+
+        Return:
+        XfoArray, view of the local transforms, modifying it modifies the
+        graph.
+
+        """
+
+        localXfos = XfoArray()
+        localXfos.scl = self._localXfos.scl[:self._count]
+        localXfos.rot = self._localXfos.rot[:self._count]
+        localXfos.tr = self._localXfos.tr[:self._count]
+
+        return localXfos
+
+
+    def getLocalXfo(self, index):
+        """Returns the transform of an item relative to its parent.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        Xfo, view of the local transform, modifying it modifies the graph.
+
+        """
+
+        self._checkIndex(index)
+
+        return self._localXfos.getXfo(index)
+
+
+    def setLocalXfo(self, index, xfo):
+        """Sets the transform of an item relative to its parent.
+
+        Arguments:
+        index -- Integer, index of the item.
+        xfo -- Xfo, local transform of the item.
+
+        Return:
+        True if successful.
+
+        """
+
+        self._checkIndex(index)
+
+        return self._localXfos.setXfo(index, xfo)
+
+
+    def computeWorldXfos(self):
+        """Computes the world transforms of all items.
+
+        Items are processed a hierarchy level at a time, so the work is done
+        in a few array operations instead of once per item.
+
+        Return:
+        XfoArray, world transform of each item.
+
+        """
+
+        localXfos = self.getLocalXfos()
+        worldXfos = localXfos.clone()
+
+        parents = self._parents[:self._count]
+        depths = self.getDepths()
+        for depth in xrange(1, int(depths.max()) + 1 if self._count else 1):
+            indices = np.nonzero(depths == depth)[0]
+
+            parentXfos = XfoArray.fromArrays(worldXfos.scl[parents[indices]],
+                                             worldXfos.rot[parents[indices]],
+                                             worldXfos.tr[parents[indices]])
+            itemXfos = XfoArray.fromArrays(localXfos.scl[indices],
+                                           localXfos.rot[indices],
+                                           localXfos.tr[indices])
+            result = parentXfos.multiply(itemXfos)
+
+            worldXfos.scl[indices] = result.scl
+            worldXfos.rot[indices] = result.rot
+            worldXfos.tr[indices] = result.tr
+
+        return worldXfos
+
+
+    def computeWorldXfo(self, index):
+        """Computes the world transform of one item.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        Xfo, world transform of the item.
+
+        """
+
+        self._checkIndex(index)
+
+        xfo = self._localXfos.getXfo(index).clone()
+        index = self._parents[index]
+        while index != -1:
+            xfo = self._localXfos.getXfo(index).multiply(xfo)
+            index = self._parents[index]
+
+        return xfo
+
+
+    def setWorldXfo(self, index, xfo):
+        """Sets the local transform of an item so it ends up at a world
+        transform. The transforms of the parents are kept.
+
+        Arguments:
+        index -- Integer, index of the item.
+        xfo -- Xfo, world transform of the item.
+
+        Return:
+        True if successful.
+
+        """
+
+        parent = self.getParentIndex(index)
+        if parent != -1:
+            xfo = xfo.localTo(self.computeWorldXfo(parent))
+
+        return self._localXfos.setXfo(index, xfo)
+
+
+    # =================
+    # Handle Methods
+    # =================
+    def getItem(self, index):
+        """Returns a handle to an item.
+
+        Arguments:
+        index -- Integer, index of the item.
+
+        Return:
+        CompactItem, handle to the item.
+
+        """
+
+        self._checkIndex(index)
+
+        return CompactItem(self, index)
+
+
+    def getRoots(self):
+        """Returns handles to the items without a parent.
+
+        Return:
+        List of CompactItem handles.
+
+        """
+
+        return [CompactItem(self, int(x)) for x in self.getChildIndices(-1)]
+
+
+    # =====================
+    # Conversion Methods
+    # =====================
+    @classmethod
+    def fromSceneItem(cls, root):
+        """Creates a graph from the names, kTypes and transforms of a hierarchy.
+
+        Arguments:
+        root -- SceneItem, top of the hierarchy.
+
+        Return:
+        CompactSceneGraph, graph holding the hierarchy.
+
+        """
+
+        graph = cls()
+
+        indices = {}
+        for item in root.walk():
+            parent = indices.get(id(item.parent), -1) if item is not root else -1
+            indices[id(item)] = graph.addItem(item.getName(),
+                                              kType=item.getKType(),
+                                              parent=parent,
+                                              localXfo=item.getLocalXfo() if parent != -1 else item.xfo)
+
+        return graph
+
+
+    def toSceneItems(self, index):
+        """Creates SceneItems for an item and its descendants.
+
+        Only kTypes without further data, like Locators, Joints and Layers, can
+        be created.
+
+        Arguments:
+        index -- Integer, index of the top item.
+
+        Return:
+        SceneItem, object of the top item.
+
+        """
+
+        self._checkIndex(index)
+
+        worldXfos = self.computeWorldXfos()
+
+        root = None
+        stack = [(index, None)]
+        while stack:
+            itemIndex, parentItem = stack.pop()
+
+            kType = self._kTypeNames[self._kTypes[itemIndex]]
+            itemClass = _itemClasses.get(kType)
+            if itemClass is None:
+                raise ValueError("CompactSceneGraph: Items of kType '" + kType + "' can't be created.")
+
+            item = itemClass(self._strings[self._names[itemIndex]])
+            item.xfo = worldXfos.getXfo(itemIndex).clone()
+
+            if parentItem is None:
+                root = item
+            else:
+                parentItem.addChild(item)
+
+            for childIndex in reversed(self.getChildIndices(itemIndex)):
+                stack.append((int(childIndex), item))
+
+        return root
+
+
+class CompactItem(object):
+    """Handle to an item of a CompactSceneGraph.
+
+    Provides the name, hierarchy and transform methods of SceneItem, so code
+    reading a hierarchy can use either. Attribute groups, constraints, flags,
+    color, visibility and components aren't stored in the graph and have no
+    methods here.
+
+    Unlike SceneItem, the graph stores local transforms, so moving an item
+    moves its children with it.
+
+    """
+
+    __slots__ = ('graph', 'index')
+
+    def __init__(self, graph, index):
+        super(CompactItem, self).__init__()
+        self.graph = graph
+        self.index = index
+
+
+    def __eq__(self, other):
+        return isinstance(other, CompactItem) and other.graph is self.graph and other.index == self.index
+
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+    def __hash__(self):
+        return hash((id(self.graph), self.index))
+
+
+    # =============
+    # Name methods
+    # =============
+    def getName(self):
+        """Returns the name of the item.
+
+        Return:
+        String, name of the item.
+
+        """
+
+        return self.graph.getName(self.index)
+
+
+    def setName(self, name):
+        """Sets the name of the item.
+
+        Arguments:
+        name -- String, new name of the item.
+
+        Return:
+        True if successful.
+
+        """
+
+        return self.graph.setName(self.index, name)
+
+
+    def getFullName(self):
+        """Returns the full hierarchical path of the item.
+
+        Return:
+        String, full name of the item.
+
+        """
+
+        return self.graph.getFullName(self.index)
+
+
+    def getKType(self):
+        """Returns the kType of the item.
+
+        Return:
+        String, kType of the item.
+
+        """
+
+        return self.graph.getKType(self.index)
+
+
+    # ==================
+    # Hierarchy Methods
+    # ==================
+    def getParent(self):
+        """Returns the parent of the item.
+
+        Return:
+        CompactItem, parent of the item, None for a root.
+
+        """
+
+        parent = self.graph.getParentIndex(self.index)
+        if parent == -1:
+            return None
+
+        return CompactItem(self.graph, parent)
+
+
+    def _getChildren(self):
+        return [CompactItem(self.graph, int(x)) for x in self.graph.getChildIndices(self.index)]
+
+    children = property(_getChildren)
+
+
+    def getNumChildren(self):
+        """Returns the number of children of the item.
+
+        Return:
+        Integer, number of children.
+
+        """
+
+        return len(self.graph.getChildIndices(self.index))
+
+
+    def getChildByIndex(self, index):
+        """Returns the child at the specified index.
+
+        Arguments:
+        index -- Integer, index of the child.
+
+        Return:
+        CompactItem, child at the index.
+
+        """
+
+        return CompactItem(self.graph, int(self.graph.getChildIndices(self.index)[index]))
+
+
+    def getChildByName(self, name):
+        """Returns the first child with the specified name.
+
+        Arguments:
+        name -- String, name of the child.
+
+        Return:
+        CompactItem if found.
+        None if not found.
+
+        """
+
+        for child in self.children:
+            if child.getName() == name:
+                return child
+
+        return None
+
+
+    def walk(self):
+        """Iterates over the item and its descendants parents first.
+
+        Return:
+        Generator of CompactItem handles.
+
+        """
+
+        stack = [self.index]
+        while stack:
+            index = stack.pop()
+            yield CompactItem(self.graph, index)
+
+            stack.extend(int(x) for x in reversed(self.graph.getChildIndices(index)))
+
+
+    # ==================
+    # Transform Methods
+    # ==================
+    def getLocalXfo(self):
+        """Returns the transform of the item relative to its parent.
+
+        Return:
+        Xfo, local transform of the item.
+
+        """
+
+        return self.graph.getLocalXfo(self.index).clone()
+
+
+    def setLocalXfo(self, xfo):
+        """Sets the transform of the item relative to its parent.
+
+        Arguments:
+        xfo -- Xfo, local transform of the item.
+
+        Return:
+        True if successful.
+
+        """
+
+        return self.graph.setLocalXfo(self.index, xfo)
+
+
+    def _getXfo(self):
+        return WorldXfoView(self.graph, self.index)
+
+    def _setXfo(self, xfo):
+        self.graph.setWorldXfo(self.index, xfo)
+
+    xfo = property(_getXfo, _setXfo)
+
+
+# =================
+# World Xfo Classes
+# =================
+class _WorldVec3View(_Vec3View):
+    """Vec3 view calling back its WorldXfoView when it is modified."""
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, data, owner):
+        super(_WorldVec3View, self).__init__(data)
+        self._owner = owner
+
+
+    def _setX(self, value):
+        self._data[0] = value
+        self._owner._writeBack()
+
+    def _setY(self, value):
+        self._data[1] = value
+        self._owner._writeBack()
+
+    def _setZ(self, value):
+        self._data[2] = value
+        self._owner._writeBack()
+
+    x = property(_Vec3View._getX, _setX)
+    y = property(_Vec3View._getY, _setY)
+    z = property(_Vec3View._getZ, _setZ)
+
+
+class _WorldQuatView(_QuatView):
+    """Quat view calling back its WorldXfoView when it is modified."""
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, data, owner):
+        self._data = data
+        self._v = _WorldVec3View(data[0:3], owner)
+        self._owner = owner
+
+
+    def _setW(self, value):
+        self._data[3] = value
+        self._owner._writeBack()
+
+    w = property(_QuatView._getW, _setW)
+
+
+class WorldXfoView(_XfoView):
+    """World transform of an item of a CompactSceneGraph.
+
+    The transform is computed when the view is created. Editing it in place,
+    like item.xfo.tr.x += 1.0, sets the local transform of the item so it
+    ends up at the edited world transform.
+
+    """
+
+    __slots__ = ('_graph', '_itemIndex')
+
+    def __init__(self, graph, index):
+        array = XfoArray.fromXfos([graph.computeWorldXfo(index)])
+
+        self._graph = graph
+        self._itemIndex = index
+        self._array = array
+        self._index = 0
+        self._scl = _WorldVec3View(array.scl[0], self)
+        self._rot = _WorldQuatView(array.rot[0], self)
+        self._tr = _WorldVec3View(array.tr[0], self)
+        self.ro = 0
+
+
+    def _writeBack(self):
+        """Stores the edited world transform in the graph."""
+
+        self._graph.setWorldXfo(self._itemIndex, self._array.getXfo(0).clone())
@@ -7,6 +7,8 @@ Component -- Component representation.
 
 from kraken.core.maths import *
 from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.scene_item import cloneSubtrees
+from kraken.core.objects.change_tracker import markChanged
 from kraken.core.objects.components.component_input import ComponentInput
 from kraken.core.objects.components.component_output import ComponentOutput
 from kraken.core.objects.attributes.attribute_group import AttributeGroup
@@ -66,6 +68,8 @@ class BaseComponent(SceneItem):
         """
 
         self.location = location
+        self._resetBuildNames()
+        markChanged(self, 'location')
 
         return True
 
@@ -73,6 +77,49 @@ class BaseComponent(SceneItem):
     # =============
     # Name methods
     # =============
+    def setName(self, name):
+        """Sets the name of the component.
+
+        Arguments:
+        name -- String, new name of the component.
+
+        Return:
+        True if successful.
+
+        """
+
+        super(BaseComponent, self).setName(name)
+        self._resetBuildNames()
+
+        return True
+
+
+    def _resetBuildNames(self):
+        """Clears the cached build names of all objects of this component.
+
+        Objects of a component can live outside of its hierarchy, deformers
+        for example, so the whole hierarchy of the root is searched.
+
+        Return:
+        True if successful.
+
+        """
+
+        root = self.getRoot()
+
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            if item is self or item.component is self:
+                item._buildName = None
+
+            stack.extend(item.children)
+
+        root._resetBuildNameIndex()
+
+        return True
+
+
     def getComponentName(self):
         """Returns the name of the component used on self and all objects owned by the component
 
@@ -84,7 +131,7 @@ class BaseComponent(SceneItem):
         return self.getName() + '_' + self.getLocation()
 
 
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -107,6 +154,78 @@ class BaseComponent(SceneItem):
         return True
 
 
+    # ==============
+    # Clone Methods
+    # ==============
+    def clone(self, location=None, deep=True, shareShapes=True, remapXfo=None):
+        """Returns a copy of this component that isn't parented.
+
+        Objects of this component outside of its hierarchy, deformers for
+        example, are copied too and added to the parents of their originals.
+        Values the constructor derived from the location, like control colors,
+        are copied as they are.
+
+        Arguments:
+        location -- String, optional, location of the copy. Valid values: L, M, R.
+        deep -- Boolean, whether to copy the children too.
+        shareShapes -- Boolean, whether copied curves share their control points
+                       with the original until either of them sets new ones.
+        remapXfo -- Function, optional, called with the Xfo of each copy and
+                    returning the Xfo to use instead, mirrorXfo for example.
+
+        Return:
+        Component, copy of this component.
+
+        """
+
+        externalItems = []
+        if deep and self.parent is not None:
+            externalIds = set()
+            for item in self.getRoot().walk():
+                if item.component is not self or item is self or item.isChildOf(self):
+                    continue
+
+                externalIds.add(id(item))
+                if id(item.parent) not in externalIds:
+                    externalItems.append(item)
+
+        cloneMap = cloneSubtrees([self] + externalItems, deep=deep, shareShapes=shareShapes, remapXfo=remapXfo)
+
+        clone = cloneMap[id(self)]
+        if location is not None:
+            clone.setSide(location)
+
+        for item in externalItems:
+            item.getParent().addChild(cloneMap[id(item)])
+
+        return clone
+
+
+    def _remapReferences(self, cloneMap):
+        """Copies the inputs, outputs and operators of this copy and points them
+        to the copies of their objects.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        True if successful.
+
+        """
+
+        super(BaseComponent, self)._remapReferences(cloneMap)
+
+        self.inputs = [x._cloneItem(cloneMap) for x in self.inputs]
+        self.outputs = [x._cloneItem(cloneMap) for x in self.outputs]
+
+        operators = self.operators
+        self.operators = []
+        for operator in operators:
+            self.addOperator(operator._cloneItem(cloneMap))
+
+        return True
+
+
     # ==============
     # Input Methods
     # ==============
@@ -5,6 +5,8 @@ ComponentInput -- Component input representation.
 
 """
 
+import copy
+
 from kraken.core.objects.locator import Locator
 from kraken.core.objects.attributes.base_attribute import BaseAttribute
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
@@ -72,6 +74,18 @@ class ComponentInput(object):
 
         return self.getName()
 
+
+    def getKType(self):
+        """Returns the kType of this object.
+
+        Return:
+        String, kType of the object.
+
+        """
+
+        return self.__kType__
+
+
     # ===============
     # Component Methods
     # ===============
@@ -212,4 +226,29 @@ class ComponentInput(object):
         self.setDataType(None)
         self.setSource(None)
 
-        return True
\ No newline at end of file
+        return True
+
+
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap):
+        """Returns a copy of this input using the copies of its target, source
+        and component.
+
+        Objects that weren't copied are kept.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        ComponentInput, copy of this input.
+
+        """
+
+        clone = copy.copy(self)
+        clone.target = cloneMap.get(id(self.target), self.target)
+        clone.source = cloneMap.get(id(self.source), self.source)
+        clone.component = cloneMap.get(id(self.component), self.component)
+
+        return clone
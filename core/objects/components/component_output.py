@@ -5,6 +5,8 @@ ComponentOutput -- Component output representation.
 
 """
 
+import copy
+
 from kraken.core.objects.locator import Locator
 from kraken.core.objects.attributes.base_attribute import BaseAttribute
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
@@ -71,6 +73,18 @@ class ComponentOutput(object):
 
         return self.getName()
 
+
+    def getKType(self):
+        """Returns the kType of this object.
+
+        Return:
+        String, kType of the object.
+
+        """
+
+        return self.__kType__
+
+
     # ===============
     # Component Methods
     # ===============
@@ -212,4 +226,29 @@ class ComponentOutput(object):
         self.setDataType(None)
         self.setSource(None)
 
-        return True
\ No newline at end of file
+        return True
+
+
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap):
+        """Returns a copy of this output using the copies of its target, source
+        and component.
+
+        Objects that weren't copied are kept.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        ComponentOutput, copy of this output.
+
+        """
+
+        clone = copy.copy(self)
+        clone.target = cloneMap.get(id(self.target), self.target)
+        clone.source = cloneMap.get(id(self.source), self.source)
+        clone.component = cloneMap.get(id(self.component), self.component)
+
+        return clone
@@ -5,6 +5,8 @@ BaseConstraint - Base Constraint.
 
 """
 
+import copy
+
 from kraken.core.objects.scene_item import SceneItem
 
 
@@ -196,6 +198,31 @@ class BaseConstraint(object):
 
 
 
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap):
+        """Returns a copy of this constraint using the copies of its constrainers.
+
+        Constrainers that weren't copied are kept. The constrainee is set when
+        the copy is added to an object.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        Constraint, copy of this constraint.
+
+        """
+
+        clone = copy.copy(self)
+        clone.parent = None
+        clone.constrainee = None
+        clone.constrainers = [cloneMap.get(id(x), x) for x in self.constrainers]
+
+        return clone
+
+
     # ================
     # Persistence Methods
     # ================
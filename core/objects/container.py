@@ -5,7 +5,10 @@ Container -- Component container representation.
 
 """
 
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.curve import Curve
+from kraken.core.objects.layer import Layer
 from kraken.core.objects.components.base_component import BaseComponent
 
 
@@ -15,16 +18,23 @@ class Container(SceneItem):
     __kType__ = "Container"
 
     def __init__(self, name):
+        self._pathIndex = {}
+        self._nameIndex = {}
+        self._kTypeIndex = {}
+        self._classIndex = {}
+        self._buildNameIndex = None
+
         super(Container, self).__init__(name, None)
 
         self.setShapeVisibility(False)
+        self._indexSubtree(self)
 
 
     # =============
     # Name methods
     # =============
 
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -61,7 +71,7 @@ class Container(SceneItem):
 
         """
 
-        return len(self.getChildrenByType(BaseComponent))
+        return sum(1 for x in self.children if isinstance(x, BaseComponent))
 
 
     def addComponent(self, component):
@@ -90,5 +100,334 @@ class Container(SceneItem):
 
         """
 
-        component.setParent(None)
-        return self.removeChild(componentName)
\ No newline at end of file
+        return self.removeChildByName(componentName)
+
+
+    def assembleComponents(self, factories, connections=None, pool=None):
+        """Constructs components independently of each other, adds them to
+        their layers and connects them.
+
+        Each component is constructed in its own detached container that has
+        layers with the names of the layers of this one, so pool workers don't
+        share any objects. The components are then moved to this container in
+        the order of the factories.
+
+        Arguments:
+        factories -- List, (layer name, factory) pairs. A factory is called
+                     with the layer to construct the component in and returns
+                     the component, functools.partial(ArmComponent, 'arm',
+                     location='L') for example. Process pools require
+                     picklable factories.
+        connections -- List, optional, (source component, output name, target
+                       component, input name) tuples. Components are named by
+                       getComponentName(), 'arm_L' for example, and can
+                       already be in this container.
+        pool -- Object, optional, pool with a map method used to construct
+                the components, like multiprocessing.Pool or
+                multiprocessing.pool.ThreadPool. Without one the components
+                are constructed one after another.
+
+        Return:
+        List, assembled components in the order of the factories.
+
+        """
+
+        layerNames = [x.getName() for x in self.children if isinstance(x, Layer)]
+        for layerName, factory in factories:
+            if layerName not in layerNames:
+                raise ValueError("'" + layerName + "' is not a layer of container '" + self.getName() + "'.")
+
+        jobs = [(self.getName(), layerNames, layerName, factory) for layerName, factory in factories]
+
+        if pool is None:
+            results = [_constructComponent(x) for x in jobs]
+        else:
+            results = pool.map(_constructComponent, jobs)
+
+        components = []
+        for detachedContainer, component in results:
+            # Components constructed in other processes lost the shared
+            # control points, so they are interned again.
+            if pool is not None:
+                for curve in detachedContainer.getItemsByClass(Curve):
+                    curve.controlPoints = [internPoints(x) for x in curve.controlPoints]
+
+            for detachedLayer in list(detachedContainer.children):
+                layer = self.getChildByName(detachedLayer.getName())
+                for child in list(detachedLayer.children):
+                    layer.addChild(child)
+
+            components.append(component)
+
+        if connections:
+            componentsByName = {}
+            for component in self.getItemsByClass(BaseComponent):
+                componentsByName[component.getComponentName()] = component
+
+            for sourceName, outputName, targetName, inputName in connections:
+                for name in (sourceName, targetName):
+                    if name not in componentsByName:
+                        raise ValueError("'" + name + "' is not a component of container '" + self.getName() + "'.")
+
+                componentOutput = componentsByName[sourceName].getOutputByName(outputName)
+                if componentOutput is None:
+                    raise ValueError("'" + outputName + "' is not an output of component '" + sourceName + "'.")
+
+                componentInput = componentsByName[targetName].getInputByName(inputName)
+                if componentInput is None:
+                    raise ValueError("'" + inputName + "' is not an input of component '" + targetName + "'.")
+
+                componentInput.setSource(componentOutput.getTarget())
+
+        return components
+
+
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap, shareShapes):
+        """Returns a copy of this container with empty lookup indexes.
+
+        The indexes are filled once the copied hierarchy is complete.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original, the copy is added.
+        shareShapes -- Boolean, whether curves share their control points.
+
+        Return:
+        Container, copy of this container.
+
+        """
+
+        clone = super(Container, self)._cloneItem(cloneMap, shareShapes)
+        clone._pathIndex = {}
+        clone._nameIndex = {}
+        clone._kTypeIndex = {}
+        clone._classIndex = {}
+        clone._buildNameIndex = None
+
+        return clone
+
+
+    # ==============
+    # Index Methods
+    # ==============
+    def _indexSubtree(self, item):
+        """Adds an object and its descendants to the lookup index.
+
+        Arguments:
+        item -- Object, top of the subtree that was added below this container.
+
+        """
+
+        self._buildNameIndex = None
+
+        stack = [(item, item.getFullName())]
+        while stack:
+            eachItem, path = stack.pop()
+
+            self._pathIndex.setdefault(path, []).append(eachItem)
+            self._nameIndex.setdefault(eachItem.getName(), []).append(eachItem)
+            self._kTypeIndex.setdefault(eachItem.getKType(), []).append(eachItem)
+
+            for cls in type(eachItem).__mro__:
+                if cls is object:
+                    break
+
+                self._classIndex.setdefault(cls, []).append(eachItem)
+
+            for child in reversed(eachItem.children):
+                stack.append((child, path + '.' + child.getName()))
+
+
+    def _unindexSubtree(self, item):
+        """Removes an object and its descendants from the lookup index.
+
+        Objects that are not in the index are ignored.
+
+        Arguments:
+        item -- Object, top of the subtree that is removed from below this container.
+
+        """
+
+        self._buildNameIndex = None
+
+        stack = [(item, item.getFullName())]
+        while stack:
+            eachItem, path = stack.pop()
+
+            _removeFromIndex(self._pathIndex, path, eachItem)
+            _removeFromIndex(self._nameIndex, eachItem.getName(), eachItem)
+            _removeFromIndex(self._kTypeIndex, eachItem.getKType(), eachItem)
+
+            for cls in type(eachItem).__mro__:
+                if cls is object:
+                    break
+
+                _removeFromIndex(self._classIndex, cls, eachItem)
+
+            for child in eachItem.children:
+                stack.append((child, path + '.' + child.getName()))
+
+
+    def _resetBuildNameIndex(self):
+        """Discards the build name index after a build name changed."""
+
+        self._buildNameIndex = None
+
+
+    def _getIndexedItems(self, indexName, key):
+        """Returns the objects stored under a key of a lookup index.
+
+        The build name index depends on the components of the objects, so it is
+        built on first use and discarded whenever the hierarchy changes.
+
+        Arguments:
+        indexName -- String, index to query: 'path', 'name', 'kType', 'class'
+                     or 'buildName'.
+        key -- String / Class, key to look up.
+
+        Return:
+        List of objects, empty if nothing is stored under the key.
+
+        """
+
+        if indexName == 'path':
+            index = self._pathIndex
+        elif indexName == 'name':
+            index = self._nameIndex
+        elif indexName == 'kType':
+            index = self._kTypeIndex
+        elif indexName == 'class':
+            index = self._classIndex
+        elif indexName == 'buildName':
+            if self._buildNameIndex is None:
+                self._buildNameIndex = {}
+                for items in self._pathIndex.itervalues():
+                    for eachItem in items:
+                        self._buildNameIndex.setdefault(eachItem.getBuildName(), []).append(eachItem)
+
+            index = self._buildNameIndex
+        else:
+            raise ValueError("Container: Invalid index name '" + str(indexName) + "'.")
+
+        return index.get(key, [])
+
+
+    def getItemByPath(self, path):
+        """Returns the object with the given full name.
+
+        Arguments:
+        path -- String, full hierarchical name of the object, see getFullName.
+
+        Return:
+        Object if found.
+        None if not found.
+
+        """
+
+        items = self._getIndexedItems('path', path)
+        if items:
+            return items[0]
+
+        return None
+
+
+    def getItemsByName(self, name):
+        """Returns all objects in the container with the given name.
+
+        Arguments:
+        name -- String, name of the objects to find.
+
+        Return:
+        List of objects with the name.
+
+        """
+
+        return list(self._getIndexedItems('name', name))
+
+
+    def getItemsByBuildName(self, buildName):
+        """Returns all objects in the container with the given build name.
+
+        Arguments:
+        buildName -- String, build name of the objects to find.
+
+        Return:
+        List of objects with the build name.
+
+        """
+
+        return list(self._getIndexedItems('buildName', buildName))
+
+
+    def getItemsByKType(self, kType):
+        """Returns all objects in the container of the given kType.
+
+        Arguments:
+        kType -- String, kType of the objects to find, see getKType.
+
+        Return:
+        List of objects of the kType.
+
+        """
+
+        return list(self._getIndexedItems('kType', kType))
+
+
+    def getItemsByClass(self, cls):
+        """Returns all objects in the container that are instances of a class.
+
+        Arguments:
+        cls -- Class, class of the objects to find, subclasses match too.
+
+        Return:
+        List of objects of the class.
+
+        """
+
+        return list(self._getIndexedItems('class', cls))
+
+
+# ===============
+# Helper Methods
+# ===============
+def _constructComponent(job):
+    """Constructs a component in a detached container.
+
+    Module level so process pools can pickle it.
+
+    Arguments:
+    job -- Tuple, container name, layer names, layer name of the component and
+           the factory constructing it.
+
+    Return:
+    Tuple, the detached container and the component.
+
+    """
+
+    containerName, layerNames, layerName, factory = job
+
+    detachedContainer = Container(containerName)
+    for name in layerNames:
+        Layer(name, parent=detachedContainer)
+
+    component = factory(detachedContainer.getChildByName(layerName))
+
+    return detachedContainer, component
+
+
+def _removeFromIndex(index, key, item):
+    """Removes an object from the list stored under a key of an index."""
+
+    items = index.get(key)
+    if items is None:
+        return
+
+    for i, eachItem in enumerate(items):
+        if eachItem is item:
+            del items[i]
+            break
+
+    if not items:
+        del index[key]
@@ -6,9 +6,15 @@ ArrowControl - Arrow Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_ARROW_SECTIONS = (
+    (internPoints([Vec3(-0.05, 0.0, -0.25), Vec3(-0.15, 0.0, -0.25), Vec3(0.0, -0.0, -0.5), Vec3(0.15, 0.0, -0.25), Vec3(0.05, 0.0, -0.25), Vec3(0.05, 0.0, 0.5), Vec3(-0.05, 0.0, 0.5)]), True),
+)
+
+
 class ArrowControl(BaseControl):
     """Arrow Control object."""
 
@@ -22,4 +28,6 @@ class ArrowControl(BaseControl):
         """
 
         super(ArrowControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(-0.05, 0.0, -0.25), Vec3(-0.15, 0.0, -0.25), Vec3(0.0, -0.0, -0.5), Vec3(0.15, 0.0, -0.25), Vec3(0.05, 0.0, -0.25), Vec3(0.05, 0.0, 0.5), Vec3(-0.05, 0.0, 0.5)], True)
\ No newline at end of file
+
+        for points, closed in _ARROW_SECTIONS:
+            self.addCurveSection(points, closed)
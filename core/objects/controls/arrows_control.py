@@ -6,9 +6,15 @@ ArrowsControl - Arrows Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_ARROWS_SECTIONS = (
+    (internPoints([Vec3(-0.05, 0.0, 0.05), Vec3(-0.05, 0.0, 0.25), Vec3(-0.15, 0.0, 0.25), Vec3(0.0, -0.0, 0.4), Vec3(0.15, 0.0, 0.25), Vec3(0.05, 0.0, 0.25), Vec3(0.05, 0.0, 0.05), Vec3(0.25, 0.0, 0.05), Vec3(0.25, 0.0, 0.15), Vec3(0.4, -0.0, 0.0), Vec3(0.25, 0.0, -0.15), Vec3(0.25, 0.0, -0.05), Vec3(0.05, 0.0, -0.05), Vec3(0.05, 0.0, -0.25), Vec3(0.15, 0.0, -0.25), Vec3(0.0, -0.0, -0.4), Vec3(-0.15, 0.0, -0.25), Vec3(-0.05, 0.0, -0.25), Vec3(-0.05, 0.0, -0.05), Vec3(-0.25, 0.0, -0.05), Vec3(-0.25, 0.0, -0.15), Vec3(-0.4, -0.0, -0.0), Vec3(-0.25, 0.0, 0.15), Vec3(-0.25, 0.0, 0.05)]), True),
+)
+
+
 class ArrowsControl(BaseControl):
     """Arrows Control object."""
 
@@ -22,4 +28,6 @@ class ArrowsControl(BaseControl):
         """
 
         super(ArrowsControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(-0.05, 0.0, 0.05), Vec3(-0.05, 0.0, 0.25), Vec3(-0.15, 0.0, 0.25), Vec3(0.0, -0.0, 0.4), Vec3(0.15, 0.0, 0.25), Vec3(0.05, 0.0, 0.25), Vec3(0.05, 0.0, 0.05), Vec3(0.25, 0.0, 0.05), Vec3(0.25, 0.0, 0.15), Vec3(0.4, -0.0, 0.0), Vec3(0.25, 0.0, -0.15), Vec3(0.25, 0.0, -0.05), Vec3(0.05, 0.0, -0.05), Vec3(0.05, 0.0, -0.25), Vec3(0.15, 0.0, -0.25), Vec3(0.0, -0.0, -0.4), Vec3(-0.15, 0.0, -0.25), Vec3(-0.05, 0.0, -0.25), Vec3(-0.05, 0.0, -0.05), Vec3(-0.25, 0.0, -0.05), Vec3(-0.25, 0.0, -0.15), Vec3(-0.4, -0.0, -0.0), Vec3(-0.25, 0.0, 0.15), Vec3(-0.25, 0.0, 0.05)], True)
\ No newline at end of file
+
+        for points, closed in _ARROWS_SECTIONS:
+            self.addCurveSection(points, closed)
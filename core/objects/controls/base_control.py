@@ -31,7 +31,7 @@ class BaseControl(Curve):
     # =============
     # Name methods
     # =============
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -39,7 +39,7 @@ class BaseControl(Curve):
 
         """
 
-        return super(Curve, self).getBuildName() + '_ctrl'
+        return super(Curve, self)._computeBuildName() + '_ctrl'
 
 
     # ==============
@@ -213,17 +213,11 @@ class BaseControl(Curve):
         quatRot = Quat()
         quatRot.setFromEuler(Euler(xRot, yRot, zRot))
 
-        newPoints = []
         for eachSection in controlPoints:
+            for eachPoint in eachSection:
+                quatRot.rotateVectorInto(eachPoint, eachPoint)
 
-            newSectionPoints = []
-            for i, eachPoint in enumerate(eachSection):
-                eachPoint = quatRot.rotateVector(eachPoint)
-                newSectionPoints.append(eachPoint)
-
-            newPoints.append(newSectionPoints)
-
-        self.setControlPoints(newPoints)
+        self.setControlPoints(controlPoints)
 
         return True
 
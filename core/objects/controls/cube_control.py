@@ -6,9 +6,20 @@ BaseControl - Base Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_CUBE_SECTIONS = (
+    (internPoints([Vec3(-0.5, -0.5, -0.5), Vec3(-0.5, 0.5, -0.5), Vec3(0.5, 0.5, -0.5), Vec3(0.5, -0.5, -0.5)]), True),
+    (internPoints([Vec3(-0.5, -0.5, 0.5), Vec3(-0.5, 0.5, 0.5), Vec3(0.5, 0.5, 0.5), Vec3(0.5, -0.5, 0.5)]), True),
+    (internPoints([Vec3(-0.5, -0.5, -0.5), Vec3(-0.5, -0.5, 0.5)]), False),
+    (internPoints([Vec3(0.5, -0.5, -0.5), Vec3(0.5, -0.5, 0.5)]), False),
+    (internPoints([Vec3(-0.5, 0.5, -0.5), Vec3(-0.5, 0.5, 0.5)]), False),
+    (internPoints([Vec3(0.5, 0.5, -0.5), Vec3(0.5, 0.5, 0.5)]), False),
+)
+
+
 class CubeControl(BaseControl):
     """Cube Control object."""
 
@@ -22,9 +33,6 @@ class CubeControl(BaseControl):
         """
 
         super(CubeControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(-0.5, -0.5, -0.5), Vec3(-0.5, 0.5, -0.5), Vec3(0.5, 0.5, -0.5), Vec3(0.5, -0.5, -0.5)], True)
-        self.addCurveSection([Vec3(-0.5, -0.5, 0.5), Vec3(-0.5, 0.5, 0.5), Vec3(0.5, 0.5, 0.5), Vec3(0.5, -0.5, 0.5)], True)
-        self.addCurveSection([Vec3(-0.5, -0.5, -0.5), Vec3(-0.5, -0.5, 0.5)], False)
-        self.addCurveSection([Vec3(0.5, -0.5, -0.5), Vec3(0.5, -0.5, 0.5)], False)
-        self.addCurveSection([Vec3(-0.5, 0.5, -0.5), Vec3(-0.5, 0.5, 0.5)], False)
-        self.addCurveSection([Vec3(0.5, 0.5, -0.5), Vec3(0.5, 0.5, 0.5)], False)
\ No newline at end of file
+
+        for points, closed in _CUBE_SECTIONS:
+            self.addCurveSection(points, closed)
@@ -6,9 +6,17 @@ NullControl - Null Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_NULL_SECTIONS = (
+    (internPoints([Vec3(-0.5, 0.0, 0.0), Vec3(0.5, 0.0, 0.0)]), False),
+    (internPoints([Vec3(0.0, -0.5, 0.0), Vec3(0.0, 0.5, 0.0)]), False),
+    (internPoints([Vec3(0.0, 0.0, -0.5), Vec3(0.0, 0.0, 0.5)]), False),
+)
+
+
 class NullControl(BaseControl):
     """Null Control object."""
 
@@ -22,6 +30,6 @@ class NullControl(BaseControl):
         """
 
         super(NullControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(-0.5, 0.0, 0.0), Vec3(0.5, 0.0, 0.0)], False)
-        self.addCurveSection([Vec3(0.0, -0.5, 0.0), Vec3(0.0, 0.5, 0.0)], False)
-        self.addCurveSection([Vec3(0.0, 0.0, -0.5), Vec3(0.0, 0.0, 0.5)], False)
\ No newline at end of file
+
+        for points, closed in _NULL_SECTIONS:
+            self.addCurveSection(points, closed)
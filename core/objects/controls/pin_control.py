@@ -6,9 +6,15 @@ PinControl - Pin Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_PIN_SECTIONS = (
+    (internPoints([Vec3(0.0, 0.0, -0.5), Vec3(-0.17, 0.0, -0.57), Vec3(-0.25, 0.0, -0.75), Vec3(-0.17, 0.0, -0.93), Vec3(0.0, 0.0, -1.0), Vec3(0.17, 0.0, -0.93), Vec3(0.25, 0.0, -0.75), Vec3(0.17, 0.0, -0.57), Vec3(0.0, 0.0, -0.5), Vec3(0.0, 0.0, 0.0)]), False),
+)
+
+
 class PinControl(BaseControl):
     """Pin Control object."""
 
@@ -22,4 +28,6 @@ class PinControl(BaseControl):
         """
 
         super(PinControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(0.0, 0.0, -0.5), Vec3(-0.17, 0.0, -0.57), Vec3(-0.25, 0.0, -0.75), Vec3(-0.17, 0.0, -0.93), Vec3(0.0, 0.0, -1.0), Vec3(0.17, 0.0, -0.93), Vec3(0.25, 0.0, -0.75), Vec3(0.17, 0.0, -0.57), Vec3(0.0, 0.0, -0.5), Vec3(0.0, 0.0, 0.0)], False)
\ No newline at end of file
+
+        for points, closed in _PIN_SECTIONS:
+            self.addCurveSection(points, closed)
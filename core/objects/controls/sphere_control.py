@@ -6,9 +6,17 @@ SphereControl - Sphere Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_SPHERE_SECTIONS = (
+    (internPoints([Vec3(0.0, 0.5, 0.0), Vec3(0.0, 0.35, -0.35), Vec3(0.0, 0.0, -0.5), Vec3(0.0, -0.35, -0.35), Vec3(0.0, -0.5, 0.0), Vec3(0.0, -0.35, 0.35), Vec3(0.0, 0.0, 0.5), Vec3(0.0, 0.35, 0.35)]), True),
+    (internPoints([Vec3(0.0, 0.0, -0.5), Vec3(0.35, 0.0, -0.35), Vec3(0.5, 0.0, 0.0), Vec3(0.35, 0.0, 0.35), Vec3(0.0, 0.0, 0.5), Vec3(-0.35, 0.0, 0.35), Vec3(-0.5, 0.0, 0.0), Vec3(-0.35, 0.0, -0.35)]), True),
+    (internPoints([Vec3(0.0, 0.5, 0.0), Vec3(0.35, 0.35, 0.0), Vec3(0.5, 0.0, 0.0), Vec3(0.35, -0.35, 0.0), Vec3(0.0, -0.5, 0.0), Vec3(-0.35, -0.35, 0.0), Vec3(-0.5, 0.0, 0.0), Vec3(-0.35, 0.35, 0.0)]), True),
+)
+
+
 class SphereControl(BaseControl):
     """Sphere Control object."""
 
@@ -22,6 +30,6 @@ class SphereControl(BaseControl):
         """
 
         super(SphereControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(0.0, 0.5, 0.0), Vec3(0.0, 0.35, -0.35), Vec3(0.0, 0.0, -0.5), Vec3(0.0, -0.35, -0.35), Vec3(0.0, -0.5, 0.0), Vec3(0.0, -0.35, 0.35), Vec3(0.0, 0.0, 0.5), Vec3(0.0, 0.35, 0.35)], True)
-        self.addCurveSection([Vec3(0.0, 0.0, -0.5), Vec3(0.35, 0.0, -0.35), Vec3(0.5, 0.0, 0.0), Vec3(0.35, 0.0, 0.35), Vec3(0.0, 0.0, 0.5), Vec3(-0.35, 0.0, 0.35), Vec3(-0.5, 0.0, 0.0), Vec3(-0.35, 0.0, -0.35)], True)
-        self.addCurveSection([Vec3(0.0, 0.5, 0.0), Vec3(0.35, 0.35, 0.0), Vec3(0.5, 0.0, 0.0), Vec3(0.35, -0.35, 0.0), Vec3(0.0, -0.5, 0.0), Vec3(-0.35, -0.35, 0.0), Vec3(-0.5, 0.0, 0.0), Vec3(-0.35, 0.35, 0.0)], True)
\ No newline at end of file
+
+        for points, closed in _SPHERE_SECTIONS:
+            self.addCurveSection(points, closed)
@@ -6,9 +6,15 @@ BaseControl - Base Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_SQUARE_SECTIONS = (
+    (internPoints([Vec3(0.5, 0.0, -0.5), Vec3(0.5, 0.0, 0.5), Vec3(-0.5, 0.0, 0.5), Vec3(-0.5, 0.0, -0.5)]), True),
+)
+
+
 class SquareControl(BaseControl):
     """Square Control object."""
 
@@ -22,4 +28,6 @@ class SquareControl(BaseControl):
         """
 
         super(SquareControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(0.5, 0.0, -0.5), Vec3(0.5, 0.0, 0.5), Vec3(-0.5, 0.0, 0.5), Vec3(-0.5, 0.0, -0.5)], True)
\ No newline at end of file
+
+        for points, closed in _SQUARE_SECTIONS:
+            self.addCurveSection(points, closed)
@@ -6,9 +6,15 @@ TriangleControl - Triangle Control.
 """
 
 from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import internPoints
 from kraken.core.objects.controls.base_control import BaseControl
 
 
+_TRIANGLE_SECTIONS = (
+    (internPoints([Vec3(0.0,0.0,-0.5), Vec3(-0.5,0.0,0.5), Vec3(0.5,0.0,0.5)]), True),
+)
+
+
 class TriangleControl(BaseControl):
     """Triangle Control object."""
 
@@ -22,4 +28,6 @@ class TriangleControl(BaseControl):
         """
 
         super(TriangleControl, self).__init__(name, parent=parent)
-        self.addCurveSection([Vec3(0.0,0.0,-0.5), Vec3(-0.5,0.0,0.5), Vec3(0.5,0.0,0.5)], True)
\ No newline at end of file
+
+        for points, closed in _TRIANGLE_SECTIONS:
+            self.addCurveSection(points, closed)
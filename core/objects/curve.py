@@ -5,9 +5,11 @@ Curve - Curve.
 
 """
 
-from kraken.core.objects.scene_item import SceneItem
+import hashlib
 
-import copy
+from kraken.core.maths import mathUtils
+from kraken.core.maths.constants import internPoints
+from kraken.core.objects.scene_item import SceneItem
 
 
 class Curve(SceneItem):
@@ -26,7 +28,7 @@ class Curve(SceneItem):
     # Name methods
     # =============
 
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -34,7 +36,7 @@ class Curve(SceneItem):
 
         """
 
-        return super(Curve, self).getBuildName() + '_crv'
+        return super(Curve, self)._computeBuildName() + '_crv'
 
 
     # ======================
@@ -68,14 +70,14 @@ class Curve(SceneItem):
 
 
     def copyControlPoints(self):
-        """Returns the control points of the curve.
+        """Returns a mutable copy of the control points of the curve.
 
         Return:
         Array of Vec3 positions.
 
         """
 
-        return copy.deepcopy(self.controlPoints)
+        return [[x.clone() for x in section] for section in self.controlPoints]
 
 
     def appendControlPoints(self, points):
@@ -94,6 +96,68 @@ class Curve(SceneItem):
         return True
 
 
+    def getControlPointsHash(self, precision=10e-6):
+        """Hashes the curve shape with point positions snapped to the given precision.
+
+        Curves whose points match within the precision and whose sections have
+        the same closed state usually hash the same, so the result can be used
+        to check if a shape changed between builds.
+
+        Arguments:
+        precision -- Float, size of the quantization step.
+
+        Return:
+        String, hex digest of the curve shape.
+
+        """
+
+        digest = hashlib.sha1()
+        for i, section in enumerate(self.controlPoints):
+            closed = i < len(self.closed) and self.closed[i]
+
+            values = []
+            for point in section:
+                values.extend((point.x, point.y, point.z))
+
+            digest.update(str(bool(closed)))
+            digest.update(mathUtils.quantizedHash(values, precision))
+
+        return digest.hexdigest()
+
+
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap, shareShapes):
+        """Returns a copy of this curve without its children and constraints.
+
+        When sharing shapes the sections of the original are frozen and both
+        curves reference them. Modifying either curve then requires setting
+        new points, as copyControlPoints / setControlPoints already do, which
+        leaves the other curve untouched.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original, the copy is added.
+        shareShapes -- Boolean, whether the copy shares the control points.
+
+        Return:
+        Curve, copy of this curve.
+
+        """
+
+        clone = super(Curve, self)._cloneItem(cloneMap, shareShapes)
+
+        if shareShapes:
+            self.controlPoints = [internPoints(x) for x in self.controlPoints]
+            clone.controlPoints = list(self.controlPoints)
+        else:
+            clone.controlPoints = self.copyControlPoints()
+
+        clone.closed = list(self.closed)
+
+        return clone
+
+
     # ======================
     # Curve Section Methods
     # ======================
@@ -211,4 +275,7 @@ class Curve(SceneItem):
 
         del self.controlPoints[index]
 
+        if index < len(self.closed):
+            del self.closed[index]
+
         return True
\ No newline at end of file
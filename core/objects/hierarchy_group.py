@@ -23,7 +23,7 @@ class HierarchyGroup(SceneItem):
     # Name methods
     # =============
 
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -31,4 +31,4 @@ class HierarchyGroup(SceneItem):
 
         """
 
-        return super(HierarchyGroup, self).getBuildName() + '_hrc'
\ No newline at end of file
+        return super(HierarchyGroup, self)._computeBuildName() + '_hrc'
\ No newline at end of file
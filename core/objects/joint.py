@@ -21,7 +21,7 @@ class Joint(SceneItem):
     # Name methods
     # =============
 
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -29,4 +29,4 @@ class Joint(SceneItem):
 
         """
 
-        return super(Joint, self).getBuildName() + '_def'
\ No newline at end of file
+        return super(Joint, self)._computeBuildName() + '_def'
\ No newline at end of file
@@ -55,6 +55,9 @@ class KrakenLoader(object):
 
         # A dictionary of all the built elements during loading.
         self.builtItems = {}
+        # The built elements stored by their short name, used to resolve
+        # references that were saved without the full path.
+        self.builtItemsByName = {}
         # the most recent item build during loading. This item is the parent
         # of subsequently built items. 
         self.parentItems = []
@@ -124,15 +127,85 @@ class KrakenLoader(object):
             return None
         if name in self.builtItems:
             return self.builtItems[name]
+        if name in self.builtItemsByName:
+            return self.builtItemsByName[name][0]
         raise Exception("SceneItem not found:" + str(name))
 
 
     def construct(self, jsonData):
         """Returns a constructed scene item based on the provided json data.
 
+        Scene item hierarchies are constructed without recursion. Each item goes
+        through the same steps as SceneItem.jsonDecode, in the same order.
+
         Return:
         The constructed scene item.
 
+        """
+
+        rootItem = self._beginItem(jsonData)
+        if not isinstance(rootItem, SceneItem):
+            rootItem.jsonDecode(self, jsonData)
+            self.parentItems.pop()
+            return rootItem
+
+        rootItem._jsonDecodeProperties(self, jsonData)
+
+        stack = [(rootItem, jsonData, iter(jsonData['children']))]
+        while stack:
+            item, itemData, children = stack[-1]
+
+            childData = next(children, None)
+            if childData is not None:
+                child = self._beginItem(childData)
+                if isinstance(child, SceneItem):
+                    child._jsonDecodeProperties(self, childData)
+                    stack.append((child, childData, iter(childData['children'])))
+                else:
+                    child.jsonDecode(self, childData)
+                    self.parentItems.pop()
+                    item.addChild(child)
+
+                continue
+
+            item._jsonDecodeDependents(self, itemData)
+
+            # Pop the parent item stack, which reverts the current parent item
+            # to the previous value.
+            self.parentItems.pop()
+            stack.pop()
+
+            if stack:
+                stack[-1][0].addChild(item)
+
+        return rootItem
+
+
+    def _beginItem(self, jsonData):
+        """Creates the item for the json data, registers it and makes it the
+        current parent item.
+
+        Return:
+        The created item, still to be decoded.
+
+        """
+
+        item = self._createItem(jsonData)
+
+        self.registerItem(item)
+        # Store the item as the parent item before decoding the object
+        # which in turn decodes the children items.
+        self.parentItems.append(item)
+
+        return item
+
+
+    def _createItem(self, jsonData):
+        """Returns a new, empty item of the type stored in the json data.
+
+        Return:
+        The created item.
+
         """
         if '__typeHierarchy__' not in jsonData or 'name' not in jsonData:
             raise Exception("Invalid JSON data for constructing scene item:" + str(jsonData));
@@ -267,15 +340,6 @@ class KrakenLoader(object):
         else:
             raise Exception("KrakenLoader does not support the given type:" + __kType__)
 
-        self.registerItem(item)
-        # Store the item as the parent item before decoding the object
-        # which in turn decodes the children items. 
-        self.parentItems.append(item)
-        item.jsonDecode(self, jsonData)
-
-        # Pop the parent item stack, which reverts the current parent item 
-        # to the previous value. 
-        self.parentItems.pop()
         return item
 
     def registerItem(self, item):
@@ -292,6 +356,7 @@ class KrakenLoader(object):
             print "Warning. Non unique names used in Kraken:" + item.getFullName()
             
         self.builtItems[item.getFullName()] = item
+        self.builtItemsByName.setdefault(item.getName(), []).append(item)
 
         # Fire any registered callbacks for this item. 
         # This enables the loading of objects already created,
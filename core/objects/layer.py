@@ -46,7 +46,7 @@ class Layer(SceneItem):
 
         """
 
-        return len(self.getChildrenByType(BaseComponent))
+        return sum(1 for x in self.children if isinstance(x, BaseComponent))
 
 
     def addComponent(self, component):
@@ -75,5 +75,32 @@ class Layer(SceneItem):
 
         """
 
-        component.setParent(None)
-        return self.removeChild(componentName)
\ No newline at end of file
+        return self.removeChildByName(componentName)
+
+
+    def assembleComponents(self, factories, connections=None, pool=None):
+        """Constructs components independently of each other, adds them to
+        this layer and connects them.
+
+        See Container.assembleComponents, this layer has to be a child of the
+        container.
+
+        Arguments:
+        factories -- List, factories called with the layer to construct the
+                     component in and returning the component.
+        connections -- List, optional, (source component, output name, target
+                       component, input name) tuples.
+        pool -- Object, optional, pool with a map method used to construct
+                the components.
+
+        Return:
+        List, assembled components in the order of the factories.
+
+        """
+
+        container = self.getParent()
+        if container is None or not hasattr(container, 'assembleComponents'):
+            raise ValueError("Layer '" + self.getName() + "' is not a child of a container.")
+
+        return container.assembleComponents([(self.getName(), x) for x in factories],
+                                            connections=connections, pool=pool)
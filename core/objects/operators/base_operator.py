@@ -5,6 +5,8 @@ BaseOperator - Base operator object.
 
 """
 
+import copy
+
 
 class BaseOperator(object):
     """Base Operator representation."""
@@ -162,4 +164,29 @@ class BaseOperator(object):
         if name not in self.outputs.keys():
             raise Exception("Output with name '" + name + "' was not found in operator: " + self.getName() + ".")
 
-        return self.outputs[name]
\ No newline at end of file
+        return self.outputs[name]
+
+
+    # ==============
+    # Clone Methods
+    # ==============
+    def _cloneItem(self, cloneMap):
+        """Returns a copy of this operator using the copies of its inputs and
+        outputs.
+
+        Objects that weren't copied are kept.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        Operator, copy of this operator.
+
+        """
+
+        clone = copy.copy(self)
+        clone.parent = None
+        clone.inputs = dict((k, cloneMap.get(id(v), v)) for k, v in self.inputs.iteritems())
+        clone.outputs = dict((k, cloneMap.get(id(v), v)) for k, v in self.outputs.iteritems())
+
+        return clone
@@ -0,0 +1,344 @@
+"""Kraken - objects.ordered_collection module.
+
+Classes:
+OrderedCollection - Insertion ordered collection of named objects.
+
+"""
+
+# Marker left in the item list in place of a removed item until the list is
+# compacted.
+_REMOVED = object()
+
+
+class OrderedCollection(object):
+    """Insertion ordered collection of named objects.
+
+    Membership, lookup by name and removal are constant time. Items are
+    compared by identity and keyed by their getName() value, names don't have
+    to be unique. The collection behaves like a read only list for iteration,
+    len(), indexing and index(), so existing code can keep treating it as one.
+
+    """
+
+    def __init__(self, items=None):
+        super(OrderedCollection, self).__init__()
+        self._items = []
+        self._positions = {}
+        self._keys = {}
+        self._names = {}
+        self._holes = 0
+
+        if items is not None:
+            self.extend(items)
+
+
+    # =======================
+    # List Emulation Methods
+    # =======================
+    def __len__(self):
+        return len(self._items) - self._holes
+
+
+    def __iter__(self):
+        for item in self._items:
+            if item is not _REMOVED:
+                yield item
+
+
+    def __reversed__(self):
+        for item in reversed(self._items):
+            if item is not _REMOVED:
+                yield item
+
+
+    def __contains__(self, item):
+        return id(item) in self._positions
+
+
+    def __getitem__(self, index):
+        self._compact()
+
+        return self._items[index]
+
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for item in self[index]:
+                self.remove(item)
+
+            return
+
+        self.remove(self[index])
+
+
+    def __repr__(self):
+        return "OrderedCollection(" + repr(list(self)) + ")"
+
+
+    def __getstate__(self):
+        # Positions and keys are stored by id, which doesn't survive pickling.
+        # Names are stored too as the items may not be restored yet when the
+        # collection is.
+        return [(x, self._keys[id(x)]) for x in self]
+
+
+    def __setstate__(self, state):
+        self.__init__()
+        for item, key in state:
+            self._append(item, key)
+
+
+    # ============
+    # Add Methods
+    # ============
+    def append(self, item):
+        """Adds an item to the end of the collection.
+
+        Arguments:
+        item -- Object, item to add.
+
+        Return:
+        True if successful.
+
+        """
+
+        if id(item) in self._positions:
+            raise ValueError("OrderedCollection.append: item '" + item.getName() + "' is already in the collection.")
+
+        self._append(item, item.getName())
+
+        return True
+
+
+    def _append(self, item, key):
+        """Adds an item under the specified name to the end of the collection.
+
+        Arguments:
+        item -- Object, item to add.
+        key -- String, name to store the item under.
+
+        """
+
+        self._positions[id(item)] = len(self._items)
+        self._keys[id(item)] = key
+        self._names.setdefault(key, []).append(item)
+        self._items.append(item)
+
+
+    def insert(self, index, item):
+        """Inserts an item before the specified position.
+
+        Unlike append this renumbers the positions of the items after it.
+
+        Arguments:
+        index -- Integer, position to insert the item at.
+        item -- Object, item to insert.
+
+        Return:
+        True if successful.
+
+        """
+
+        if id(item) in self._positions:
+            raise ValueError("OrderedCollection.insert: item '" + item.getName() + "' is already in the collection.")
+
+        key = item.getName()
+
+        self._compact()
+        self._items.insert(index, item)
+        self._positions = dict((id(x), i) for i, x in enumerate(self._items))
+        self._keys[id(item)] = key
+
+        items = self._names.setdefault(key, [])
+        items.append(item)
+        items.sort(key=lambda x: self._positions[id(x)])
+
+        return True
+
+
+    def extend(self, items):
+        """Adds items to the end of the collection.
+
+        Arguments:
+        items -- Iterable, items to add.
+
+        Return:
+        True if successful.
+
+        """
+
+        for item in items:
+            self.append(item)
+
+        return True
+
+
+    # ===============
+    # Remove Methods
+    # ===============
+    def remove(self, item):
+        """Removes an item from the collection.
+
+        Arguments:
+        item -- Object, item to remove.
+
+        Return:
+        True if successful.
+
+        """
+
+        position = self._positions.pop(id(item), None)
+        if position is None:
+            raise ValueError("OrderedCollection.remove: item is not in the collection.")
+
+        key = self._keys.pop(id(item))
+        _removeByIdentity(self._names, key, item)
+
+        self._items[position] = _REMOVED
+        self._holes += 1
+
+        # Compact once removed markers make up most of the list so iteration
+        # doesn't degrade after many removals.
+        if self._holes > 8 and self._holes * 2 > len(self._items):
+            self._compact()
+
+        return True
+
+
+    def _compact(self):
+        """Drops the markers left by removed items and renumbers the positions.
+
+        Return:
+        True if successful.
+
+        """
+
+        if self._holes == 0:
+            return True
+
+        self._items = [x for x in self._items if x is not _REMOVED]
+        self._positions = dict((id(x), i) for i, x in enumerate(self._items))
+        self._holes = 0
+
+        return True
+
+
+    # ===============
+    # Lookup Methods
+    # ===============
+    def index(self, item):
+        """Returns the position of an item in the collection.
+
+        Arguments:
+        item -- Object, item to find.
+
+        Return:
+        Integer, position of the item.
+
+        """
+
+        if id(item) not in self._positions:
+            raise ValueError("OrderedCollection.index: item is not in the collection.")
+
+        self._compact()
+
+        return self._positions[id(item)]
+
+
+    def hasName(self, name):
+        """Checks if an item with the specified name is in the collection.
+
+        Arguments:
+        name -- String, name to check.
+
+        Return:
+        True if an item has the name.
+
+        """
+
+        return name in self._names
+
+
+    def getByName(self, name):
+        """Returns the first item with the specified name.
+
+        Arguments:
+        name -- String, name of the item.
+
+        Return:
+        Object if found.
+        None if not found.
+
+        """
+
+        items = self._names.get(name)
+        if items is None:
+            return None
+
+        return items[0]
+
+
+    def getAllByName(self, name):
+        """Returns all items with the specified name in insertion order.
+
+        Arguments:
+        name -- String, name of the items.
+
+        Return:
+        List of the items with the name.
+
+        """
+
+        return list(self._names.get(name, []))
+
+
+    def rename(self, item):
+        """Updates the name an item is stored under after it was renamed.
+
+        Arguments:
+        item -- Object, renamed item.
+
+        Return:
+        True if the item is in the collection.
+
+        """
+
+        oldKey = self._keys.get(id(item))
+        if oldKey is None:
+            return False
+
+        key = item.getName()
+        if key == oldKey:
+            return True
+
+        _removeByIdentity(self._names, oldKey, item)
+        self._keys[id(item)] = key
+
+        items = self._names.setdefault(key, [])
+        items.append(item)
+        items.sort(key=lambda x: self._positions[id(x)])
+
+        return True
+
+
+# ===============
+# Helper Methods
+# ===============
+def _removeByIdentity(names, key, item):
+    """Removes an item from the list of items stored under a name.
+
+    Arguments:
+    names -- Dict, lists of items by name.
+    key -- String, name the item is stored under.
+    item -- Object, item to remove.
+
+    """
+
+    items = names[key]
+    for i, eachItem in enumerate(items):
+        if eachItem is item:
+            del items[i]
+            break
+
+    if not items:
+        del names[key]
@@ -5,8 +5,14 @@ SceneItem - Base SceneItem Object.
 
 """
 
+import collections
+import copy
+
 from kraken.core.maths.xfo import Xfo
 from kraken.core.objects.attributes.attribute_group import AttributeGroup
+from kraken.core.objects.ordered_collection import OrderedCollection
+from kraken.core.objects.change_tracker import markChanged
+from kraken.core.objects.change_tracker import getChangeTracker
 
 
 class SceneItem(object):
@@ -17,13 +23,18 @@ class SceneItem(object):
     def __init__(self, name, parent=None):
         super(SceneItem, self).__init__()
         self.name = name
+        self._fullName = None
+        self._buildName = None
         self.parent = None
         self.component = None
-        self.children = []
+        self.children = OrderedCollection()
         self.flags = {}
-        self.attributeGroups = []
-        self.constraints = []
+        self.attributeGroups = OrderedCollection()
+        self._defaultAttrGroupPending = True
+        self.constraints = OrderedCollection()
         self.xfo = Xfo()
+        self._localXfoCache = None
+        self._trackedXfoKey = None
         self.color = None
         self.visibility = True
         self.shapeVisibility = True
@@ -31,9 +42,6 @@ class SceneItem(object):
         if parent is not None:
             parent.addChild(self)
 
-        defaultAttrGroup = AttributeGroup("")
-        self.addAttributeGroup(defaultAttrGroup)
-
 
     # =============
     # Name methods
@@ -49,23 +57,95 @@ class SceneItem(object):
         return self.name
 
 
+    def setName(self, name):
+        """Sets the name of the object.
+
+        Arguments:
+        name -- String, new name of the object.
+
+        Return:
+        True if successful.
+
+        """
+
+        root = self.getRoot()
+
+        indexed = self._isIndexed()
+        if indexed:
+            root._unindexSubtree(self)
+
+        self.name = name
+        self._resetNames()
+
+        if self.parent is not None:
+            self.parent.children.rename(self)
+
+        if indexed:
+            root._indexSubtree(self)
+
+        markChanged(self, 'name')
+
+        return True
+
+
     def getFullName(self):
         """Returns the full hierarchical path to this object.
 
+        The result is cached until this object or one of its parents is renamed
+        or reparented.
+
         Return:
         String, full name of the object.
 
         """
 
-        if self.parent is not None:
-            return self.parent.getFullName() + '.' + self.getName()
+        if self._fullName is None:
 
-        return self.getName()
+            # Walk up to the first object with a cached name, then fill in the
+            # names on the way down, so deep hierarchies do not recurse.
+            items = []
+            item = self
+            while item is not None and item._fullName is None:
+                items.append(item)
+                item = item.parent
+
+            if item is None:
+                fullName = None
+            else:
+                fullName = item.getFullName()
+
+            for item in reversed(items):
+                if fullName is None:
+                    fullName = item.getName()
+                else:
+                    fullName = fullName + '.' + item.getName()
+
+                item._fullName = fullName
+
+        return self._fullName
 
 
     def getBuildName(self):
         """Returns the name used when building the node in the target application.
 
+        The result is cached until the name or component of the object changes.
+
+        Return:
+        String, build name of the object.
+
+        """
+
+        if self._buildName is None:
+            self._buildName = self._computeBuildName()
+
+        return self._buildName
+
+
+    def _computeBuildName(self):
+        """Returns the name used when building the node in the target application.
+
+        Classes that decorate the build name override this method.
+
         Return:
         String, build name of the object.
 
@@ -77,6 +157,29 @@ class SceneItem(object):
         return self.getName()
 
 
+    def _resetNames(self):
+        """Clears the cached full and build names of this object and everything
+        below it.
+
+        Return:
+        True if successful.
+
+        """
+
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            item._fullName = None
+            item._buildName = None
+
+            for attributeGroup in item.attributeGroups:
+                attributeGroup._resetNames()
+
+            stack.extend(item.children)
+
+        return True
+
+
     # ===============
     # Parent Methods
     # ===============
@@ -102,14 +205,44 @@ class SceneItem(object):
 
         """
 
+        oldParent = self.parent
+
+        if oldParent is not None and oldParent is not parent and oldParent._isIndexed():
+            oldParent.getRoot()._unindexSubtree(self)
+
         self.parent = parent
 
+        if parent is not oldParent:
+            self._resetNames()
+
+        # Objects are indexed when they are attached below an indexed parent.
+        # Hierarchies assembled away from the root, like during loading, are
+        # indexed once when their top object is attached.
+        if parent is not None and parent._isIndexed():
+            if parent is not oldParent or not self._isIndexed():
+                parent.getRoot()._indexSubtree(self)
+
         return True
 
 
     # ===============
     # Hierarchy Methods
     # ===============
+    def getRoot(self):
+        """Returns the top most object of the hierarchy this object is in.
+
+        Return:
+        Root object, self if this object has no parent.
+
+        """
+
+        root = self
+        while root.parent is not None:
+            root = root.parent
+
+        return root
+
+
     def getLayer(self):
         """Returns the Layer of the object as an object.
 
@@ -161,6 +294,8 @@ class SceneItem(object):
         """
 
         self.component = component
+        self._buildName = None
+        self.getRoot()._resetBuildNameIndex()
 
         return True
 
@@ -203,9 +338,12 @@ class SceneItem(object):
             parent = child.getParent()
             if child in parent.children:
                 parent.children.remove(child)
+                markChanged(parent, 'children')
 
         self.children.append(child)
         child.setParent(self)
+        markChanged(self, 'children')
+        markChanged(child, 'parent')
 
         # Assign the child the same component.
         if self.component is not None:
@@ -228,7 +366,10 @@ class SceneItem(object):
         if self.checkChildIndex(index) is not True:
             return False
 
+        self.getRoot()._unindexSubtree(self.children[index])
+
         del self.children[index]
+        markChanged(self, 'children')
 
         return True
 
@@ -244,16 +385,14 @@ class SceneItem(object):
 
         """
 
-        removeIndex = None
-
-        for i, eachChild in enumerate(self.children):
-            if eachChild.getName() == name:
-                removeIndex = i
-
-        if removeIndex is None:
+        childItems = self.children.getAllByName(name)
+        if not childItems:
             raise ValueError("'" + name + "' is not a valid child of this object.")
 
-        self.removeChildByIndex(removeIndex)
+        # Children can share names, the last one added is removed.
+        self.getRoot()._unindexSubtree(childItems[-1])
+        self.children.remove(childItems[-1])
+        markChanged(self, 'children')
 
         return True
 
@@ -295,31 +434,21 @@ class SceneItem(object):
 
         """
 
-        for eachChild in self.children:
-            if eachChild.getName() == name:
-                return eachChild
-
-        return None
+        return self.children.getByName(name)
 
 
     def getChildrenByType(self, childType):
         """Returns all children that are of the specified type.
 
         Arguments:
-        childType -- Class, type of children to find.
+        childType -- Class, type of children to find, subclasses match too.
 
         Return:
         Array of child objects of the specified type.
-        None if no objects of specified type are found.
 
         """
 
-        childrenOfType = []
-        for eachChild in self.children:
-            if type(eachChild) is childType:
-                childrenOfType.append(eachChild)
-
-        return childrenOfType
+        return [x for x in self.children if isinstance(x, childType)]
 
 
     def findChild(self, name, targetObj=None):
@@ -340,67 +469,294 @@ class SceneItem(object):
         if targetObj == None:
             targetObj = self
 
-        # Build children
-        for i in xrange(targetObj.getNumChildren()):
-            child = targetObj.getChildByIndex(i)
+            # Use the name index of the root when the match is unambiguous.
+            indexedItems = self.getRoot()._getIndexedItems('name', name)
+            if indexedItems is not None:
+                childItems = [x for x in indexedItems if x is not self and x.isChildOf(self)]
+                if len(childItems) < 2:
+                    return childItems[0] if childItems else None
 
-            if child.getName() == name:
+        for child in targetObj.walk():
+            if child is not targetObj and child.getName() == name:
                 foundChild = child
-            else:
-                foundChild = self.findChild(name, child)
-
-            if foundChild is not None:
                 break
 
         return foundChild
 
 
     def findChildrenByType(self, objectType, targetObj=None):
-        """Finds a child by recursively searching the hierarhcy for a child with
-        the given name.
+        """Finds all children of the given type by searching the hierarchy.
 
         Arguments:
-        objectType -- Class, type of children to find.
-        targetObj -- Object, object to search under. Used for recursive searching.
+        objectType -- Class, type of children to find, subclasses match too.
+        targetObj -- Object, object to search under, defaults to this object.
 
         Return:
-        List, children of the searched type if found.
+        List, children of the searched type in depth first order.
 
         """
 
-        childrenOfType = []
+        if targetObj is None:
+            targetObj = self
 
-        self._findChildByType(objectType, childrenOfType)
+        return [x for x in targetObj.walk(filter=objectType) if x is not targetObj]
 
-        return childrenOfType
 
+    def walk(self, order='pre', filter=None):
+        """Iterates over this object and all objects below it.
 
-    def _findChildByType(self, objectType, foundArray, targetObj=None):
-        """Protected find child by type method.
+        The hierarchy is traversed without recursion, so it can be used on deep
+        hierarchies. Changing the hierarchy while iterating is not supported.
 
         Arguments:
-        objectType -- Class, type of children to find.
-        foundArray -- List, list of found children to append to.
-        targetObj -- Object, object to search under. Used for recursive searching.
+        order -- String, 'pre' yields parents before their children, 'post'
+                 yields children before their parents and 'bfs' yields the
+                 hierarchy level by level.
+        filter -- Class / Tuple / Function, only objects that are instances of
+                  the classes, or for which the function returns True, are
+                  yielded. The whole hierarchy is traversed either way.
 
         Return:
-        True if successful.
+        Generator of objects.
 
         """
 
-        if targetObj == None:
-            targetObj = self
+        if filter is None:
+            accept = None
+        elif isinstance(filter, (type, tuple)):
+            accept = lambda x: isinstance(x, filter)
+        elif callable(filter):
+            accept = filter
+        else:
+            raise TypeError("SceneItem: Invalid type for 'filter' argument. Must be a class, tuple or function.")
+
+        if order == 'pre':
+            stack = [self]
+            while stack:
+                item = stack.pop()
+                if accept is None or accept(item):
+                    yield item
+
+                stack.extend(reversed(item.children))
+
+        elif order == 'post':
+            stack = [(self, False)]
+            while stack:
+                item, visited = stack.pop()
+                if visited:
+                    if accept is None or accept(item):
+                        yield item
+
+                    continue
+
+                stack.append((item, True))
+                stack.extend((x, False) for x in reversed(item.children))
+
+        elif order == 'bfs':
+            queue = collections.deque([self])
+            while queue:
+                item = queue.popleft()
+                if accept is None or accept(item):
+                    yield item
+
+                queue.extend(item.children)
+
+        else:
+            raise ValueError("SceneItem: Invalid value for 'order' argument. Must be 'pre', 'post' or 'bfs'.")
+
+
+    def isChildOf(self, item):
+        """Checks if this object is somewhere below the given object.
+
+        Arguments:
+        item -- Object, potential ancestor of this object.
+
+        Return:
+        True if the item is a parent, grand parent, etc. of this object.
+
+        """
+
+        parent = self.parent
+        while parent is not None:
+            if parent is item:
+                return True
+
+            parent = parent.parent
+
+        return False
+
+
+    # ==============
+    # Index Methods
+    # ==============
+    def _indexSubtree(self, item):
+        """Adds an object and its descendants to the lookup index of this root.
+
+        Only roots that keep an index, like the Container, implement this.
+
+        Arguments:
+        item -- Object, top of the subtree that was added below this root.
+
+        """
+
+        pass
+
+
+    def _unindexSubtree(self, item):
+        """Removes an object and its descendants from the lookup index of this root.
+
+        Arguments:
+        item -- Object, top of the subtree that is removed from below this root.
+
+        """
+
+        pass
+
+
+    def _isIndexed(self):
+        """Checks if this object is stored in the lookup index of its root.
+
+        Return:
+        True if the root keeps an index that contains this object.
+
+        """
+
+        items = self.getRoot()._getIndexedItems('path', self.getFullName())
+        if items is None:
+            return False
+
+        for item in items:
+            if item is self:
+                return True
+
+        return False
+
+
+    def _resetBuildNameIndex(self):
+        """Discards the build name index of this root after a build name changed."""
+
+        pass
+
+
+    def _getIndexedItems(self, indexName, key):
+        """Returns the objects stored under a key of a lookup index of this root.
+
+        Arguments:
+        indexName -- String, index to query: 'path', 'name', 'kType', 'class'
+                     or 'buildName'.
+        key -- String / Class, key to look up.
+
+        Return:
+        List of objects, None if this object does not keep an index.
+
+        """
+
+        return None
+
+
+    # ==============
+    # Clone Methods
+    # ==============
+    def clone(self, deep=True, shareShapes=True, remapXfo=None):
+        """Returns a copy of this object that isn't parented.
+
+        References between copied objects, like constraints, attribute
+        connections and components, point to the copies. References to
+        objects that weren't copied are kept.
+
+        Arguments:
+        deep -- Boolean, whether to copy the children too.
+        shareShapes -- Boolean, whether copied curves share their control points
+                       with the original until either of them sets new ones.
+        remapXfo -- Function, optional, called with the Xfo of each copy and
+                    returning the Xfo to use instead, mirrorXfo for example.
+
+        Return:
+        SceneItem, copy of this object.
+
+        """
+
+        cloneMap = cloneSubtrees([self], deep=deep, shareShapes=shareShapes, remapXfo=remapXfo)
+
+        return cloneMap[id(self)]
 
-        # Build children
-        for i in xrange(targetObj.getNumChildren()):
-            child = targetObj.getChildByIndex(i)
 
-            if type(child) is objectType:
-                foundArray.append(child)
+    def instance(self, remapXfo=None):
+        """Returns a copy of this object and its children sharing the control
+        points of its curves.
+
+        Arguments:
+        remapXfo -- Function, optional, called with the Xfo of each copy and
+                    returning the Xfo to use instead.
+
+        Return:
+        SceneItem, copy of this object.
+
+        """
+
+        return self.clone(deep=True, shareShapes=True, remapXfo=remapXfo)
+
+
+    def _cloneItem(self, cloneMap, shareShapes):
+        """Returns a copy of this object without its children and constraints.
+
+        References to other objects are still the ones of the original until
+        _remapReferences is called on the copy.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original, the copy is added.
+        shareShapes -- Boolean, whether curves share their control points.
+
+        Return:
+        SceneItem, copy of this object.
+
+        """
+
+        clone = copy.copy(self)
+        clone._fullName = None
+        clone._buildName = None
+        clone.parent = None
+        clone.children = OrderedCollection()
+        clone.flags = dict(self.flags)
+        clone.xfo = self.xfo.clone()
+        clone._localXfoCache = None
+        clone._trackedXfoKey = None
+
+        clone.attributeGroups = OrderedCollection()
+        for attributeGroup in self.attributeGroups:
+            groupClone = attributeGroup._cloneItem(cloneMap)
+            clone.attributeGroups.append(groupClone)
+            groupClone.setParent(clone)
+
+        cloneMap[id(self)] = clone
+
+        return clone
 
-            newFoundChildren = self._findChildByType(objectType, foundArray, child)
 
-        return
+    def _remapReferences(self, cloneMap):
+        """Points the references of this copy to the copies of their targets.
+
+        Arguments:
+        cloneMap -- Dict, copies by id of their original.
+
+        Return:
+        True if successful.
+
+        """
+
+        if self.component is not None:
+            self.component = cloneMap.get(id(self.component), self.component)
+
+        for attributeGroup in self.attributeGroups:
+            for attribute in attributeGroup.attributes:
+                attribute._remapReferences(cloneMap)
+
+        constraints = self.constraints
+        self.constraints = OrderedCollection()
+        for constraint in constraints:
+            self.addConstraint(constraint._cloneItem(cloneMap))
+
+        return True
 
 
     # =============
@@ -457,6 +813,30 @@ class SceneItem(object):
     # ========================
     # Attribute Group Methods
     # ========================
+    def _createDefaultAttributeGroup(self):
+        """Creates the default attribute group the first time it is needed.
+
+        Every object has a default group named '' at index 0. It is only
+        created when it is accessed, so objects without attributes don't
+        allocate or serialize it.
+
+        Return:
+        True if successful.
+
+        """
+
+        if not self._defaultAttrGroupPending:
+            return True
+
+        self._defaultAttrGroupPending = False
+
+        defaultAttrGroup = AttributeGroup("")
+        self.attributeGroups.insert(0, defaultAttrGroup)
+        defaultAttrGroup.setParent(self)
+
+        return True
+
+
     def checkAttributeGroupIndex(self, index):
         """Checks the supplied index is valid.
 
@@ -468,7 +848,7 @@ class SceneItem(object):
 
         """
 
-        if index > len(self.attributeGroups):
+        if index > self.getNumAttributeGroups():
             raise IndexError("'" + str(index) + "' is out of the range of 'attributeGroups' array.")
 
         return True
@@ -485,11 +865,15 @@ class SceneItem(object):
 
         """
 
-        if attributeGroup.getName() in [x.getName() for x in self.attributeGroups]:
+        if attributeGroup.getName() == '':
+            self._createDefaultAttributeGroup()
+
+        if self.attributeGroups.hasName(attributeGroup.getName()):
             raise IndexError("Child with " + attributeGroup.getName() + " already exists as a attributeGroup.")
 
         self.attributeGroups.append(attributeGroup)
         attributeGroup.setParent(self)
+        markChanged(self, 'attributeGroups')
 
         return True
 
@@ -508,7 +892,10 @@ class SceneItem(object):
         if self.checkAttributeGroupIndex(index) is not True:
             return False
 
+        self._createDefaultAttributeGroup()
+
         del self.attributeGroups[index]
+        markChanged(self, 'attributeGroups')
 
         return True
 
@@ -524,16 +911,12 @@ class SceneItem(object):
 
         """
 
-        removeIndex = None
-
-        for i, eachAttributeGroup in enumerate(self.attributeGroups):
-            if eachAttributeGroup.getName() == name:
-                removeIndex = i
-
-        if removeIndex is None:
+        attributeGroup = self.getAttributeGroupByName(name)
+        if attributeGroup is None:
             return False
 
-        self.removeAttributeGroupByIndex(removeIndex)
+        self.attributeGroups.remove(attributeGroup)
+        markChanged(self, 'attributeGroups')
 
         return True
 
@@ -541,11 +924,16 @@ class SceneItem(object):
     def getNumAttributeGroups(self):
         """Returns the number of attributeGroups as an integer.
 
+        The default attribute group is counted even if it wasn't created yet.
+
         Return:
         Integer of the number of attributeGroups on this object.
 
         """
 
+        if self._defaultAttrGroupPending:
+            return len(self.attributeGroups) + 1
+
         return len(self.attributeGroups)
 
 
@@ -564,6 +952,8 @@ class SceneItem(object):
         if self.checkAttributeGroupIndex(index) is not True:
             return False
 
+        self._createDefaultAttributeGroup()
+
         return self.attributeGroups[index]
 
 
@@ -579,11 +969,10 @@ class SceneItem(object):
 
         """
 
-        for eachAttributeGroup in self.attributeGroups:
-            if eachAttributeGroup.getName() == name:
-                return eachAttributeGroup
+        if name == '':
+            self._createDefaultAttributeGroup()
 
-        return None
+        return self.attributeGroups.getByName(name)
 
 
     # ===================
@@ -617,12 +1006,13 @@ class SceneItem(object):
 
         """
 
-        if constraint.getName() in [x.getName() for x in self.constraints]:
+        if self.constraints.hasName(constraint.getName()):
             raise IndexError("Constraint with name '" + constraint.getName() + "'' already exists as a constraint.")
 
         self.constraints.append(constraint)
         constraint.setParent(self)
         constraint.setConstrainee(self)
+        markChanged(self, 'constraints')
 
         return True
 
@@ -642,6 +1032,7 @@ class SceneItem(object):
             return False
 
         del self.constraints[index]
+        markChanged(self, 'constraints')
 
         return True
 
@@ -657,16 +1048,12 @@ class SceneItem(object):
 
         """
 
-        removeIndex = None
-
-        for i, eachConstraint in enumerate(self.constraints):
-            if eachConstraint.getName() == name:
-                removeIndex = i
-
-        if removeIndex is None:
+        constraint = self.constraints.getByName(name)
+        if constraint is None:
             return False
 
-        self.removeConstraintByIndex(removeIndex)
+        self.constraints.remove(constraint)
+        markChanged(self, 'constraints')
 
         return True
 
@@ -712,11 +1099,7 @@ class SceneItem(object):
 
         """
 
-        for eachConstraint in self.constraints:
-            if eachConstraint.getName() == name:
-                return eachConstraint
-
-        return None
+        return self.constraints.getByName(name)
 
 
     # ==============
@@ -759,6 +1142,7 @@ class SceneItem(object):
         """
 
         self.visibility = value
+        markChanged(self, 'visibility')
 
         return True
 
@@ -786,6 +1170,7 @@ class SceneItem(object):
         """
 
         self.shapeVisibility = value
+        markChanged(self, 'shapeVisibility')
 
         return True
 
@@ -805,6 +1190,7 @@ class SceneItem(object):
         """
 
         self.color = color
+        markChanged(self, 'color')
 
         return True
 
@@ -823,6 +1209,84 @@ class SceneItem(object):
     # ==================
     # Transform Methods
     # ==================
+    def getLocalXfo(self):
+        """Returns the transform of this object relative to its parent.
+
+        The xfo attribute holds the world transform. The local transform is
+        derived from it and the parent's world transform, and memoized until
+        either of them changes.
+
+        Return:
+        Xfo, local transform of the object.
+
+        """
+
+        key = _getXfoKey(self.xfo)
+        if self.parent is not None:
+            key += _getXfoKey(self.parent.xfo)
+
+        if self._localXfoCache is None or self._localXfoCache[0] != key:
+            if self.parent is not None:
+                localXfo = self.xfo.localTo(self.parent.xfo)
+            else:
+                localXfo = self.xfo.clone()
+
+            self._localXfoCache = (key, localXfo)
+
+        return self._localXfoCache[1].clone()
+
+
+    def setLocalXfo(self, xfo):
+        """Sets the world transform of this object from a transform relative to
+        its parent.
+
+        Arguments:
+        xfo -- Xfo, local transform of the object.
+
+        Return:
+        True if successful.
+
+        """
+
+        if not isinstance(xfo, Xfo):
+            raise TypeError("SceneItem: Invalid type for 'xfo' argument. Must be a Xfo.")
+
+        if self.parent is not None:
+            self.xfo.copy(xfo.worldTo(self.parent.xfo))
+        else:
+            self.xfo.copy(xfo)
+
+        self._localXfoCache = None
+        self._checkXfoChanged()
+
+        return True
+
+
+    def _checkXfoChanged(self):
+        """Records a change of the transform if it differs from the one seen
+        last time.
+
+        The transform is usually edited in place, so changes are found by
+        comparing values instead of being recorded by a setter.
+
+        Return:
+        True if the transform changed.
+
+        """
+
+        if not getChangeTracker().enabled:
+            return False
+
+        key = _getXfoKey(self.xfo)
+        if key == self._trackedXfoKey:
+            return False
+
+        self._trackedXfoKey = key
+        markChanged(self, 'xfo')
+
+        return True
+
+
     def lockAttribute(self, attributeName):
         pass
 
@@ -845,13 +1309,46 @@ class SceneItem(object):
     def jsonEncode(self, saver):
         """Returns the data for this object encoded as a JSON hierarchy.
 
+        The hierarchy is encoded without recursion, see _jsonEncodeProperties
+        for the data stored per object.
+
         Arguments:
+        saver -- KrakenSaver, saver used to encode values.
 
         Return:
         A JSON structure containing the data for this SceneItem.
 
         """
 
+        rootData = None
+
+        stack = [(self, None)]
+        while stack:
+            item, parentData = stack.pop()
+
+            jsonData = item._jsonEncodeProperties(saver)
+            if parentData is None:
+                rootData = jsonData
+            else:
+                parentData['children'].append(jsonData)
+
+            for child in reversed(item.children):
+                stack.append((child, jsonData))
+
+        return rootData
+
+
+    def _jsonEncodeProperties(self, saver):
+        """Returns the data of this object without its children.
+
+        Arguments:
+        saver -- KrakenSaver, saver used to encode values.
+
+        Return:
+        A JSON structure with an empty 'children' list.
+
+        """
+
         classHierarchy = []
         for cls in type.mro(type(self)):
             if cls == object:
@@ -878,9 +1375,8 @@ class SceneItem(object):
         if self.color is not None:
             jsonData['color'] = saver.encodeValue(self.color)
 
-        for child in self.children:
-            jsonData['children'].append(child.jsonEncode(saver))
-
+        # A default attribute group that was never created isn't written, the
+        # loader creates it again when it is accessed.
         for attrGroup in self.attributeGroups:
             jsonData['attributeGroups'].append(attrGroup.jsonEncode(saver))
 
@@ -891,7 +1387,28 @@ class SceneItem(object):
 
 
     def jsonDecode(self, loader, jsonData):
-        """Returns the color of the object.
+        """Decodes the data of this object and constructs its children.
+
+        KrakenLoader.construct runs the same steps without recursion, calling
+        _jsonDecodeProperties and _jsonDecodeDependents around the children.
+
+        Return:
+        True if decoding was successful
+
+        """
+
+        self._jsonDecodeProperties(loader, jsonData)
+
+        for child in jsonData['children']:
+            self.addChild(loader.construct(child))
+
+        self._jsonDecodeDependents(loader, jsonData)
+
+        return True
+
+
+    def _jsonDecodeProperties(self, loader, jsonData):
+        """Decodes the data of this object that is loaded before its children.
 
         Return:
         True if decoding was successful
@@ -899,6 +1416,7 @@ class SceneItem(object):
         """
 
         self.parent =  loader.getParentItem()
+        self._resetNames()
         self.flags =  jsonData['flags']
         self.xfo =  loader.decodeValue(jsonData['xfo'])
         if 'color' in jsonData and jsonData['color'] is not None:
@@ -906,15 +1424,25 @@ class SceneItem(object):
         self.visibility =  jsonData['visibility']
         self.shapeVisibility =  jsonData['shapeVisibility']
 
-        for child in jsonData['children']:
-            self.addChild(loader.construct(child))
+        return True
+
+
+    def _jsonDecodeDependents(self, loader, jsonData):
+        """Decodes the attribute groups and constraints of this object, which
+        are loaded after its children.
+
+        Return:
+        True if decoding was successful
+
+        """
 
         for attrGroup in jsonData['attributeGroups']:
             # There is one default attribute group assigned to each scene item.
             # Load data into the existing item instead of constructing a new one.
             if attrGroup['name'] == '':
-                loader.registerItem(self.attributeGroups[0])
-                self.attributeGroups[0].jsonDecode(loader, attrGroup)
+                defaultAttrGroup = self.getAttributeGroupByName('')
+                loader.registerItem(defaultAttrGroup)
+                defaultAttrGroup.jsonDecode(loader, attrGroup)
             else:
                 self.addAttributeGroup(loader.construct(attrGroup))
 
@@ -922,3 +1450,63 @@ class SceneItem(object):
             self.addConstraint(loader.construct(constr))
 
         return True
+
+
+# ===============
+# Helper Methods
+# ===============
+def cloneSubtrees(items, deep=True, shareShapes=True, remapXfo=None):
+    """Copies objects together so references between them point to the copies.
+
+    Arguments:
+    items -- List, objects to copy, the copies aren't parented.
+    deep -- Boolean, whether to copy the children too.
+    shareShapes -- Boolean, whether copied curves share their control points.
+    remapXfo -- Function, optional, called with the Xfo of each copy and
+                returning the Xfo to use instead.
+
+    Return:
+    Dict, copies by id of their original.
+
+    """
+
+    sources = []
+    for item in items:
+        if deep:
+            sources.extend(item.walk())
+        else:
+            sources.append(item)
+
+    cloneMap = {}
+    for source in sources:
+        source._cloneItem(cloneMap, shareShapes)
+
+    # Walking is depth first so parents are copied before their children and
+    # children are appended in their original order.
+    for source in sources:
+        if source.parent is not None and id(source.parent) in cloneMap:
+            parentClone = cloneMap[id(source.parent)]
+            clone = cloneMap[id(source)]
+            parentClone.children.append(clone)
+            clone.parent = parentClone
+
+    for source in sources:
+        clone = cloneMap[id(source)]
+        clone._remapReferences(cloneMap)
+
+        if remapXfo is not None:
+            clone.xfo = remapXfo(clone.xfo)
+
+    for item in items:
+        clone = cloneMap[id(item)]
+        clone._indexSubtree(clone)
+
+    return cloneMap
+
+
+def _getXfoKey(xfo):
+    """Returns a tuple of the values of an Xfo used to detect changes."""
+
+    return (xfo.scl.x, xfo.scl.y, xfo.scl.z,
+            xfo.rot.v.x, xfo.rot.v.y, xfo.rot.v.z, xfo.rot.w,
+            xfo.tr.x, xfo.tr.y, xfo.tr.z)
@@ -21,7 +21,7 @@ class SrtBuffer(SceneItem):
     # =============
     # Name methods
     # =============
-    def getBuildName(self):
+    def _computeBuildName(self):
         """Returns the name used when building the node in the target application.
 
         Return:
@@ -29,4 +29,4 @@ class SrtBuffer(SceneItem):
 
         """
 
-        return super(SrtBuffer, self).getBuildName() + '_srtBuffer'
\ No newline at end of file
+        return super(SrtBuffer, self)._computeBuildName() + '_srtBuffer'
\ No newline at end of file
@@ -28,9 +28,9 @@ def getBuilder():
             builder = loaded_class()
 
     if builder is None:
-        print "Failed to find DCC builder. Falling back to Python builder."
+        print "Failed to find DCC builder. Falling back to recording builder."
 
-        from kraken.core.builders import base_builder
-        builder = base_builder.BaseBuilder()
+        from kraken.core.builders import recording_builder
+        builder = recording_builder.RecordingBuilder()
 
     return builder
\ No newline at end of file
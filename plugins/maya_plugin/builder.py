@@ -6,6 +6,7 @@ Builder -- Component representation.
 """
 
 from kraken.core.builders.base_builder import BaseBuilder
+from kraken.core.maths.xfo_array import XfoArray
 from kraken.core.objects.scene_item import SceneItem
 from kraken.core.objects.attributes.base_attribute import BaseAttribute
 from kraken.core.objects.constraints.pose_constraint import PoseConstraint
@@ -21,6 +22,10 @@ class Builder(BaseBuilder):
     def __init__(self):
         super(Builder, self).__init__()
 
+        # Transforms are set in one pass after the hierarchy is created.
+        self._batchTransforms = False
+        self._pendingTransforms = []
+
 
     # ========================
     # SceneItem Build Methods
@@ -39,9 +44,7 @@ class Builder(BaseBuilder):
 
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
-        dccSceneItem = pm.group(name="group", em=True)
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createNode('transform', buildName, parentNode)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -62,9 +65,7 @@ class Builder(BaseBuilder):
 
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
-        dccSceneItem = pm.group(name="group", em=True)
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createNode('transform', buildName, parentNode)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -85,9 +86,7 @@ class Builder(BaseBuilder):
 
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
-        dccSceneItem = pm.group(name="group", em=True)
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createNode('transform', buildName, parentNode)
 
         lockObjXfo(dccSceneItem)
 
@@ -110,9 +109,7 @@ class Builder(BaseBuilder):
 
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
-        dccSceneItem = pm.group(name="group", em=True)
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createNode('transform', buildName, parentNode)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -133,9 +130,7 @@ class Builder(BaseBuilder):
 
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
-        dccSceneItem = pm.joint(name="joint")
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createNode('joint', buildName, parentNode)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -156,9 +151,7 @@ class Builder(BaseBuilder):
 
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
-        dccSceneItem = pm.spaceLocator(name="locator")
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createLocator(buildName, parentNode)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -180,31 +173,10 @@ class Builder(BaseBuilder):
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
         # Format points for Maya
-        points = kSceneItem.getControlPoints()
-
-        # Scale, rotate, translation shape
-        curvePoints = []
-        for eachSubCurve in points:
-            formattedPoints = [x.toArray() for x in eachSubCurve]
-            curvePoints.append(formattedPoints)
-
-        mainCurve = None
-        for i, eachSubCurve in enumerate(curvePoints):
-            currentSubCurve = pm.curve(per=False, point=curvePoints[i], degree=1) #, knot=[x for x in xrange(len(curvePoints[i]))])
-
-            if kSceneItem.getCurveSectionClosed(i):
-                pm.closeCurve(currentSubCurve, preserveShape=True, replaceOriginal=True)
-
-            if mainCurve is None:
-                mainCurve = currentSubCurve
-
-            if i > 0:
-                pm.parent(currentSubCurve.getShape(), mainCurve, relative=True, shape=True)
-                pm.delete(currentSubCurve)
+        curvePoints = [[x.toArray() for x in eachSubCurve] for eachSubCurve in kSceneItem.getControlPoints()]
+        closed = [kSceneItem.getCurveSectionClosed(i) for i in xrange(len(curvePoints))]
 
-        dccSceneItem = mainCurve
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createCurve(buildName, parentNode, curvePoints, closed)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -226,31 +198,10 @@ class Builder(BaseBuilder):
         parentNode = self._getDCCSceneItem(kSceneItem.getParent())
 
         # Format points for Maya
-        points = kSceneItem.getControlPoints()
-
-        # Scale, rotate, translation shape
-        curvePoints = []
-        for eachSubCurve in points:
-            formattedPoints = [x.toArray() for x in eachSubCurve]
-            curvePoints.append(formattedPoints)
-
-        mainCurve = None
-        for i, eachSubCurve in enumerate(curvePoints):
-            currentSubCurve = pm.curve(per=False, point=curvePoints[i], degree=1) #, knot=[x for x in xrange(len(curvePoints[i]))])
-
-            if kSceneItem.getCurveSectionClosed(i):
-                pm.closeCurve(currentSubCurve, preserveShape=True, replaceOriginal=True)
-
-            if mainCurve is None:
-                mainCurve = currentSubCurve
-
-            if i > 0:
-                pm.parent(currentSubCurve.getShape(), mainCurve, relative=True, shape=True)
-                pm.delete(currentSubCurve)
+        curvePoints = [[x.toArray() for x in eachSubCurve] for eachSubCurve in kSceneItem.getControlPoints()]
+        closed = [kSceneItem.getCurveSectionClosed(i) for i in xrange(len(curvePoints))]
 
-        dccSceneItem = mainCurve
-        pm.parent(dccSceneItem, parentNode)
-        pm.rename(dccSceneItem, buildName)
+        dccSceneItem = createCurve(buildName, parentNode, curvePoints, closed)
 
         self._registerSceneItemPair(kSceneItem, dccSceneItem)
 
@@ -272,8 +223,7 @@ class Builder(BaseBuilder):
         """
 
         parentDCCSceneItem = self._getDCCSceneItem(kAttribute.getParent().getParent())
-        parentDCCSceneItem.addAttr(kAttribute.getName(), niceName=kAttribute.getName(), attributeType="bool", defaultValue=kAttribute.getValue(), keyable=True)
-        dccSceneItem = parentDCCSceneItem.attr(kAttribute.getName())
+        dccSceneItem = createAttribute(parentDCCSceneItem, "Bool", kAttribute.getName(), kAttribute.getValue())
 
         self._registerSceneItemPair(kAttribute, dccSceneItem)
 
@@ -292,8 +242,7 @@ class Builder(BaseBuilder):
         """
 
         parentDCCSceneItem = self._getDCCSceneItem(kAttribute.getParent().getParent())
-        parentDCCSceneItem.addAttr(kAttribute.getName(), niceName=kAttribute.getName(), attributeType="float", defaultValue=kAttribute.getValue(), minValue=kAttribute.min, maxValue=kAttribute.max, keyable=True)
-        dccSceneItem = parentDCCSceneItem.attr(kAttribute.getName())
+        dccSceneItem = createAttribute(parentDCCSceneItem, "Float", kAttribute.getName(), kAttribute.getValue(), kAttribute.min, kAttribute.max)
 
         self._registerSceneItemPair(kAttribute, dccSceneItem)
 
@@ -312,9 +261,7 @@ class Builder(BaseBuilder):
         """
 
         parentDCCSceneItem = self._getDCCSceneItem(kAttribute.getParent().getParent())
-        parentDCCSceneItem.addAttr(kAttribute.getName(), niceName=kAttribute.getName(), attributeType="long", defaultValue=kAttribute.getValue(), minValue=kAttribute.min, maxValue=kAttribute.max, keyable=True)
-        parentDCCSceneItem.attr(kAttribute.getName())
-        dccSceneItem = parentDCCSceneItem.attr(kAttribute.getName())
+        dccSceneItem = createAttribute(parentDCCSceneItem, "Integer", kAttribute.getName(), kAttribute.getValue(), kAttribute.min, kAttribute.max)
 
         self._registerSceneItemPair(kAttribute, dccSceneItem)
 
@@ -333,9 +280,7 @@ class Builder(BaseBuilder):
         """
 
         parentDCCSceneItem = self._getDCCSceneItem(kAttribute.getParent().getParent())
-        parentDCCSceneItem.addAttr(kAttribute.getName(), niceName=kAttribute.getName(), dataType="string")
-        dccSceneItem = parentDCCSceneItem.attr(kAttribute.getName())
-        dccSceneItem.set(kAttribute.getValue())
+        dccSceneItem = createAttribute(parentDCCSceneItem, "String", kAttribute.getName(), kAttribute.getValue())
 
         self._registerSceneItemPair(kAttribute, dccSceneItem)
 
@@ -355,13 +300,7 @@ class Builder(BaseBuilder):
 
         parentDCCSceneItem = self._getDCCSceneItem(kAttributeGroup.getParent())
 
-        groupName = kAttributeGroup.getName()
-        if groupName == "":
-            groupName = "Settings"
-
-        parentDCCSceneItem.addAttr(groupName, niceName=groupName, attributeType="enum", enumName="-----", keyable=True)
-        dccSceneItem = parentDCCSceneItem.attr(groupName)
-        pm.setAttr(parentDCCSceneItem + "." + groupName, lock=True)
+        dccSceneItem = createAttributeGroup(parentDCCSceneItem, kAttributeGroup.getName())
 
         self._registerSceneItemPair(kAttributeGroup, dccSceneItem)
 
@@ -424,7 +363,7 @@ class Builder(BaseBuilder):
         """
 
         constraineeDCCSceneItem = self._getDCCSceneItem(kConstraint.getConstrainee())
-        dccSceneItem = pm.orientConstraint([self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], constraineeDCCSceneItem, name=kConstraint.getName() + "_ori_cns", maintainOffset=kConstraint.getMaintainOffset())
+        dccSceneItem = createConstraint("Orientation", kConstraint.getName(), constraineeDCCSceneItem, [self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], kConstraint.getMaintainOffset())
         self._registerSceneItemPair(kConstraint, dccSceneItem)
 
         return dccSceneItem
@@ -442,8 +381,7 @@ class Builder(BaseBuilder):
         """
 
         constraineeDCCSceneItem = self._getDCCSceneItem(kConstraint.getConstrainee())
-        dccSceneItem = pm.parentConstraint([self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], constraineeDCCSceneItem, name=kConstraint.getName() + "_par_cns", maintainOffset=kConstraint.getMaintainOffset())
-        pm.scaleConstraint([self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], constraineeDCCSceneItem, name=kConstraint.getName() + "_scl_cns", maintainOffset=kConstraint.getMaintainOffset())
+        dccSceneItem = createConstraint("Pose", kConstraint.getName(), constraineeDCCSceneItem, [self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], kConstraint.getMaintainOffset())
 
         self._registerSceneItemPair(kConstraint, dccSceneItem)
 
@@ -462,7 +400,7 @@ class Builder(BaseBuilder):
         """
 
         constraineeDCCSceneItem = self._getDCCSceneItem(kConstraint.getConstrainee())
-        dccSceneItem = pm.pointConstraint([self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], constraineeDCCSceneItem, name=kConstraint.getName() + "_pos_cns", maintainOffset=kConstraint.getMaintainOffset())
+        dccSceneItem = createConstraint("Position", kConstraint.getName(), constraineeDCCSceneItem, [self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], kConstraint.getMaintainOffset())
         self._registerSceneItemPair(kConstraint, dccSceneItem)
 
         return dccSceneItem
@@ -480,7 +418,7 @@ class Builder(BaseBuilder):
         """
 
         constraineeDCCSceneItem = self._getDCCSceneItem(kConstraint.getConstrainee())
-        dccSceneItem = pm.scaleConstraint([self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], constraineeDCCSceneItem, name=kConstraint.getName() + "_scl_cns", maintainOffset=kConstraint.getMaintainOffset())
+        dccSceneItem = createConstraint("Scale", kConstraint.getName(), constraineeDCCSceneItem, [self._getDCCSceneItem(x) for x in kConstraint.getConstrainers()], kConstraint.getMaintainOffset())
         self._registerSceneItemPair(kConstraint, dccSceneItem)
 
         return dccSceneItem
@@ -649,10 +587,7 @@ class Builder(BaseBuilder):
 
         if kSceneItem.getShapeVisibility() is False:
 
-            # Get shape node, if it exists, hide it.
-            shape = dccSceneItem.getShape()
-            if shape is not None:
-                shape.visibility.set(False)
+            hideShape(dccSceneItem)
 
         return True
 
@@ -677,8 +612,7 @@ class Builder(BaseBuilder):
         if objectColor not in self.VALID_COLORS.keys():
             return False
 
-        dccSceneItem.overrideEnabled.set(True)
-        dccSceneItem.overrideColor.set(self.VALID_COLORS[objectColor][0])
+        setOverrideColor(dccSceneItem, self.VALID_COLORS[objectColor][0])
 
         return True
 
@@ -697,18 +631,70 @@ class Builder(BaseBuilder):
 
         """
 
-        dccSceneItem = self._getDCCSceneItem(kSceneItem)
+        self._pendingTransforms.append((self._getDCCSceneItem(kSceneItem), kSceneItem))
+
+        if self._batchTransforms is False:
+            self._applyTransforms()
+
+        return True
+
+
+    def _applyTransforms(self):
+        """Sets the world matrices of the objects queued by setTransform.
+
+        The matrices are computed together and each one is set with a single
+        xform call. Objects are set in the order they were queued, so parents
+        come before their children.
+
+        Return:
+        True if successful.
 
-        quat = dt.Quaternion(kSceneItem.xfo.rot.v.x, kSceneItem.xfo.rot.v.y, kSceneItem.xfo.rot.v.z, kSceneItem.xfo.rot.w)
-        dccSceneItem.setScale(dt.Vector(kSceneItem.xfo.scl.x, kSceneItem.xfo.scl.y, kSceneItem.xfo.scl.z))
-        dccSceneItem.setTranslation(dt.Vector(kSceneItem.xfo.tr.x, kSceneItem.xfo.tr.y, kSceneItem.xfo.tr.z), "world")
-        dccSceneItem.setRotation(quat, "world")
+        """
+
+        if not self._pendingTransforms:
+            return True
+
+        xfos = XfoArray.fromXfos([x[1].xfo for x in self._pendingTransforms])
+        matrices = xfos.toMatrix44Array().reshape(-1, 16).tolist()
 
-        pm.select(clear=True)
+        for (dccSceneItem, kSceneItem), matrix in zip(self._pendingTransforms, matrices):
+            setWorldMatrix(dccSceneItem, matrix)
+
+        self._pendingTransforms = []
 
         return True
 
 
+    # ========================
+    # Hierarchy Build Methods
+    # ========================
+    def buildHierarchy(self, kObject, component=None):
+        """Builds the hierarchy for the supplied kObject.
+
+        Nodes are created first and their transforms are set in one pass
+        afterwards.
+
+        Arguments:
+        kObject -- Object, kraken object to build.
+        component -- Component, unused, kept for backwards compatibility.
+
+        Return:
+        DCC object that was created for kObject.
+
+        """
+
+        self._batchTransforms = True
+        try:
+            dccSceneItem = super(Builder, self).buildHierarchy(kObject, component=component)
+
+        finally:
+            self._batchTransforms = False
+
+        self._applyTransforms()
+
+        return dccSceneItem
+
+
     # ==============
     # Build Methods
     # ==============
@@ -0,0 +1,244 @@
+"""Kraken Maya - Maya Player module.
+
+Classes:
+Player -- Applies a log recorded by RecordingBuilder in Maya.
+
+"""
+
+from kraken.core.builders.base_builder import BaseBuilder
+from kraken.core.builders.recording_builder import RecordPlayer
+from kraken.core.maths.xfo_array import XfoArray
+
+from kraken.plugins.maya_plugin.utils import *
+
+
+class Player(RecordPlayer):
+    """Player applying recorded commands in Maya with the same creation
+    functions as the Maya Builder.
+
+    Splice operators are not supported as they need the Fabric Engine client
+    the builder creates.
+
+    """
+
+    def __init__(self):
+        super(Player, self).__init__()
+
+        # Attribute groups are attributes, attributes are added to their owner.
+        self._groupOwners = {}
+
+
+    # ==============
+    # Node Commands
+    # ==============
+    def createNode(self, nodeId, nodeType, buildName, parentId, fullName):
+        """Creates a transform node.
+
+        Arguments:
+        nodeId -- Integer, id of the node.
+        nodeType -- String, kraken type of the node.
+        buildName -- String, name of the node.
+        parentId -- Integer, id of the parent, None for the world.
+        fullName -- String, full name of the kraken object.
+
+        Return:
+        Node that is created.
+
+        """
+
+        parentNode = self.nodes.get(parentId)
+
+        if nodeType == "Joint":
+            node = createNode('joint', buildName, parentNode)
+
+        elif nodeType == "Locator":
+            node = createLocator(buildName, parentNode)
+
+        else:
+            node = createNode('transform', buildName, parentNode)
+
+            if nodeType == "HierarchyGroup":
+                lockObjXfo(node)
+
+        self.nodes[nodeId] = node
+
+        return node
+
+
+    def createCurve(self, nodeId, nodeType, buildName, parentId, fullName, points, closed):
+        """Creates a curve node.
+
+        Arguments:
+        nodeId -- Integer, id of the node.
+        nodeType -- String, kraken type of the node.
+        buildName -- String, name of the node.
+        parentId -- Integer, id of the parent, None for the world.
+        fullName -- String, full name of the kraken object.
+        points -- List, list of [x, y, z] points for each section.
+        closed -- List, whether each section is closed.
+
+        Return:
+        Node that is created.
+
+        """
+
+        node = createCurve(buildName, self.nodes.get(parentId), points, closed)
+        self.nodes[nodeId] = node
+
+        return node
+
+
+    # ===================
+    # Attribute Commands
+    # ===================
+    def addAttributeGroup(self, nodeId, name, parentId):
+        """Adds an attribute group to a node.
+
+        Arguments:
+        nodeId -- Integer, id of the attribute group.
+        name -- String, name of the attribute group.
+        parentId -- Integer, id of the node to add the group to.
+
+        Return:
+        Attribute that is created.
+
+        """
+
+        parentNode = self.nodes[parentId]
+        attribute = createAttributeGroup(parentNode, name)
+
+        self.nodes[nodeId] = attribute
+        self._groupOwners[nodeId] = parentNode
+
+        return attribute
+
+
+    def addAttribute(self, nodeId, attributeType, name, groupId, value, minValue, maxValue):
+        """Adds an attribute to the node owning an attribute group.
+
+        Arguments:
+        nodeId -- Integer, id of the attribute.
+        attributeType -- String, one of Bool, Float, Integer or String.
+        name -- String, name of the attribute.
+        groupId -- Integer, id of the attribute group.
+        value -- Value of the attribute.
+        minValue -- Number, minimum value, None if it has none.
+        maxValue -- Number, maximum value, None if it has none.
+
+        Return:
+        Attribute that is created.
+
+        """
+
+        attribute = createAttribute(self._groupOwners[groupId], attributeType, name, value, minValue, maxValue)
+        self.nodes[nodeId] = attribute
+
+        return attribute
+
+
+    def connectAttribute(self, driverId, drivenId):
+        """Connects an attribute to another.
+
+        Arguments:
+        driverId -- Integer, id of the driver attribute.
+        drivenId -- Integer, id of the driven attribute.
+
+        Return:
+        True if successful.
+
+        """
+
+        pm.connectAttr(self.nodes[driverId], self.nodes[drivenId], force=True)
+
+        return True
+
+
+    # ====================
+    # Constraint Commands
+    # ====================
+    def createConstraint(self, nodeId, constraintType, name, constraineeId, constrainerIds, maintainOffset):
+        """Creates a constraint.
+
+        Arguments:
+        nodeId -- Integer, id of the constraint.
+        constraintType -- String, one of Orientation, Pose, Position or Scale.
+        name -- String, name of the constraint.
+        constraineeId -- Integer, id of the constrained node.
+        constrainerIds -- List, ids of the constraining nodes.
+        maintainOffset -- Boolean, whether the offset is kept.
+
+        Return:
+        Node that is created.
+
+        """
+
+        constraint = createConstraint(constraintType, name, self.nodes[constraineeId],
+                                      [self.nodes[x] for x in constrainerIds], maintainOffset)
+
+        self.nodes[nodeId] = constraint
+
+        return constraint
+
+
+    def createSpliceOperator(self, nodeId, name, solverTypeName, extension, inputs, outputs):
+        """Splice operators need the Fabric Engine client and are not replayed."""
+
+        raise NotImplementedError("createSpliceOperator is not implemented by " + type(self).__name__ + ", build rigs with operators with the Maya Builder.")
+
+
+    # =================
+    # Display Commands
+    # =================
+    def setShapeVisibility(self, nodeId, visibility):
+        """Sets the visibility of the shape of a node.
+
+        Arguments:
+        nodeId -- Integer, id of the node.
+        visibility -- Boolean, visibility of the shape.
+
+        Return:
+        True if successful.
+
+        """
+
+        if visibility is False:
+            hideShape(self.nodes[nodeId])
+
+        return True
+
+
+    def setColor(self, nodeId, color):
+        """Sets the override color of a node.
+
+        Arguments:
+        nodeId -- Integer, id of the node.
+        color -- String, name of a color in BaseBuilder.VALID_COLORS.
+
+        Return:
+        True if successful.
+
+        """
+
+        return setOverrideColor(self.nodes[nodeId], BaseBuilder.VALID_COLORS[color][0])
+
+
+    # ===================
+    # Transform Commands
+    # ===================
+    def setTransform(self, nodeId, scl, rot, tr):
+        """Sets the world transform of a node.
+
+        Arguments:
+        nodeId -- Integer, id of the node.
+        scl -- List, scale as [x, y, z].
+        rot -- List, rotation quaternion as [x, y, z, w].
+        tr -- List, translation as [x, y, z].
+
+        Return:
+        True if successful.
+
+        """
+
+        matrix = XfoArray.fromArrays([scl], [rot], [tr]).toMatrix44Array().reshape(-1, 16)[0]
+
+        return setWorldMatrix(self.nodes[nodeId], matrix.tolist())
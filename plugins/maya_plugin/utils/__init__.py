@@ -24,4 +24,224 @@ def lockObjXfo(dccSceneItem):
     for eachParam in localXfoParams:
         pm.setAttr(dccSceneItem.longName() + "." + eachParam, lock=True, keyable=False, channelBox=False)
 
-    return True
\ No newline at end of file
+    return True
+
+
+def createNode(nodeType, buildName, parentNode):
+    """Creates a node with its final name and parent in a single call.
+
+    Arguments:
+    nodeType -- String, Maya node type to create.
+    buildName -- String, name of the new node.
+    parentNode -- Node, parent of the new node, None for the world.
+
+    Return:
+    Node that is created.
+
+    """
+
+    if parentNode is None:
+        return pm.createNode(nodeType, name=buildName, skipSelect=True)
+
+    return pm.createNode(nodeType, name=buildName, parent=parentNode, skipSelect=True)
+
+
+def createCurve(buildName, parentNode, curvePoints, closed):
+    """Creates a linear curve with a shape per section.
+
+    Arguments:
+    buildName -- String, name of the new curve.
+    parentNode -- Node, parent of the new curve, None for the world.
+    curvePoints -- List, list of [x, y, z] points for each section.
+    closed -- List, whether each section is closed.
+
+    Return:
+    Node that is created.
+
+    """
+
+    mainCurve = None
+    for i, eachSubCurve in enumerate(curvePoints):
+        currentSubCurve = pm.curve(name=buildName, per=False, point=eachSubCurve, degree=1)
+
+        if closed[i]:
+            pm.closeCurve(currentSubCurve, preserveShape=True, replaceOriginal=True)
+
+        if mainCurve is None:
+            mainCurve = currentSubCurve
+
+        if i > 0:
+            pm.parent(currentSubCurve.getShape(), mainCurve, relative=True, shape=True)
+            pm.delete(currentSubCurve)
+
+    if parentNode is not None:
+        pm.parent(mainCurve, parentNode)
+
+    return mainCurve
+
+
+def setWorldMatrix(dccSceneItem, matrix):
+    """Sets the world matrix of a node with a single xform call.
+
+    Arguments:
+    dccSceneItem -- Node, node to set the matrix on.
+    matrix -- List, 16 values of the matrix, translation in the last row.
+
+    Return:
+    True if successful.
+
+    """
+
+    cmds.xform(dccSceneItem.longName(), worldSpace=True, matrix=matrix)
+
+    return True
+
+
+def createLocator(buildName, parentNode):
+    """Creates a transform with a locator shape.
+
+    Arguments:
+    buildName -- String, name of the new locator.
+    parentNode -- Node, parent of the new locator, None for the world.
+
+    Return:
+    Node that is created.
+
+    """
+
+    dccSceneItem = createNode('transform', buildName, parentNode)
+    pm.createNode('locator', name=buildName + "Shape", parent=dccSceneItem, skipSelect=True)
+
+    return dccSceneItem
+
+
+def createAttributeGroup(dccSceneItem, groupName):
+    """Creates a locked enum attribute used as the header of an attribute group.
+
+    Arguments:
+    dccSceneItem -- Node, node to add the attribute group to.
+    groupName -- String, name of the group, empty names are built as Settings.
+
+    Return:
+    Attribute that is created.
+
+    """
+
+    if groupName == "":
+        groupName = "Settings"
+
+    dccSceneItem.addAttr(groupName, niceName=groupName, attributeType="enum", enumName="-----", keyable=True)
+    attribute = dccSceneItem.attr(groupName)
+    pm.setAttr(dccSceneItem + "." + groupName, lock=True)
+
+    return attribute
+
+
+def createAttribute(dccSceneItem, attributeType, name, value, minValue=None, maxValue=None):
+    """Creates an attribute.
+
+    Arguments:
+    dccSceneItem -- Node, node to add the attribute to.
+    attributeType -- String, one of Bool, Float, Integer or String.
+    name -- String, name of the attribute.
+    value -- Value of the attribute.
+    minValue -- Number, minimum value of Float and Integer attributes.
+    maxValue -- Number, maximum value of Float and Integer attributes.
+
+    Return:
+    Attribute that is created.
+
+    """
+
+    if attributeType == "Bool":
+        dccSceneItem.addAttr(name, niceName=name, attributeType="bool", defaultValue=value, keyable=True)
+
+    elif attributeType == "Float":
+        dccSceneItem.addAttr(name, niceName=name, attributeType="float", defaultValue=value, minValue=minValue, maxValue=maxValue, keyable=True)
+
+    elif attributeType == "Integer":
+        dccSceneItem.addAttr(name, niceName=name, attributeType="long", defaultValue=value, minValue=minValue, maxValue=maxValue, keyable=True)
+
+    elif attributeType == "String":
+        dccSceneItem.addAttr(name, niceName=name, dataType="string")
+
+    else:
+        raise ValueError("createAttribute: Invalid value for 'attributeType' argument. Must be one of Bool, Float, Integer or String.")
+
+    attribute = dccSceneItem.attr(name)
+
+    if attributeType == "String":
+        attribute.set(value)
+
+    return attribute
+
+
+def createConstraint(constraintType, name, constrainee, constrainers, maintainOffset):
+    """Creates a constraint, pose constraints are built as a parent and a scale
+    constraint.
+
+    Arguments:
+    constraintType -- String, one of Orientation, Pose, Position or Scale.
+    name -- String, name of the kraken constraint.
+    constrainee -- Node, constrained node.
+    constrainers -- List, constraining nodes.
+    maintainOffset -- Boolean, whether the offset is kept.
+
+    Return:
+    Node that is created, the parent constraint for pose constraints.
+
+    """
+
+    if constraintType == "Orientation":
+        return pm.orientConstraint(constrainers, constrainee, name=name + "_ori_cns", maintainOffset=maintainOffset)
+
+    elif constraintType == "Pose":
+        dccSceneItem = pm.parentConstraint(constrainers, constrainee, name=name + "_par_cns", maintainOffset=maintainOffset)
+        pm.scaleConstraint(constrainers, constrainee, name=name + "_scl_cns", maintainOffset=maintainOffset)
+
+        return dccSceneItem
+
+    elif constraintType == "Position":
+        return pm.pointConstraint(constrainers, constrainee, name=name + "_pos_cns", maintainOffset=maintainOffset)
+
+    elif constraintType == "Scale":
+        return pm.scaleConstraint(constrainers, constrainee, name=name + "_scl_cns", maintainOffset=maintainOffset)
+
+    raise ValueError("createConstraint: Invalid value for 'constraintType' argument. Must be one of Orientation, Pose, Position or Scale.")
+
+
+def hideShape(dccSceneItem):
+    """Hides the shape of a node, if it has one.
+
+    Arguments:
+    dccSceneItem -- Node, node to hide the shape of.
+
+    Return:
+    True if successful.
+
+    """
+
+    shape = dccSceneItem.getShape()
+    if shape is not None:
+        shape.visibility.set(False)
+
+    return True
+
+
+def setOverrideColor(dccSceneItem, colorIndex):
+    """Enables the display override of a node and sets its color.
+
+    Arguments:
+    dccSceneItem -- Node, node to set the color on.
+    colorIndex -- Integer, Maya color index.
+
+    Return:
+    True if successful.
+
+    """
+
+    dccSceneItem.overrideEnabled.set(True)
+    dccSceneItem.overrideColor.set(colorIndex)
+
+    return True
+
@@ -0,0 +1,30 @@
+from kraken.core.builders.recording_builder import RecordingBuilder
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.base_component import BaseComponent
+
+
+def builtNames(builder):
+    return [x[3] for x in builder.getRecords() if x[0] == 'createNode']
+
+
+if __name__ == "__main__":
+    rig = Container('rig')
+    layer = Layer('controls', parent=rig)
+    component = BaseComponent('arm', parent=layer, location='L')
+    Locator('elbow', parent=component)
+
+    builder = RecordingBuilder()
+    builder.build(rig)
+    print "first build:" + str(builtNames(builder))
+
+    # Editing the template in place between builds
+    builder.config.nameTemplate['separator'] = '-'
+    builder.build(rig)
+    print "separator edited in place:" + str(builtNames(builder))
+
+    # Location change
+    component.setSide('R')
+    builder.build(rig)
+    print "location changed:" + str(builtNames(builder))
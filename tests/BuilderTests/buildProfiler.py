@@ -0,0 +1,25 @@
+import collections
+
+from kraken.core.builders.recording_builder import RecordingBuilder
+from kraken.tests.RigTests.bob_rig import Rig
+
+
+if __name__ == "__main__":
+    bobRig = Rig("char_bob")
+
+    builder = RecordingBuilder()
+    builder.config.setProfiling(True)
+    builder.build(bobRig)
+
+    profiler = builder.getProfiler()
+    report = profiler.getReport()
+
+    phases = collections.Counter()
+    for event in profiler.events:
+        if 'args' in event:
+            phases[event['args']['phase']] += 1
+
+    print "phases:" + str(sorted(report['phases'].keys()))
+    print "objects by phase:" + str(sorted(phases.items()))
+    print "io connections:" + str(report['kTypes'].get('ComponentInput', {}).get('calls', 0) + report['kTypes'].get('ComponentOutput', {}).get('calls', 0))
+    print "components:" + str(sorted(report['components'].keys()))
@@ -0,0 +1,82 @@
+import collections
+import os
+import tempfile
+
+from kraken.core.builders.recording_builder import RecordingBuilder
+from kraken.core.builders.recording_builder import RecordPlayer
+from kraken.core.builders.recording_builder import loadRecords
+from kraken.core.builders.recording_builder import replayRecords
+from kraken.tests.RigTests.bob_rig import Rig
+
+
+class CountingPlayer(RecordPlayer):
+    """Player counting the commands it is given."""
+
+    def __init__(self):
+        super(CountingPlayer, self).__init__()
+        self.counts = collections.Counter()
+
+    def __getattribute__(self, name):
+        if name in RecordPlayer.__dict__ and not name.startswith('_'):
+            counts = object.__getattribute__(self, 'counts')
+
+            def command(*args):
+                counts[name] += 1
+
+            return command
+
+        return object.__getattribute__(self, name)
+
+
+if __name__ == "__main__":
+    bobRig = Rig("char_bob")
+
+    builder = RecordingBuilder()
+    builder.build(bobRig)
+
+    handle, logPath = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    try:
+        builder.save(logPath)
+        records = loadRecords(logPath)
+    finally:
+        os.remove(logPath)
+
+    print "reloaded matches:" + str(records == builder.getRecords())
+
+    # A second build with the same builder starts a new log
+    builder.build(bobRig)
+    print "rebuild matches:" + str(records == builder.getRecords())
+
+    player = CountingPlayer()
+    replayRecords(records, player)
+
+    recorded = collections.Counter(x[0] for x in records)
+    print "records:" + str(len(records))
+    print "counts match:" + str(player.counts == recorded)
+
+    try:
+        replayRecords(records, RecordPlayer())
+        print "base player raises:False"
+    except NotImplementedError:
+        print "base player raises:True"
+
+    # Replay into the Maya player against the stand-in Maya modules and check
+    # it issues the same Maya calls, with the same arguments, as the Maya
+    # builder. The builder sets transforms in a batch so only the order differs.
+    from kraken.tests.RigTests import bob_build_stub
+    from kraken.plugins.maya_plugin.builder import Builder
+    from kraken.plugins.maya_plugin.player import Player
+
+    Builder().build(Rig("char_bob"))
+    builderCommands = collections.Counter(bob_build_stub.commands)
+
+    del bob_build_stub.commands[:]
+    replayRecords(records, Player())
+    playerCommands = collections.Counter(bob_build_stub.commands)
+
+    print "maya commands:" + str(sum(builderCommands.values()))
+    print "maya commands match:" + str(builderCommands == playerCommands)
+    for command in sorted(set(builderCommands) | set(playerCommands)):
+        if builderCommands[command] != playerCommands[command]:
+            print "  " + str(command) + ": " + str(builderCommands[command]) + " " + str(playerCommands[command])
@@ -0,0 +1,23 @@
+from kraken.core.builders.recording_builder import RecordingBuilder
+from kraken.core.objects.locator import Locator
+from kraken.tests.RigTests.bob_rig import Rig
+
+
+if __name__ == "__main__":
+    bobRig = Rig("char_bob")
+
+    builder = RecordingBuilder()
+    builder.build(bobRig)
+
+    nodeIds = [x[1] for x in builder.getRecords() if x[0] == 'createNode']
+    found = [builder._getKrakenSceneItem(x) for x in nodeIds]
+    print "nodes:" + str(len(nodeIds))
+    print "ids above 256:" + str(len([x for x in nodeIds if x > 256]))
+    print "nodes found:" + str(len([x for x in found if x is not None]))
+    print "round trip:" + str(all(builder._getDCCSceneItem(k) == x for k, x in zip(found, nodeIds)))
+
+    # DCCs return a new wrapper each time a node is queried
+    locator = Locator('elbow')
+    builder._registerSceneItemPair(locator, 'elbow_loc')
+    print "equal item found:" + str(builder._getKrakenSceneItem(''.join(['elbow', '_loc'])) is locator)
+    print "unknown item:" + str(builder._getKrakenSceneItem('missing'))
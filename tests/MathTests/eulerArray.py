@@ -0,0 +1,27 @@
+import math
+
+import numpy as np
+
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.rotation_array import eulerArrayToQuatArray
+from kraken.core.maths.rotation_array import quatArrayToEulerArray
+
+if __name__ == "__main__":
+    angles = np.array([[0.3, -0.5, 1.1],
+                       [0.3, math.pi * 0.5, 1.1],
+                       [-2.0, -math.pi * 0.5, 0.7]])
+
+    for rotationOrder, name in Euler.roMap.iteritems():
+        quats = eulerArrayToQuatArray(angles, rotationOrder)
+        eulers = quatArrayToEulerArray(quats, rotationOrder)
+        roundTrip = eulerArrayToQuatArray(eulers, rotationOrder)
+
+        quat = Quat()
+        quat.setFromEuler(Euler(math.degrees(angles[0][0]),
+                                math.degrees(angles[0][1]),
+                                math.degrees(angles[0][2]),
+                                rotationOrder))
+
+        print name + " setFromEuler:" + str(quat) + " batched:" + str(quats[0])
+        print name + " toEuler:" + str(quat.toEuler(rotationOrder)) + " batched:" + str(eulers[0])
+        print name + " round trip error:" + str(np.abs(np.abs(np.einsum('ij,ij->i', quats, roundTrip)) - 1.0).max())
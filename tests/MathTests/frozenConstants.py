@@ -0,0 +1,22 @@
+import copy
+
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.constants import X_AXIS, IDENTITY_XFO, internValue
+from kraken.core.objects.controls.cube_control import CubeControl
+
+if __name__ == "__main__":
+    print "interned:" + str(internValue(Vec3(1.0, 0.0, 0.0)) is X_AXIS)
+    print "deepcopy shares:" + str(copy.deepcopy(IDENTITY_XFO) is IDENTITY_XFO)
+    print "clone:" + str(X_AXIS.clone())
+
+    try:
+        X_AXIS.x = 2.0
+    except AttributeError as e:
+        print "immutable:" + str(e)
+
+    cube1 = CubeControl("cube1")
+    cube2 = CubeControl("cube2")
+    print "shared points:" + str(cube1.getControlPoints()[0] is cube2.getControlPoints()[0])
+
+    cube1.scalePoints(Vec3(2.0, 2.0, 2.0))
+    print "scaled:" + str(cube1.getControlPoints()[0][0]) + " untouched:" + str(cube2.getControlPoints()[0][0])
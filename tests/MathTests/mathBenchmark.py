@@ -0,0 +1,26 @@
+import timeit
+
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.xfo import Xfo
+
+
+def runBenchmark(label, stmt, number=100000):
+    seconds = min(timeit.repeat(stmt, setup='from __main__ import q1, q2, xfo, vec', repeat=3, number=number))
+    print label + ": %.3f usec per call" % (seconds / number * 1000000.0)
+
+
+if __name__ == "__main__":
+    q1 = Quat()
+    q1.setFromEuler(Euler(30, 45, 60))
+    q2 = Quat()
+    q2.setFromEuler(Euler(-10, 20, 90))
+    xfo = Xfo(scl=Vec3(2.0, 2.0, 2.0), rot=q1, tr=Vec3(32, 35, 234))
+    vec = Vec3(1.0, 2.0, 3.0)
+
+    runBenchmark("Quat.multiply", "q1.multiply(q2)")
+    runBenchmark("Quat.rotateVector", "q1.rotateVector(vec)")
+    runBenchmark("Xfo.transformVector", "xfo.transformVector(vec)")
+    runBenchmark("Xfo.multiply", "xfo.multiply(xfo)")
+    runBenchmark("Vec3.add", "vec.add(vec)")
+    runBenchmark("Vec3.cross", "vec.cross(vec)")
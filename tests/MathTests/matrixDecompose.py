@@ -0,0 +1,23 @@
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.matrix_array import Matrix44Array
+
+if __name__ == "__main__":
+    rot = Quat()
+    rot.setFromEuler(Euler(30, 45, 60))
+    xfo = Xfo(scl=Vec3(2.0, 3.0, 4.0), rot=rot, tr=Vec3(32, 35, 234))
+
+    mat44 = xfo.toMatrix44()
+    print "Matrix44:" + str(mat44)
+    print "inverse * matrix:" + str(mat44.inverse().multiply(mat44))
+
+    xfo2 = Xfo()
+    xfo2.setFromMatrix44(mat44)
+    print "decompose:" + str(xfo2)
+
+    mat44.row1.x += 0.5
+    print "hasShear:" + str(mat44.hasShear())
+
+    matrices = Matrix44Array.fromMatrices([xfo.toMatrix44(), mat44])
+    print "batched inverse * matrix:" + str(matrices.inverse().multiply(matrices).getMatrix(1))
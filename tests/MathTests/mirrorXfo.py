@@ -0,0 +1,19 @@
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.xfo import Xfo, mirrorXfo
+from kraken.core.objects.controls.cube_control import CubeControl
+
+if __name__ == "__main__":
+    rot = Quat()
+    rot.setFromEuler(Euler(10, 20, 30))
+    xfo = Xfo(rot=rot, tr=Vec3(2.0, 3.0, 4.0))
+
+    mirrored = mirrorXfo(xfo, 'X')
+    print "mirrored:" + str(mirrored)
+    print "x axis:" + str(xfo.rot.rotateVector(Vec3(1.0, 0.0, 0.0))) + " mirrored:" + str(mirrored.rot.rotateVector(Vec3(1.0, 0.0, 0.0)))
+    print "round trip:" + str(mirrorXfo(mirrored, 'X').tr.almostEqual(xfo.tr, 1e-6) and mirrorXfo(mirrored, 'X').rot.almostEqual(xfo.rot, 1e-6))
+
+    control = CubeControl("cube")
+    control.xfo = xfo
+    controlClone = control.clone(remapXfo=mirrorXfo)
+    print "clone tr:" + str(controlClone.xfo.tr) + " shared points:" + str(controlClone.getControlPoints()[0] is control.getControlPoints()[0])
@@ -0,0 +1,30 @@
+import numpy as np
+
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.rotation import squad, squadControlPoint, averageQuats
+from kraken.core.maths.rotation_array import quatArraySlerp
+from kraken.core.maths.rotation_array import quatArrayWeightedAverage
+
+
+def toArray(quat):
+    return [quat.v.x, quat.v.y, quat.v.z, quat.w]
+
+
+if __name__ == "__main__":
+    keys = []
+    for angles in [(0, 0, 0), (30, 45, 60), (90, 10, -20), (-45, 80, 0)]:
+        quat = Quat()
+        quat.setFromEuler(Euler(*angles))
+        keys.append(quat)
+
+    print "slerp:" + str(keys[1].slerp(keys[2], 0.25))
+    print "nlerp:" + str(keys[1].nlerp(keys[2], 0.25))
+    print "batched slerp:" + str(quatArraySlerp([toArray(keys[1])], [toArray(keys[2])], 0.25)[0])
+
+    control1 = squadControlPoint(keys[0], keys[1], keys[2])
+    control2 = squadControlPoint(keys[1], keys[2], keys[3])
+    print "squad:" + str(squad(keys[1], keys[2], control1, control2, 0.25))
+
+    weights = [0.1, 0.2, 0.3, 0.4]
+    print "average:" + str(averageQuats(keys, weights))
+    print "batched average:" + str(quatArrayWeightedAverage(np.array([toArray(x) for x in keys]), weights))
@@ -0,0 +1,28 @@
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import XfoArray
+
+if __name__ == "__main__":
+    rot = Quat()
+    rot.setFromEuler(Euler(30, 45, 60))
+    xfo = Xfo(scl=Vec3(2.0, 2.0, 2.0), rot=rot, tr=Vec3(32, 35, 234))
+
+    xfoArray = XfoArray.fromXfos([xfo, Xfo(), xfo])
+    print "XfoArray:" + str(xfoArray)
+
+    vec = Vec3(1, 2, 3)
+    print "transformVector:" + str(xfo.transformVector(vec))
+    print "transformVectors:" + str(xfoArray.transformVectors(vec.toArray())[0])
+
+    identity = xfoArray.multiply(xfoArray.inverse())
+    print "multiply inverse tr:" + str(identity.tr[0])
+
+    matrices = xfoArray.toMatrix44Array()
+    xfoArray2 = XfoArray(len(xfoArray))
+    xfoArray2.setFromMatrix44Array(matrices)
+    print "Matrix44 round trip:" + str(xfoArray2[0])
+
+    view = xfoArray[1]
+    view.tr.copy(vec)
+    print "view write:" + str(xfoArray.tr[1])
@@ -0,0 +1,30 @@
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.rotation import Euler, Quat
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import XfoArray
+from kraken.core.objects.controls.cube_control import CubeControl
+
+if __name__ == "__main__":
+    xfos = []
+    for i in xrange(4):
+        rot = Quat()
+        rot.setFromEuler(Euler(10 * i, 20 * i, 170 + i))
+        xfos.append(Xfo(scl=Vec3(1.0, 2.0, 3.0), rot=rot, tr=Vec3(i, 2.0 * i, 0.5)))
+
+    xfoArray = XfoArray.fromXfos(xfos)
+    otherArray = xfoArray.clone()
+    otherArray.rot[1] *= -1.0
+    otherArray.tr[2, 0] += 1e-9
+    print "allClose:" + str(xfoArray.allClose(otherArray))
+
+    otherArray.tr[3, 1] += 0.1
+    print "diff:" + str(xfoArray.diff(otherArray))
+
+    print "hash:" + xfoArray.quantizedHash()
+    print "hash flipped:" + XfoArray.fromArrays(otherArray.scl[0:3], otherArray.rot[0:3], xfoArray.tr[0:3]).quantizedHash() + " " + XfoArray.fromXfos(xfos[0:3]).quantizedHash()
+    print "single hash:" + xfos[1].quantizedHash() + " " + XfoArray.fromXfos([xfos[1]]).quantizedHash()
+
+    control = CubeControl("cube")
+    hash1 = control.getControlPointsHash()
+    control.scalePoints(Vec3(2.0, 2.0, 2.0))
+    print "shape changed:" + str(hash1 != control.getControlPointsHash())
@@ -0,0 +1,46 @@
+from kraken.core.maths.vec import Vec3
+from kraken.core.objects.change_tracker import getChangeTracker
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.base_component import BaseComponent
+
+
+def changedNames(changes):
+    return sorted([x.getName() + ':' + ','.join(sorted(props)) for x, props in changes.iteritems()])
+
+
+if __name__ == "__main__":
+    tracker = getChangeTracker()
+    print "enabled by default:" + str(tracker.enabled)
+
+    rig = Container('rig')
+    layer = Layer('controls', parent=rig)
+    component = BaseComponent('arm', parent=layer, location='L')
+    elbow = Locator('elbow', parent=component)
+    wrist = Locator('wrist', parent=elbow)
+    print "untracked changes:" + str(len(tracker.getChangesSince(0)))
+
+    tracker.setEnabled(True)
+    revision = tracker.getRevision(rig)
+
+    # Name
+    elbow.setName('forearm')
+    print "name:" + str(changedNames(tracker.getChangesSince(revision, rig)))
+
+    # Location
+    revision = tracker.getRevision(rig)
+    component.setSide('R')
+    print "location:" + str(changedNames(tracker.getChangesSince(revision, rig)))
+
+    # Transform edited in place
+    revision = tracker.getRevision(rig)
+    wrist.xfo.tr.x += 5.0
+    print "in place xfo:" + str(changedNames(tracker.getChangesSince(revision, rig)))
+
+    revision = tracker.getRevision(rig)
+    print "no changes:" + str(changedNames(tracker.getChangesSince(revision, rig)))
+
+    tracker.setEnabled(False)
+    elbow.setName('elbow')
+    print "after disabling:" + str(len(tracker.getChangesSince(0)))
@@ -0,0 +1,66 @@
+import numpy as np
+
+from kraken.core.maths.vec import Vec3
+from kraken.core.maths.rotation import Quat
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import XfoArray
+from kraken.core.objects.compact_scene_graph import CompactSceneGraph
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.locator import Locator
+
+
+def xfosMatch(xfoArray, items):
+    for i, item in enumerate(items):
+        rot = [item.xfo.rot.v.x, item.xfo.rot.v.y, item.xfo.rot.v.z, item.xfo.rot.w]
+        if not np.allclose(xfoArray.tr[i], item.xfo.tr.toArray()):
+            return False
+
+        if not np.allclose(abs(np.dot(xfoArray.rot[i], rot)), 1.0):
+            return False
+
+    return True
+
+
+if __name__ == "__main__":
+    rig = Container('rig')
+    layer = Layer('deformers', parent=rig)
+    parent = layer
+    for i in xrange(4):
+        joint = Joint('joint' + str(i), parent=parent)
+        rot = Quat()
+        rot.setFromAxisAndAngle(Vec3(0.0, 0.0, 1.0), 0.3 * (i + 1))
+        joint.xfo = Xfo(rot=rot, tr=Vec3(float(i), 1.0, 0.0))
+        parent = joint
+    Locator('tip', parent=layer).xfo = Xfo(tr=Vec3(0.0, 5.0, 0.0))
+
+    # World transforms match SceneItem.xfo
+    graph = CompactSceneGraph.fromSceneItem(rig)
+    items = list(rig.walk())
+    print "items:" + str(len(graph)) + " world xfos match:" + str(xfosMatch(graph.computeWorldXfos(), items))
+
+    # Round trip through SceneItems
+    restored = graph.toSceneItems(0)
+    restoredItems = list(restored.walk())
+    print "round trip names:" + str([x.getFullName() for x in restoredItems] == [x.getFullName() for x in items])
+    print "round trip kTypes:" + str([x.getKType() for x in restoredItems] == [x.getKType() for x in items])
+    print "round trip xfos:" + str(xfosMatch(CompactSceneGraph.fromSceneItem(restored).computeWorldXfos(), items))
+
+    # Children after batched adds
+    crowd = CompactSceneGraph()
+    roots = crowd.addItems(['root0', 'root1'])
+    localXfos = XfoArray(4)
+    localXfos.tr[:, 0] = 1.0
+    children = crowd.addItems(['a', 'b', 'c', 'd'], kType='Joint', parents=[0, 1, 0, 2], localXfos=localXfos)
+    crowd.addItem('e', parent=1)
+    print "roots:" + str(list(crowd.getChildIndices(-1))) + " children of root0:" + str(list(crowd.getChildIndices(0))) + " children of root1:" + str(list(crowd.getChildIndices(1)))
+    print "path:" + crowd.getFullName(5) + " lookup:" + str(crowd.getIndexByPath('root0.a.d'))
+    print "world tr of d:" + str(crowd.computeWorldXfos().tr[5])
+
+    # In place edits of the world transform are written back
+    item = graph.getItem(graph.getIndexByPath('rig.deformers.joint0.joint1'))
+    child = item.getChildByIndex(0)
+    childLocal = child.getLocalXfo()
+    item.xfo.tr.x += 5.0
+    print "edited tr:" + str(item.xfo.tr) + " child local kept:" + str(child.getLocalXfo().tr.almostEqual(childLocal.tr, 1e-6))
@@ -0,0 +1,49 @@
+import pickle
+
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.ordered_collection import OrderedCollection
+
+
+def names(collection):
+    return [x.getName() for x in collection]
+
+
+if __name__ == "__main__":
+    items = [Locator(x) for x in ['a', 'b', 'c', 'b', 'd', 'e']]
+    collection = OrderedCollection(items)
+    print "names:" + str(names(collection)) + " len:" + str(len(collection))
+
+    # Remove then index
+    collection.remove(items[1])
+    print "after remove:" + str(names(collection)) + " index of d:" + str(collection.index(items[4])) + " [1]:" + collection[1].getName()
+    print "contains removed:" + str(items[1] in collection) + " reversed:" + str([x.getName() for x in reversed(collection)])
+
+    # Duplicate names
+    collection.append(Locator('b'))
+    print "getByName b is items[3]:" + str(collection.getByName('b') is items[3]) + " all b:" + str(len(collection.getAllByName('b')))
+
+    # Rename
+    items[3].name = 'z'
+    collection.rename(items[3])
+    print "after rename, b:" + str(collection.getByName('b').getName()) + " z is items[3]:" + str(collection.getByName('z') is items[3])
+
+    # Insert keeps positions and name order
+    first = Locator('b')
+    collection.insert(0, first)
+    print "after insert:" + str(names(collection)) + " first b is inserted:" + str(collection.getByName('b') is first) + " index of e:" + str(collection.index(items[5]))
+
+    # Slice deletion
+    del collection[1:3]
+    print "after del [1:3]:" + str(names(collection)) + " len:" + str(len(collection))
+    del collection[-1]
+    print "after del [-1]:" + str(names(collection))
+
+    # Many removals compact the list
+    many = OrderedCollection([Locator('item' + str(i)) for i in xrange(40)])
+    for item in list(many)[:30]:
+        many.remove(item)
+    print "after removals:" + str(len(many)) + " first:" + many[0].getName() + " index of last:" + str(many.index(list(many)[-1]))
+
+    # Pickle round trip
+    restored = pickle.loads(pickle.dumps(collection, pickle.HIGHEST_PROTOCOL))
+    print "pickled:" + str(names(restored)) + " getByName z:" + str(restored.getByName('z').getName()) + " index:" + str(restored.index(restored[2]))
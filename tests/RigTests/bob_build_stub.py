@@ -0,0 +1,87 @@
+"""Builds Bob with the Maya builder against stand-in Maya modules and prints
+the commands it issued, so the cost of a build can be checked outside Maya.
+
+Every call is also kept with its arguments in commands, so two ways of
+building the same rig can be compared.
+
+"""
+
+import collections
+import sys
+import types
+
+calls = collections.Counter()
+commands = []
+
+
+def _freeze(value):
+    """Turns lists into tuples so call arguments can be counted."""
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(x) for x in value)
+
+    return value
+
+
+class StubNode(str):
+    """Stand-in for a PyMEL node, any method returns another node."""
+
+    def __getattr__(self, name):
+        return StubCommand("node." + name, owner=self)
+
+    def longName(self):
+        return "|" + self
+
+
+class StubCommand(object):
+    """Stand-in for a Maya command, counts calls and returns a node.
+
+    Methods of a node are recorded with the node they were called on and
+    return a node named after the node and their first argument, like
+    node.attr(name).
+
+    """
+
+    def __init__(self, name, owner=None):
+        self.name = name
+        self.owner = owner
+
+    def __getattr__(self, name):
+        return StubCommand(self.name + "." + name, owner=self.owner)
+
+    def __call__(self, *args, **kwargs):
+        calls[self.name] += 1
+        commands.append((self.name, self.owner, _freeze(args), _freeze(sorted(kwargs.items()))))
+
+        if self.owner is not None and args and isinstance(args[0], basestring):
+            return StubNode(self.owner + "." + args[0])
+
+        return StubNode(kwargs.get('name', 'node'))
+
+
+class StubModule(types.ModuleType):
+    """Stand-in for a Maya module, any attribute is a command."""
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        return StubCommand(self.__name__ + "." + name)
+
+
+for moduleName in ['maya', 'maya.cmds', 'maya.OpenMaya', 'pymel', 'pymel.core',
+                   'pymel.util', 'pymel.core.datatypes', 'FabricEngine', 'FabricEngine.Core']:
+    sys.modules[moduleName] = StubModule(moduleName)
+
+
+if __name__ == "__main__":
+    from kraken.plugins.maya_plugin.builder import Builder
+    from kraken.tests.RigTests.bob_rig import Rig
+
+    bobRig = Rig("char_bob")
+
+    builder = Builder()
+    builder.build(bobRig)
+
+    for command, count in sorted(calls.items()):
+        print command + ": " + str(count)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from kraken.core.objects.container import Container
 from kraken.core.objects.layer import Layer
 
@@ -14,7 +16,7 @@ from head_component import HeadComponent
 class Rig(Container):
     """Test Arm Component"""
 
-    def __init__(self, name):
+    def __init__(self, name, pool=None):
         super(Rig, self).__init__(name)
 
         # Add rig layers
@@ -23,90 +25,55 @@ class Rig(Container):
         geometryLayer = Layer('geometry', parent=self)
 
         # Add Components to Layers
-        spineComponent = SpineComponent("spine", controlsLayer)
-        neckComponent = NeckComponent("neck", controlsLayer)
-        headComponent = HeadComponent("head", controlsLayer)
-        clavicleLeftComponent = ClavicleComponent("clavicle", controlsLayer, location="L")
-        clavicleRightComponent = ClavicleComponent("clavicle", controlsLayer, location="R")
-        armLeftComponent = ArmComponent("arm", controlsLayer, location="L")
-        armRightComponent = ArmComponent("arm", controlsLayer, location="R")
-        handLeftComponent = HandComponent("hand", controlsLayer, location="L")
-        handRightComponent = HandComponent("hand", controlsLayer, location="R")
-        legLeftComponent = LegComponent("leg", controlsLayer, location="L")
-        legRightComponent = LegComponent("leg", controlsLayer, location="R")
-        footLeftComponent = FootComponent("foot", controlsLayer, location="L")
-        footRightComponent = FootComponent("foot", controlsLayer, location="R")
-
-        # Neck to Spine
-        spineEndOutput = spineComponent.getOutputByName('spineEnd')
-        neckSpineEndInput = neckComponent.getInputByName('neckBase')
-        neckSpineEndInput.setSource(spineEndOutput.getTarget())
-
-        # Head to Neck
-        neckEndOutput = neckComponent.getOutputByName('neckEnd')
-        headBaseInput = headComponent.getInputByName('headBase')
-        headBaseInput.setSource(neckEndOutput.getTarget())
-
-        # Clavicle to Spine
-        spineEndOutput = spineComponent.getOutputByName('spineEnd')
-        clavicleLeftSpineEndInput = clavicleLeftComponent.getInputByName('spineEnd')
-        clavicleLeftSpineEndInput.setSource(spineEndOutput.getTarget())
-        clavicleRightSpineEndInput = clavicleRightComponent.getInputByName('spineEnd')
-        clavicleRightSpineEndInput.setSource(spineEndOutput.getTarget())
-
-        # Hand To Arm Connections
-        armLeftEndOutput = armLeftComponent.getOutputByName('armEndXfo')
-        handLeftArmEndInput = handLeftComponent.getInputByName('armEndXfo')
-        handLeftArmEndInput.setSource(armLeftEndOutput.getTarget())
-        armLeftEndPosOutput = armLeftComponent.getOutputByName('armEndPos')
-        handLeftArmEndPosInput = handLeftComponent.getInputByName('armEndPos')
-        handLeftArmEndPosInput.setSource(armLeftEndPosOutput.getTarget())
-
-        armRightEndOutput = armRightComponent.getOutputByName('armEndXfo')
-        handRightArmEndInput = handRightComponent.getInputByName('armEndXfo')
-        handRightArmEndInput.setSource(armRightEndOutput.getTarget())
-        armRightEndPosOutput = armRightComponent.getOutputByName('armEndPos')
-        handRightArmEndPosInput = handRightComponent.getInputByName('armEndPos')
-        handRightArmEndPosInput.setSource(armRightEndPosOutput.getTarget())
-
-        # Arm To Clavicle Connections
-        clavicleLeftEndOutput = clavicleLeftComponent.getOutputByName('clavicleEnd')
-        armLeftClavicleEndInput = armLeftComponent.getInputByName('clavicleEnd')
-        armLeftClavicleEndInput.setSource(clavicleLeftEndOutput.getTarget())
-        clavicleRightEndOutput = clavicleRightComponent.getOutputByName('clavicleEnd')
-        armRightClavicleEndInput = armRightComponent.getInputByName('clavicleEnd')
-        armRightClavicleEndInput.setSource(clavicleRightEndOutput.getTarget())
-
-        # Leg To Pelvis Connections
-        spineBaseOutput = spineComponent.getOutputByName('spineBase')
-        legLeftPelvisInput = legLeftComponent.getInputByName('pelvisInput')
-        legLeftPelvisInput.setSource(spineBaseOutput.getTarget())
-        clavicleRightEndOutput = spineComponent.getOutputByName('spineBase')
-        legRightPelvisInput = legRightComponent.getInputByName('pelvisInput')
-        legRightPelvisInput.setSource(clavicleRightEndOutput.getTarget())
-
-        # Foot To Arm Connections
-        legLeftEndOutput = legLeftComponent.getOutputByName('legEndXfo')
-        footLeftArmEndInput = footLeftComponent.getInputByName('legEndXfo')
-        footLeftArmEndInput.setSource(legLeftEndOutput.getTarget())
-        legLeftEndPosOutput = legLeftComponent.getOutputByName('legEndPos')
-        footLeftArmEndPosInput = footLeftComponent.getInputByName('legEndPos')
-        footLeftArmEndPosInput.setSource(legLeftEndPosOutput.getTarget())
-
-        legRightEndOutput = legRightComponent.getOutputByName('legEndXfo')
-        footRightArmEndInput = footRightComponent.getInputByName('legEndXfo')
-        footRightArmEndInput.setSource(legRightEndOutput.getTarget())
-        legRightEndPosOutput = legRightComponent.getOutputByName('legEndPos')
-        footRightArmEndPosInput = footRightComponent.getInputByName('legEndPos')
-        footRightArmEndPosInput.setSource(legRightEndPosOutput.getTarget())
-
-        # Arm Attributes to Clavicle
-        # clavicleLeftFollowBodyOutput = clavicleLeftComponent.getOutputByName('followBody')
-        # armLeftFollowBodyInput = armLeftComponent.getInputByName('followBody')
-        # armLeftFollowBodyInput.setSource(clavicleLeftFollowBodyOutput.getTarget())
-        # clavicleRightFollowBodyOutput = clavicleRightComponent.getOutputByName('followBody')
-        # armRightFollowBodyInput = armRightComponent.getInputByName('followBody')
-        # armRightFollowBodyInput.setSource(clavicleRightFollowBodyOutput.getTarget())
+        controlsLayer.assembleComponents([
+            partial(SpineComponent, "spine"),
+            partial(NeckComponent, "neck"),
+            partial(HeadComponent, "head"),
+            partial(ClavicleComponent, "clavicle", location="L"),
+            partial(ClavicleComponent, "clavicle", location="R"),
+            partial(ArmComponent, "arm", location="L"),
+            partial(ArmComponent, "arm", location="R"),
+            partial(HandComponent, "hand", location="L"),
+            partial(HandComponent, "hand", location="R"),
+            partial(LegComponent, "leg", location="L"),
+            partial(LegComponent, "leg", location="R"),
+            partial(FootComponent, "foot", location="L"),
+            partial(FootComponent, "foot", location="R")
+        ], connections=[
+            # Neck to Spine
+            ('spine_M', 'spineEnd', 'neck_M', 'neckBase'),
+
+            # Head to Neck
+            ('neck_M', 'neckEnd', 'head_M', 'headBase'),
+
+            # Clavicle to Spine
+            ('spine_M', 'spineEnd', 'clavicle_L', 'spineEnd'),
+            ('spine_M', 'spineEnd', 'clavicle_R', 'spineEnd'),
+
+            # Hand To Arm Connections
+            ('arm_L', 'armEndXfo', 'hand_L', 'armEndXfo'),
+            ('arm_L', 'armEndPos', 'hand_L', 'armEndPos'),
+            ('arm_R', 'armEndXfo', 'hand_R', 'armEndXfo'),
+            ('arm_R', 'armEndPos', 'hand_R', 'armEndPos'),
+
+            # Arm To Clavicle Connections
+            ('clavicle_L', 'clavicleEnd', 'arm_L', 'clavicleEnd'),
+            ('clavicle_R', 'clavicleEnd', 'arm_R', 'clavicleEnd'),
+
+            # Leg To Pelvis Connections
+            ('spine_M', 'spineBase', 'leg_L', 'pelvisInput'),
+            ('spine_M', 'spineBase', 'leg_R', 'pelvisInput'),
+
+            # Foot To Leg Connections
+            ('leg_L', 'legEndXfo', 'foot_L', 'legEndXfo'),
+            ('leg_L', 'legEndPos', 'foot_L', 'legEndPos'),
+            ('leg_R', 'legEndXfo', 'foot_R', 'legEndXfo'),
+            ('leg_R', 'legEndPos', 'foot_R', 'legEndPos'),
+
+            # Arm Attributes to Clavicle
+            # ('clavicle_L', 'followBody', 'arm_L', 'followBody'),
+            # ('clavicle_R', 'followBody', 'arm_R', 'followBody'),
+        ], pool=pool)
 
 
 